@@ -0,0 +1,11 @@
+# flake8: noqa
+
+from .baseline import compare
+from .baseline import load_baseline
+from .baseline import save_baseline
+from .suite import DEFAULT_CASES
+from .suite import DEFAULT_METRICS
+from .suite import format_results
+from .suite import make_cases
+from .suite import run_case
+from .suite import run_suite
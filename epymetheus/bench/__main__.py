@@ -0,0 +1,125 @@
+import argparse
+import sys
+
+from .baseline import compare
+from .baseline import format_comparison
+from .baseline import load_baseline
+from .baseline import save_baseline
+from .suite import DEFAULT_CASES
+from .suite import format_results
+from .suite import make_cases
+from .suite import run_suite
+
+DEFAULT_BASELINE = ".epymetheus-bench.json"
+
+
+def main(argv=None):
+    """
+    Run benchmarks from command line.
+
+    - `run` (default) prints results.
+    - `save` runs benchmarks and saves results as a baseline.
+    - `compare` runs cases of the baseline again and
+      returns 1 if any benchmark regresses,
+      or 2 if the baseline is missing or no benchmarks match it.
+
+    Returns
+    -------
+    exit_code : int
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m epymetheus.bench", description="Run performance benchmarks."
+    )
+    _add_common_arguments(parser)
+    # Options may also follow a subcommand. Their defaults are suppressed
+    # so that they do not overwrite options given before the subcommand.
+    common = argparse.ArgumentParser(add_help=False)
+    _add_common_arguments(common, suppress=True)
+
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.add_parser("run", parents=[common], help="print results")
+    subparsers.add_parser("save", parents=[common], help="save results as baseline")
+    parser_compare = subparsers.add_parser(
+        "compare", parents=[common], help="compare with baseline"
+    )
+    parser_compare.add_argument(
+        "--rtol", type=float, default=0.2, help="relative tolerance of median time"
+    )
+    parser_compare.add_argument(
+        "--min-time", type=float, default=1e-3, help="absolute tolerance in seconds"
+    )
+    parser_compare.add_argument(
+        "--memory-rtol", type=float, default=0.1, help="relative tolerance of memory"
+    )
+    args = parser.parse_args(argv)
+
+    grid = {
+        key: getattr(args, key)
+        for key in ["n_bars", "n_assets", "n_trades", "max_n_orders", "take_stop"]
+        if getattr(args, key) is not None
+    }
+    cases = make_cases(**grid) if grid else None
+    metrics = args.metrics
+
+    if args.command == "compare":
+        try:
+            baseline = load_baseline(args.baseline)
+        except FileNotFoundError:
+            print(f"Baseline {args.baseline} not found.", file=sys.stderr)
+            return 2
+        cases = cases or baseline["cases"]
+        metrics = metrics or baseline["metrics"]
+
+    results = run_suite(cases, metrics=metrics, repeat=args.repeat, verbose=True)
+
+    if args.command == "save":
+        save_baseline(args.baseline, results, cases or DEFAULT_CASES, metrics)
+        print(f"Saved baseline to {args.baseline}.")
+    elif args.command == "compare":
+        comparison = compare(
+            results,
+            baseline["results"],
+            rtol=args.rtol,
+            min_time=args.min_time,
+            memory_rtol=args.memory_rtol,
+        )
+        print(format_comparison(comparison))
+        if all(row["missing"] for row in comparison):
+            print("No benchmarks matched the baseline.", file=sys.stderr)
+            return 2
+        if any(row["missing"] for row in comparison):
+            print("Some benchmarks are missing from results.", file=sys.stderr)
+        if any(row["regression"] for row in comparison):
+            print("Performance regressed.", file=sys.stderr)
+            return 1
+    else:
+        print(format_results(results))
+
+    return 0
+
+
+def _add_common_arguments(parser, suppress=False):
+    """
+    Add options shared by subcommands.
+    If `suppress`, options which are not given are not set.
+    """
+
+    def default(value):
+        return argparse.SUPPRESS if suppress else value
+
+    parser.add_argument(
+        "--repeat", type=int, default=default(5), help="number of timings"
+    )
+    for option in ["--n-bars", "--n-assets", "--n-trades", "--max-n-orders"]:
+        parser.add_argument(option, type=int, nargs="+", default=default(None))
+    parser.add_argument("--take-stop", type=float, nargs="+", default=default(None))
+    parser.add_argument(
+        "--metrics", nargs="+", default=default(None), help="names of metrics"
+    )
+    parser.add_argument(
+        "--baseline", default=default(DEFAULT_BASELINE), help="JSON file"
+    )
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,129 @@
+import json
+
+
+def save_baseline(path, results, cases, metrics=None):
+    """
+    Save results of benchmarks as a baseline.
+
+    Parameters
+    ----------
+    - path : str or path
+        Path of JSON file.
+    - results : list of dict
+        Results of `run_suite`.
+    - cases : list of dict
+        Cases of the results, which are run again to compare.
+    - metrics : list of str, optional
+        Names of metrics of the results.
+    """
+    with open(path, "w") as f:
+        json.dump({"cases": cases, "metrics": metrics, "results": results}, f, indent=2)
+
+
+def load_baseline(path):
+    """
+    Load a baseline saved by `save_baseline`.
+
+    Returns
+    -------
+    baseline : dict
+        Dict with keys "cases", "metrics" and "results".
+    """
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(results, baseline_results, rtol=0.2, min_time=1e-3, memory_rtol=0.1):
+    """
+    Compare results of benchmarks with a baseline.
+
+    Timings are compared by medians of repeats.
+    A benchmark regresses if its median time exceeds the baseline
+    by more than `rtol` and `min_time`, which ignores noise of fast
+    benchmarks, or its peak memory exceeds the baseline by more than
+    `memory_rtol`.
+
+    Parameters
+    ----------
+    - results : list of dict
+    - baseline_results : list of dict
+    - rtol : float, default 0.2
+        Relative tolerance of median time.
+    - min_time : float, default 1e-3
+        Absolute tolerance of median time in seconds.
+    - memory_rtol : float, default 0.1
+        Relative tolerance of peak memory.
+
+    Returns
+    -------
+    comparison : list of dict
+        Comparison of benchmarks in the baseline with keys "case", "benchmark",
+        "time_ratio", "memory_ratio", "regression" and "missing".
+        Benchmarks missing from `results` have "missing" True
+        and nan ratios.
+
+    Examples
+    --------
+    >>> baseline = [{"case": "c", "benchmark": "b", "median": 1.0, "peak_memory": 100}]
+    >>> results = [{"case": "c", "benchmark": "b", "median": 3.0, "peak_memory": 100}]
+    >>> compare(results, baseline)[0]["regression"]
+    True
+    >>> compare([], baseline)[0]["missing"]
+    True
+    """
+    results = {(r["case"], r["benchmark"]): r for r in results}
+
+    comparison = []
+    for base in baseline_results:
+        key = (base["case"], base["benchmark"])
+        if key not in results:
+            comparison.append(
+                {
+                    "case": base["case"],
+                    "benchmark": base["benchmark"],
+                    "time_ratio": float("nan"),
+                    "memory_ratio": float("nan"),
+                    "regression": False,
+                    "missing": True,
+                }
+            )
+            continue
+        result = results[key]
+
+        slower = result["median"] > base["median"] * (1 + rtol) + min_time
+        larger = result["peak_memory"] > base["peak_memory"] * (1 + memory_rtol)
+        comparison.append(
+            {
+                "case": result["case"],
+                "benchmark": result["benchmark"],
+                "time_ratio": result["median"] / max(base["median"], 1e-12),
+                "memory_ratio": result["peak_memory"] / max(base["peak_memory"], 1),
+                "regression": slower or larger,
+                "missing": False,
+            }
+        )
+    return comparison
+
+
+def format_comparison(comparison):
+    """
+    Return comparison as a table.
+
+    Returns
+    -------
+    table : str
+    """
+    lines = [f"{'benchmark':<36}{'time':>10}{'memory':>10}"]
+    for case in dict.fromkeys(row["case"] for row in comparison):
+        lines.append(case)
+        for row in comparison:
+            if row["case"] == case:
+                mark = "  REGRESSION" if row["regression"] else ""
+                mark = "  MISSING" if row["missing"] else mark
+                lines.append(
+                    f"  {row['benchmark']:<34}"
+                    f"{row['time_ratio']:>9.2f}x"
+                    f"{row['memory_ratio']:>9.2f}x"
+                    f"{mark}"
+                )
+    return "\n".join(lines)
@@ -0,0 +1,275 @@
+import itertools
+import tracemalloc
+from time import perf_counter
+
+import numpy as np
+
+from epymetheus import Strategy
+from epymetheus.benchmarks import RandomTrader
+from epymetheus.datasets import make_randomwalk
+from epymetheus.history import History
+from epymetheus.metrics import _metric_from_name
+from epymetheus.wealth import Wealth
+
+DEFAULT_CASES = [
+    {
+        "n_bars": 1000,
+        "n_assets": 10,
+        "n_trades": 100,
+        "max_n_orders": 5,
+        "take_stop": 0.0,
+    },
+    {
+        "n_bars": 1000,
+        "n_assets": 10,
+        "n_trades": 100,
+        "max_n_orders": 5,
+        "take_stop": 0.5,
+    },
+    {
+        "n_bars": 10000,
+        "n_assets": 100,
+        "n_trades": 1000,
+        "max_n_orders": 5,
+        "take_stop": 0.0,
+    },
+]
+
+DEFAULT_METRICS = [
+    "return",
+    "average_return",
+    "final_wealth",
+    "drawdown",
+    "max_drawdown",
+    "max_underwater",
+    "volatility",
+    "sharpe_ratio",
+    "tradewise_sharpe_ratio",
+    "exposure",
+]
+
+
+def make_cases(
+    n_bars=(1000,), n_assets=(10,), n_trades=(100,), max_n_orders=(5,), take_stop=(0.0,)
+):
+    """
+    Return grid of benchmark cases.
+
+    Parameters
+    ----------
+    - n_bars : sequence of int
+    - n_assets : sequence of int
+    - n_trades : sequence of int
+    - max_n_orders : sequence of int
+        Maximum number of orders in a trade.
+    - take_stop : sequence of float
+        Fraction of trades with profit-take and stop-loss.
+
+    Returns
+    -------
+    cases : list of dict
+
+    Examples
+    --------
+    >>> cases = make_cases(n_bars=[100, 1000], take_stop=[0.0, 0.5])
+    >>> len(cases)
+    4
+    >>> cases[1]["n_bars"], cases[1]["take_stop"]
+    (100, 0.5)
+    """
+    keys = ["n_bars", "n_assets", "n_trades", "max_n_orders", "take_stop"]
+    grid = itertools.product(n_bars, n_assets, n_trades, max_n_orders, take_stop)
+    return [dict(zip(keys, values)) for values in grid]
+
+
+def case_id(case):
+    """
+    Return string to identify a case.
+
+    Examples
+    --------
+    >>> case_id(make_cases()[0])
+    'n_bars=1000,n_assets=10,n_trades=100,max_n_orders=5,take_stop=0.0'
+    """
+    return ",".join(f"{key}={value}" for key, value in case.items())
+
+
+class BenchTrader(Strategy):
+    """
+    Yield trades of `RandomTrader` with profit-take and stop-loss
+    set for a fraction of them.
+
+    Parameters
+    ----------
+    - n_trades : int
+    - max_n_orders : int
+    - take_stop : float
+        Fraction of trades with profit-take and stop-loss.
+    - seed : int, default 42
+    """
+
+    def __init__(self, n_trades, max_n_orders, take_stop, seed=42):
+        self.__n_trades = n_trades
+        self.max_n_orders = max_n_orders
+        self.take_stop = take_stop
+        self.seed = seed
+
+    def logic(self, universe):
+        trader = RandomTrader(
+            n_trades=self.__n_trades, max_n_orders=self.max_n_orders, seed=self.seed
+        )
+        rng = np.random.default_rng(self.seed)
+        has_take_stop = rng.random(self.__n_trades) < self.take_stop
+        for trade, take_stop in zip(trader.logic(universe), has_take_stop):
+            if take_stop:
+                trade.take = 5.0
+                trade.stop = -5.0
+            yield trade
+
+
+def make_strategy(case, seed=42):
+    """
+    Return strategy and universe of a case.
+
+    Returns
+    -------
+    strategy : BenchTrader
+    universe : Universe
+    """
+    universe = make_randomwalk(
+        n_bars=case["n_bars"], n_assets=case["n_assets"], seed=seed
+    )
+    strategy = BenchTrader(
+        n_trades=case["n_trades"],
+        max_n_orders=case["max_n_orders"],
+        take_stop=case["take_stop"],
+        seed=seed,
+    )
+    return strategy, universe
+
+
+def measure(func, repeat=5):
+    """
+    Measure running time and peak memory of a function.
+
+    The function is timed `repeat` times and then run once more
+    while memory allocations are traced, so that tracing does not
+    affect timings.
+
+    Returns
+    -------
+    times : list of float
+        Running times in seconds.
+    peak_memory : int
+        Peak size of memory blocks allocated in bytes.
+    """
+    times = []
+    for _ in range(repeat):
+        begin = perf_counter()
+        func()
+        times.append(perf_counter() - begin)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return times, peak_memory
+
+
+def run_case(case, metrics=None, repeat=5):
+    """
+    Run benchmarks of a case.
+
+    `Strategy.run`, `History`, `Wealth` and each metric are measured.
+
+    Parameters
+    ----------
+    - case : dict
+    - metrics : list of str, optional
+        Names of metrics. If None, `DEFAULT_METRICS`.
+    - repeat : int, default 5
+
+    Returns
+    -------
+    results : list of dict
+        Results with keys "case", "benchmark", "times", "median"
+        and "peak_memory".
+    """
+    metrics = DEFAULT_METRICS if metrics is None else metrics
+    strategy, universe = make_strategy(case)
+
+    benchmarks = {
+        "run": lambda: strategy.run(universe, verbose=False),
+        "history": lambda: History(strategy),
+        "wealth": lambda: Wealth(strategy),
+    }
+    for name in metrics:
+        metric = _metric_from_name(name)
+        benchmarks[f"metrics.{name}"] = (lambda m: lambda: m.result(strategy))(metric)
+
+    strategy.run(universe, verbose=False)
+
+    results = []
+    for name, func in benchmarks.items():
+        times, peak_memory = measure(func, repeat=repeat)
+        results.append(
+            {
+                "case": case_id(case),
+                "benchmark": name,
+                "times": times,
+                "median": float(np.median(times)),
+                "peak_memory": peak_memory,
+            }
+        )
+    return results
+
+
+def run_suite(cases=None, metrics=None, repeat=5, verbose=False):
+    """
+    Run benchmarks of cases.
+
+    Parameters
+    ----------
+    - cases : list of dict, optional
+        If None, `DEFAULT_CASES`.
+    - metrics : list of str, optional
+        Names of metrics. If None, `DEFAULT_METRICS`.
+    - repeat : int, default 5
+        Number of timings of each benchmark.
+    - verbose : bool, default False
+
+    Returns
+    -------
+    results : list of dict
+    """
+    cases = DEFAULT_CASES if cases is None else cases
+    results = []
+    for case in cases:
+        if verbose:
+            print(f"Running {case_id(case)} ... ")
+        results += run_case(case, metrics=metrics, repeat=repeat)
+    return results
+
+
+def format_results(results):
+    """
+    Return results as a table.
+
+    Returns
+    -------
+    table : str
+    """
+    lines = [f"{'benchmark':<36}{'median [ms]':>14}{'peak [MiB]':>14}"]
+    for case in dict.fromkeys(result["case"] for result in results):
+        lines.append(case)
+        for result in results:
+            if result["case"] == case:
+                lines.append(
+                    f"  {result['benchmark']:<34}"
+                    f"{1e3 * result['median']:>14.3f}"
+                    f"{result['peak_memory'] / 2 ** 20:>14.3f}"
+                )
+    return "\n".join(lines)
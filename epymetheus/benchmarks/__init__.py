@@ -3,3 +3,4 @@
 from .benchmarks import BuyAndHold
 from .benchmarks import DeterminedTrader
 from .benchmarks import RandomTrader
+from .null import null_distribution
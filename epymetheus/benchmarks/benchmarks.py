@@ -1,11 +1,8 @@
-import random
-
 import numpy as np
 
 from epymetheus import Strategy
 from epymetheus import Trade
-
-# TODO: BuyAndHold rebalance
+from epymetheus.wealth.wealth import _get_bucket_begin
 
 
 class DeterminedTrader(Strategy):
@@ -41,7 +38,8 @@ class RandomTrader(Strategy):
     - min_lot : -100
         Minimum value of lots.
     - seed : int, default None
-        Seed of randomness. If None, seed is not set.
+        Seed of `numpy.random.Generator`.
+        If None, fresh entropy is used.
     """
 
     def __init__(
@@ -59,20 +57,62 @@ class RandomTrader(Strategy):
         self.seed = seed
 
     def logic(self, universe):
-        if self.seed is not None:
-            np.random.seed(self.seed)
-            random.seed(self.seed)
-
-        for _ in range(self.__n_trades):
-            n_orders = np.random.randint(1, self.max_n_orders + 1, size=1)[0]
-
-            asset = random.sample(list(universe.assets), n_orders)
-            lot = (self.max_lot - self.min_lot) * np.random.rand(
-                n_orders
-            ) - self.min_lot
-            open_bar, shut_bar = sorted(random.sample(list(universe.bars), 2))
-
-            yield Trade(asset=asset, lot=lot, open_bar=open_bar, shut_bar=shut_bar)
+        rng = np.random.default_rng(self.seed)
+        n_trades = self.__n_trades
+        max_n_orders = min(self.max_n_orders, universe.n_assets)
+
+        # Draw all trades at once and slice them into trades.
+        n_orders = rng.integers(1, max_n_orders + 1, size=n_trades)
+        asset_index = _sample_distinct(
+            rng, universe.n_assets, max_n_orders, size=n_trades
+        )
+        lot = (self.max_lot - self.min_lot) * rng.random(n_orders.sum()) + self.min_lot
+        open_index, shut_index = _sample_distinct(rng, universe.n_bars, 2, n_trades).T
+        open_bars = universe.bars[np.minimum(open_index, shut_index)]
+        shut_bars = universe.bars[np.maximum(open_index, shut_index)]
+
+        begin = np.cumsum(n_orders) - n_orders
+        for i in range(n_trades):
+            n = n_orders[i]
+            yield Trade(
+                asset=universe.assets[asset_index[i, :n]],
+                lot=lot[begin[i] : begin[i] + n],
+                open_bar=open_bars[i],
+                shut_bar=shut_bars[i],
+            )
+
+
+def _sample_distinct(rng, n, k, size):
+    """
+    Sample k distinct integers in [0, n) for each of `size` rows.
+
+    Returns
+    -------
+    sample : numpy.array, shape (size, k)
+
+    Examples
+    --------
+    >>> rng = np.random.default_rng(42)
+    >>> sample = _sample_distinct(rng, 5, 3, size=100)
+    >>> sample.shape
+    (100, 3)
+    >>> all(len(set(row)) == 3 for row in sample)
+    True
+    """
+    if 2 * k > n:
+        # Few candidates: take the first k of random permutations.
+        return np.argsort(rng.random((size, n)), axis=1)[:, :k]
+
+    # Many candidates: redraw collisions column by column,
+    # which are rare as long as k is small compared with n.
+    sample = np.empty((size, k), dtype=int)
+    for j in range(k):
+        sample[:, j] = rng.integers(0, n, size=size)
+        collision = (sample[:, :j] == sample[:, j : j + 1]).any(axis=1)
+        while collision.any():
+            sample[collision, j] = rng.integers(0, n, size=collision.sum())
+            collision = (sample[:, :j] == sample[:, j : j + 1]).any(axis=1)
+    return sample
 
 
 class BuyAndHold(Strategy):
@@ -84,15 +124,78 @@ class BuyAndHold(Strategy):
     - weight : dict[str, float]
         Keys are assets to trade.
         Values are value-based weights.
+    - rebalance : int or str, optional
+        If None, hold the initial position until the end.
+        If int, rebalance to the weights every `rebalance` bars.
+        If str, rebalance at the first bar of each period
+        given by a frequency alias of pandas such as "M".
+        Then bars of universe should be datetimes.
+        Profit-loss is reinvested at each rebalance:
+        the initial capital is the sum of absolute weights
+        and the weights are scaled by the growth of the capital.
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> from epymetheus import Universe
+    >>> universe = Universe(pd.DataFrame({"A": [1, 2, 4, 5], "B": [2, 1, 5, 4]}))
+    >>> strategy = BuyAndHold({"A": 1.0, "B": 2.0}, rebalance=2)
+    >>> strategy.get_lots(universe)
+    array([[1.  , 1.  ],
+           [0.75, 1.2 ]])
+    >>> trades = list(strategy.logic(universe))
+    >>> [(trade.open_bar, trade.shut_bar) for trade in trades]
+    [(0, 2), (2, None)]
     """
 
-    def __init__(self, weight):
+    def __init__(self, weight, rebalance=None):
         self.weight = weight
+        self.rebalance = rebalance
+
+    def get_rebalance_index(self, universe):
+        """
+        Return indices of bars to rebalance.
+
+        Returns
+        -------
+        rebalance_index : numpy.array, shape (n_rebalances, )
+        """
+        if self.rebalance is None:
+            return np.array([0])
+        return _get_bucket_begin(universe.bars, self.rebalance)
+
+    def get_lots(self, universe):
+        """
+        Return schedule of lots held after each rebalance.
+
+        Lots of each period hold the weights scaled by the value of the
+        portfolio at its rebalance bar relative to the initial capital.
+
+        Returns
+        -------
+        lots : numpy.array, shape (n_rebalances, n_assets)
+            Lots of assets in `weight` in the order of its keys.
+        """
+        weight = np.array(list(self.weight.values()), dtype=float)
+        asset_index = universe.get_asset_indexer(list(self.weight.keys()))
+        if (asset_index == -1).any():
+            missing = np.array(list(self.weight.keys()))[asset_index == -1]
+            raise KeyError(f"Assets not in universe: {list(missing)}")
+        prices = universe.prices.values[
+            self.get_rebalance_index(universe)[:, np.newaxis], asset_index
+        ]
+
+        # Growth of capital over each period but the last one.
+        capital = np.abs(weight).sum()
+        growth = 1.0 + (prices[1:] / prices[:-1] - 1.0) @ weight / capital
+        scale = np.concatenate([[1.0], np.cumprod(growth)])
+
+        return scale[:, np.newaxis] * weight / prices
 
     def logic(self, universe):
         asset = np.array(list(self.weight.keys()))
-        lot = (
-            np.array(list(self.weight.values()))
-            / universe.prices.loc[:, self.weight.keys()].iloc[0, :].values
-        )
-        yield Trade(asset=asset, lot=lot, open_bar=universe.bars[0])
+        lots = self.get_lots(universe)
+        open_bars = universe.bars[self.get_rebalance_index(universe)]
+        shut_bars = list(open_bars[1:]) + [None]
+        for lot, open_bar, shut_bar in zip(lots, open_bars, shut_bars):
+            yield Trade(asset=asset, lot=lot, open_bar=open_bar, shut_bar=shut_bar)
@@ -0,0 +1,136 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from epymetheus import Universe
+from epymetheus.metrics import _metric_from_name
+from epymetheus.utils.bunch import Bunch
+
+from .benchmarks import RandomTrader
+
+
+def null_distribution(
+    universe,
+    n_runs=1000,
+    trader_kwargs=None,
+    metrics=("sharpe_ratio",),
+    n_jobs=None,
+    seed=None,
+    strategy=None,
+    budget=None,
+):
+    """
+    Evaluate metrics of `RandomTrader` runs as a null distribution.
+
+    Each run uses an independent random stream spawned from
+    `numpy.random.SeedSequence(seed)`, so that results do not depend
+    on `n_jobs`. Workers only return values of metrics;
+    trades of runs are discarded as soon as metrics are evaluated.
+
+    Parameters
+    ----------
+    - universe : Universe
+    - n_runs : int, default 1000
+        Number of runs of `RandomTrader`.
+    - trader_kwargs : dict, optional
+        Parameters of `RandomTrader` except `seed`.
+    - metrics : list of Metric or str, default ("sharpe_ratio", )
+        Metrics with scalar values.
+    - n_jobs : int, optional
+        Number of processes. If None or 1, runs in the current process.
+        If -1, use all processors.
+    - seed : int, optional
+        Seed of `numpy.random.SeedSequence`.
+    - strategy : Strategy, optional
+        Strategy which has been run with `universe`.
+        If given, its percentiles in the null distribution are reported.
+    - budget : float, optional
+        Initial budget of runs.
+        If None, budget of `strategy` if given and otherwise 0.0,
+        so that runs are comparable with `strategy`.
+
+    Returns
+    -------
+    result : Bunch
+        - null : pandas.DataFrame, shape (n_runs, n_metrics)
+            Values of metrics of runs.
+        - value : pandas.Series or None
+            Values of metrics of strategy.
+        - percentile : pandas.Series or None
+            Percentage of runs whose values are less than or equal to
+            those of strategy.
+
+    Examples
+    --------
+    >>> from epymetheus.datasets import make_randomwalk
+    >>> universe = make_randomwalk(seed=42)
+    >>> result = null_distribution(universe, n_runs=10, seed=42)
+    >>> result.null.shape
+    (10, 1)
+    """
+    metrics = [_metric_from_name(m) if isinstance(m, str) else m for m in metrics]
+    names = [metric.name for metric in metrics]
+    trader_kwargs = trader_kwargs or {}
+    seeds = np.random.SeedSequence(seed).spawn(n_runs)
+    if budget is None:
+        budget = 0.0 if strategy is None else strategy.budget
+
+    if n_jobs == -1:
+        n_jobs = os.cpu_count()
+
+    if n_jobs is None or n_jobs == 1:
+        values = _run_null(seeds, trader_kwargs, metrics, budget, universe=universe)
+    else:
+        # Universe is sent to each process once, not to each task.
+        chunks = [list(c) for c in np.array_split(seeds, 4 * n_jobs) if len(c) > 0]
+        with ProcessPoolExecutor(
+            max_workers=n_jobs,
+            initializer=_init_worker,
+            initargs=(universe.prices, universe.name),
+        ) as executor:
+            futures = [
+                executor.submit(_run_null, chunk, trader_kwargs, metrics, budget)
+                for chunk in chunks
+            ]
+            values = np.concatenate([future.result() for future in futures])
+
+    null = pd.DataFrame(values, columns=names)
+
+    if strategy is None:
+        return Bunch(null=null, value=None, percentile=None)
+
+    value = pd.Series(
+        [float(v) for v in strategy.evaluate(metrics)], index=names, dtype=float
+    )
+    percentile = 100 * (null <= value).mean()
+    return Bunch(null=null, value=value, percentile=percentile)
+
+
+# Universe of the worker process
+_universe = None
+
+
+def _init_worker(prices, name):
+    global _universe
+    _universe = Universe(prices, name=name)
+
+
+def _run_null(seeds, trader_kwargs, metrics, budget, universe=None):
+    """
+    Return values of metrics of `RandomTrader` runs with the given seeds.
+    If universe is None, use the universe of the worker process.
+
+    Returns
+    -------
+    values : numpy.array, shape (len(seeds), len(metrics))
+    """
+    if universe is None:
+        universe = _universe
+    values = np.empty((len(seeds), len(metrics)))
+    for i, seed in enumerate(seeds):
+        trader = RandomTrader(seed=seed, **trader_kwargs)
+        trader.run(universe, metrics=metrics, budget=budget, verbose=False)
+        values[i] = trader.metric_results
+    return values
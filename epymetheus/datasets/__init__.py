@@ -1,4 +1,12 @@
 # flake8: noqa
 
+from .csvdirectory import load_csv_directory
+from .gbm import make_gbm
+from .intraday import make_intraday
 from .randomwalk import make_randomwalk
+from .regimeswitching import make_regime_switching
+from .sources import CachedSource
+from .sources import CSVSource
+from .sources import PriceSource
+from .sources import YahooSource
 from .usstocks import fetch_usstocks
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 
@@ -29,3 +30,101 @@ def fill_and_cut(series, begin_date=None, method="ffill"):
     f_index = pd.date_range(series.index[0], series.index[-1])
     n_index = pd.date_range(begin_date or series.index[0], series.index[-1])
     return series.reindex(f_index, method=method).reindex(n_index)
+
+
+def fill_and_cut_frame(frame, begin_date=None):
+    """
+    Forward-fill columns of frame onto a daily calendar and cut it.
+
+    It is equivalent to applying `fill_and_cut` to each column and
+    aligning the results, but all columns are processed at once:
+    each column is forward-filled, the frame is reindexed onto the calendar
+    once, and values after the last valid date of each column are masked.
+
+    Parameters
+    ----------
+    - frame : pandas.DataFrame
+        Index is dates.
+    - begin_date : str or pandas.Timestamp, optional
+        First date of the calendar. If None, the first date of frame.
+
+    Returns
+    -------
+    frame : pandas.DataFrame
+
+    Examples
+    --------
+    >>> index = pd.DatetimeIndex([
+    ...     "1999-12-30",
+    ...     "2000-01-02",
+    ...     "2000-01-03",
+    ...     "2000-01-05",
+    ... ])
+    >>> frame = pd.DataFrame({
+    ...     "A": [0.0, 1.0, 2.0, 3.0],
+    ...     "B": [np.nan, 1.0, np.nan, np.nan],
+    ... }, index=index)
+    >>> fill_and_cut_frame(frame, begin_date="2000-01-01")
+                  A    B
+    2000-01-01  0.0  NaN
+    2000-01-02  1.0  1.0
+    2000-01-03  2.0  NaN
+    2000-01-04  2.0  NaN
+    2000-01-05  3.0  NaN
+    """
+    frame = frame.sort_index()
+    calendar = pd.date_range(begin_date or frame.index[0], frame.index[-1])
+
+    # Position of the last valid value of each column.
+    is_valid = frame.notna().to_numpy()
+    last = len(frame) - 1 - np.argmax(is_valid[::-1], axis=0)
+    last_date = frame.index.values[last]
+
+    result = frame.ffill().reindex(calendar, method="ffill")
+    result = result.mask(calendar.values[:, np.newaxis] > last_date)
+    return result
+
+
+def _make_prices(
+    log_return, n_bars, n_assets, seed=None, dtype=np.float64, chunk_size=None
+):
+    """
+    Return prices accumulated from log returns generated in chunks of bars.
+
+    Parameters
+    ----------
+    - log_return : callable
+        `log_return(rng, begin, end)` returns log returns of bars
+        `begin, ..., end - 1` as an array with shape (end - begin, n_assets).
+        It should draw from `rng` bar by bar so that prices
+        do not depend on `chunk_size`.
+    - n_bars : int
+    - n_assets : int
+    - seed : int, optional
+        Seed of `numpy.random.Generator`.
+    - dtype : numpy.dtype, default numpy.float64
+    - chunk_size : int, optional
+        Number of bars generated at once.
+        If None, chosen so that a chunk has about 2 ** 22 elements.
+
+    Returns
+    -------
+    prices : numpy.array, shape (n_bars, n_assets)
+        Prices starting from 1.0.
+    """
+    if chunk_size is None:
+        chunk_size = max(1, 2 ** 22 // max(n_assets, 1))
+
+    rng = np.random.default_rng(seed)
+    prices = np.empty((n_bars, n_assets), dtype=dtype)
+    last = np.zeros(n_assets)
+    for begin in range(0, n_bars, chunk_size):
+        end = min(begin + chunk_size, n_bars)
+        chunk = log_return(rng, begin, end)
+        if begin == 0:
+            chunk[0] = 0.0
+        chunk = np.cumsum(chunk, axis=0) + last
+        last = chunk[-1]
+        prices[begin:end] = np.exp(chunk)
+
+    return prices
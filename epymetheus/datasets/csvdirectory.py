@@ -0,0 +1,146 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from epymetheus import Universe
+
+
+def load_csv_directory(
+    path,
+    column="Adj Close",
+    calendar=None,
+    n_jobs=None,
+    pattern="*.csv",
+    dtype=np.float64,
+    filename=None,
+    name=None,
+    backfill=False,
+):
+    """
+    Return Universe from a directory of CSV files, one file per asset.
+
+    Files are parsed on a thread pool into arrays of dates and prices,
+    which are aligned onto the calendar by as-of lookup and written
+    directly into a preallocated array of prices.
+
+    Parameters
+    ----------
+    - path : str or path
+        Directory of CSV files whose first column is dates.
+        Names of assets are the stems of file names.
+    - column : str, default "Adj Close"
+        Column of prices.
+    - calendar : array-like of dates, optional
+        Bars of universe. If None, union of dates in files.
+    - n_jobs : int, optional
+        Number of threads. If None, decided by `ThreadPoolExecutor`.
+    - pattern : str, default "*.csv"
+        Pattern of file names.
+    - dtype : {numpy.float64, numpy.float32}, default numpy.float64
+    - filename : str or path, optional
+        If given, prices are written to a `.npy` file and mapped to memory.
+    - name : str, optional
+        Name of universe.
+    - backfill : bool, default False
+        If True, bars before the first date of a file have its first price.
+        It looks ahead and should be used with care in backtesting.
+
+    Returns
+    -------
+    universe : Universe
+        Price at each bar is the last price in the file on or before the bar.
+
+    Raises
+    ------
+    ValueError
+        If a bar precedes the first date of a file and `backfill` is False.
+    """
+    paths = sorted(Path(path).glob(pattern))
+    assets = [p.stem for p in paths]
+
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        parsed = list(executor.map(lambda p: _read_prices(p, column), paths))
+
+        if calendar is None:
+            calendar = np.unique(np.concatenate([dates for dates, _ in parsed]))
+        calendar = pd.DatetimeIndex(calendar)
+
+        if not backfill and len(calendar) > 0:
+            missing = [
+                asset
+                for asset, (dates, _) in zip(assets, parsed)
+                if len(dates) == 0 or dates[0] > calendar.values[0]
+            ]
+            if missing:
+                raise ValueError(
+                    f"Prices of {missing} are missing before their first dates. "
+                    "Give a calendar which begins after them or set backfill=True."
+                )
+
+        shape = (len(calendar), len(assets))
+        if filename is None:
+            prices = np.empty(shape, dtype=dtype, order="F")
+        else:
+            prices = np.lib.format.open_memmap(
+                filename, mode="w+", dtype=dtype, shape=shape, fortran_order=True
+            )
+
+        def align(j):
+            prices[:, j] = _asof(calendar.values, *parsed[j], backfill=backfill)
+
+        list(executor.map(align, range(len(assets))))
+
+    if filename is not None:
+        prices.flush()
+
+    return Universe(
+        pd.DataFrame(prices, index=calendar, columns=assets, copy=False), name=name
+    )
+
+
+def _read_prices(path, column):
+    """
+    Return dates and prices in a CSV file sorted by dates.
+    Rows with missing prices are dropped and the last of duplicated dates is kept.
+
+    Returns
+    -------
+    dates : numpy.array, shape (n, )
+    prices : numpy.array, shape (n, )
+    """
+    date_column = pd.read_csv(path, nrows=0).columns[0]
+    frame = pd.read_csv(path, usecols=[date_column, column], parse_dates=[date_column])
+    dates = frame[date_column].to_numpy()
+    values = frame[column].to_numpy(dtype=float)
+
+    is_valid = ~np.isnan(values)
+    dates, values = dates[is_valid], values[is_valid]
+
+    order = np.argsort(dates, kind="stable")
+    dates, values = dates[order], values[order]
+    is_last = np.append(dates[1:] != dates[:-1], True)
+    return dates[is_last], values[is_last]
+
+
+def _asof(calendar, dates, values, backfill=False):
+    """
+    Return the last value on or before each date of calendar.
+    Dates before the first date have nan, or the first value if `backfill`.
+
+    Examples
+    --------
+    >>> calendar = np.array([0, 1, 2, 3, 4, 5])
+    >>> _asof(calendar, np.array([1, 3, 4]), np.array([10.0, 30.0, 40.0]))
+    array([nan, 10., 10., 30., 40., 40.])
+    >>> _asof(calendar, np.array([1, 3, 4]), np.array([10.0, 30.0, 40.0]), True)
+    array([10., 10., 10., 30., 40., 40.])
+    """
+    if len(dates) == 0:
+        return np.full(len(calendar), np.nan)
+    index = np.searchsorted(dates, calendar, side="right") - 1
+    result = values[np.maximum(index, 0)]
+    if not backfill:
+        result = np.where(index < 0, np.nan, result)
+    return result
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+
+from epymetheus import Universe
+
+from ._utils import _make_prices
+
+
+def make_gbm(
+    cov,
+    drift=0.0,
+    n_bars=1000,
+    name="GBM",
+    bars=None,
+    assets=None,
+    seed=None,
+    dtype=np.float64,
+    chunk_size=None,
+):
+    """
+    Return Universe whose prices are correlated geometric Brownian motions.
+
+    Log returns are normal with covariance `cov`, which are generated
+    from standard normal draws multiplied by the Cholesky factor of `cov`
+    in chunks of bars.
+
+    Parameters
+    ----------
+    - cov : array-like, shape (n_assets, n_assets)
+        Covariance matrix of log returns per bar.
+    - drift : float or array-like, shape (n_assets, ), default 0.0
+        Expected rate of return per bar.
+    - n_bars : int, default 1000
+    - name : str, default "GBM"
+    - bars
+    - assets
+    - seed : int, optional
+        Seed of `numpy.random.Generator`.
+    - dtype : {numpy.float64, numpy.float32}, default numpy.float64
+    - chunk_size : int, optional
+        Number of bars generated at once.
+
+    Returns
+    -------
+    universe : Universe
+
+    Examples
+    --------
+    >>> cov = [[1.0, 0.5], [0.5, 1.0]]
+    >>> universe = make_gbm(np.array(cov) * 1e-4, n_bars=10000, seed=42)
+    >>> log_return = np.diff(np.log(universe.prices.values), axis=0)
+    >>> np.round(np.corrcoef(log_return.T)[0, 1], 1)
+    0.5
+    """
+    cov = np.asarray(cov, dtype=float)
+    n_assets = cov.shape[0]
+    factor = np.linalg.cholesky(cov)
+    # Ito correction so that drift is the expected rate of return.
+    mean = np.broadcast_to(drift, n_assets) - 0.5 * np.diag(cov)
+
+    def log_return(rng, begin, end):
+        draw = rng.standard_normal(size=(end - begin, n_assets))
+        return draw @ factor.T + mean
+
+    prices = _make_prices(
+        log_return, n_bars, n_assets, seed=seed, dtype=dtype, chunk_size=chunk_size
+    )
+
+    bars = list(range(n_bars)) if bars is None else bars
+    assets = [str(i) for i in range(n_assets)] if assets is None else assets
+
+    return Universe(pd.DataFrame(prices, index=bars, columns=assets), name=name)
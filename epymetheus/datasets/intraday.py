@@ -0,0 +1,100 @@
+import numpy as np
+import pandas as pd
+
+from epymetheus import Universe
+
+from ._utils import _make_prices
+
+
+def make_intraday(
+    n_days=20,
+    n_assets=10,
+    freq="5min",
+    session=("09:30", "16:00"),
+    begin_date="2000-01-03",
+    volatility=0.001,
+    overnight_volatility=0.01,
+    corr=None,
+    name="Intraday",
+    assets=None,
+    seed=None,
+    dtype=np.float64,
+    chunk_size=None,
+):
+    """
+    Return Universe of intraday prices with bars in trading sessions.
+
+    Bars are datetimes of business days within the session.
+    Volatility follows a U-shaped profile within each session,
+    and the first bar of each day jumps by an overnight return.
+
+    Parameters
+    ----------
+    - n_days : int, default 20
+        Number of business days.
+    - n_assets : int, default 10
+    - freq : str, default "5min"
+        Interval of bars.
+    - session : tuple of str, default ("09:30", "16:00")
+        Open and close times of sessions. Close time is excluded.
+    - begin_date : str, default "2000-01-03"
+    - volatility : float, default 0.001
+        Root mean square volatility of log returns per bar within sessions.
+    - overnight_volatility : float, default 0.01
+        Volatility of log returns from close to open.
+    - corr : array-like, shape (n_assets, n_assets), optional
+        Correlation matrix of log returns. If None, assets are independent.
+    - name : str, default "Intraday"
+    - assets
+    - seed : int, optional
+        Seed of `numpy.random.Generator`.
+    - dtype : {numpy.float64, numpy.float32}, default numpy.float64
+    - chunk_size : int, optional
+        Number of bars generated at once.
+
+    Returns
+    -------
+    universe : Universe
+
+    Examples
+    --------
+    >>> universe = make_intraday(n_days=2, n_assets=3, freq="1h", seed=42)
+    >>> universe.bars[:4]
+    DatetimeIndex(['2000-01-03 09:30:00', '2000-01-03 10:30:00',
+                   '2000-01-03 11:30:00', '2000-01-03 12:30:00'],
+                  dtype='datetime64[ns]', freq=None)
+    >>> universe.prices.shape
+    (14, 3)
+    """
+    days = pd.bdate_range(begin_date, periods=n_days)
+    open_time = pd.Timedelta(session[0] + ":00")
+    close_time = pd.Timedelta(session[1] + ":00")
+    times = pd.timedelta_range(open_time, close_time, freq=freq)
+    times = times[times < close_time]
+    bars = pd.DatetimeIndex((days.values[:, None] + times.values[None, :]).ravel())
+
+    n_per_day = len(times)
+    n_bars = len(bars)
+
+    # U-shaped intraday volatility. The first bar is overnight.
+    x = np.arange(n_per_day) / n_per_day
+    profile = 1.0 + (2.0 * x - 1.0) ** 2
+    if n_per_day > 1:
+        profile *= volatility / np.sqrt(np.mean(profile[1:] ** 2))
+    scale = np.tile(profile, n_days)
+    scale[::n_per_day] = overnight_volatility
+
+    factor = np.eye(n_assets) if corr is None else np.linalg.cholesky(corr)
+
+    def log_return(rng, begin, end):
+        draw = rng.standard_normal(size=(end - begin, n_assets))
+        s = scale[begin:end, np.newaxis]
+        return (draw @ factor.T) * s - 0.5 * s ** 2
+
+    prices = _make_prices(
+        log_return, n_bars, n_assets, seed=seed, dtype=dtype, chunk_size=chunk_size
+    )
+
+    assets = [str(i) for i in range(n_assets)] if assets is None else assets
+
+    return Universe(pd.DataFrame(prices, index=bars, columns=assets), name=name)
@@ -12,11 +12,18 @@ def make_randomwalk(
     bars=None,
     assets=None,
     seed=None,
+    dtype=np.float64,
+    chunk_size=None,
+    filename=None,
 ):
     """
     Return Universe whose prices are random-walks.
     Daily returns follow log-normal distribution.
 
+    Prices are generated for chunks of assets so that temporary memory
+    is bounded, and written into an array in Fortran order, which can be
+    a memory-mapped file. Prices do not depend on `chunk_size`.
+
     Parameters
     ----------
     - n_bars : int, default 1000
@@ -25,20 +32,56 @@ def make_randomwalk(
     - name : str, default='RandomWalk'
     - bars
     - assets
-    - seed : int
+    - seed : int, optional
+        Seed of `numpy.random.Generator`.
+    - dtype : {numpy.float64, numpy.float32}, default numpy.float64
+    - chunk_size : int, optional
+        Number of assets generated at once.
+        If None, chosen so that a chunk has about 2 ** 22 elements.
+    - filename : str or path, optional
+        If given, prices are written to a `.npy` file and mapped to memory.
+        It can be reopened by `numpy.load(filename, mmap_mode="r")`.
 
     Returns
     -------
     Universe
+
+    Examples
+    --------
+    >>> universe0 = make_randomwalk(seed=42)
+    >>> universe1 = make_randomwalk(seed=42, chunk_size=3)
+    >>> (universe0.prices == universe1.prices).all(axis=None)
+    True
     """
-    data = np.random.lognormal(sigma=volatility, size=(n_bars, n_assets)).cumprod(
-        axis=0
-    )
-    data /= data[0, :]
+    dtype = np.dtype(dtype)
+    shape = (n_bars, n_assets)
+    if filename is None:
+        data = np.empty(shape, dtype=dtype, order="F")
+    else:
+        data = np.lib.format.open_memmap(
+            filename, mode="w+", dtype=dtype, shape=shape, fortran_order=True
+        )
+
+    if chunk_size is None:
+        chunk_size = max(1, 2 ** 22 // max(n_bars, 1))
+
+    # Draws are consumed asset by asset, so they do not depend on chunk_size.
+    rng = np.random.default_rng(seed)
+    for begin in range(0, n_assets, chunk_size):
+        end = min(begin + chunk_size, n_assets)
+        log_prices = rng.standard_normal(size=(end - begin, n_bars), dtype=dtype)
+        log_prices[:, 0] = 0.0
+        log_prices *= volatility
+        np.cumsum(log_prices, axis=1, out=log_prices)
+        np.exp(log_prices, out=log_prices)
+        data[:, begin:end] = log_prices.T
+
+    if filename is not None:
+        data.flush()
 
-    bars = bars or list(range(n_bars))
-    assets = assets or [str(i) for i in range(n_assets)]
+    bars = list(range(n_bars)) if bars is None else bars
+    assets = [str(i) for i in range(n_assets)] if assets is None else assets
 
-    prices = pd.DataFrame(data, index=bars, columns=assets)
+    prices = pd.DataFrame(data, index=bars, columns=assets, copy=False)
 
     return Universe(prices, name=name)
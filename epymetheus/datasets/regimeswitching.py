@@ -0,0 +1,138 @@
+import numpy as np
+import pandas as pd
+
+from epymetheus import Universe
+
+from ._utils import _make_prices
+
+
+def make_regime_switching(
+    covs,
+    drifts=0.0,
+    transition=None,
+    n_bars=1000,
+    initial_regime=0,
+    name="RegimeSwitching",
+    bars=None,
+    assets=None,
+    seed=None,
+    dtype=np.float64,
+    chunk_size=None,
+    return_regimes=False,
+):
+    """
+    Return Universe whose prices follow geometric Brownian motions
+    with parameters switched by a Markov chain of regimes.
+
+    Regimes last for geometrically distributed numbers of bars,
+    so that the path of regimes is drawn once per switch.
+    Log returns are generated in chunks of bars with Cholesky factors
+    of covariance matrices of regimes.
+
+    Parameters
+    ----------
+    - covs : array-like, shape (n_regimes, n_assets, n_assets)
+        Covariance matrices of log returns per bar in each regime.
+    - drifts : float or array-like, shape (n_regimes, n_assets), default 0.0
+        Expected rates of return per bar in each regime.
+    - transition : array-like, shape (n_regimes, n_regimes), optional
+        Transition probabilities from regime (row) to regime (column)
+        per bar. If None, regimes last 100 bars on average and
+        switch to the other regimes with equal probabilities.
+    - n_bars : int, default 1000
+    - initial_regime : int, default 0
+    - name : str, default "RegimeSwitching"
+    - bars
+    - assets
+    - seed : int, optional
+        Seed of `numpy.random.SeedSequence`.
+    - dtype : {numpy.float64, numpy.float32}, default numpy.float64
+    - chunk_size : int, optional
+        Number of bars generated at once.
+    - return_regimes : bool, default False
+        If True, also return regime of each bar.
+
+    Returns
+    -------
+    universe : Universe
+    regimes : numpy.array, shape (n_bars, )
+        Returned if `return_regimes` is True.
+
+    Examples
+    --------
+    >>> covs = [np.eye(2) * 1e-4, np.eye(2) * 1e-2]
+    >>> universe, regimes = make_regime_switching(
+    ...     covs, n_bars=10000, seed=42, return_regimes=True
+    ... )
+    >>> log_return = np.diff(np.log(universe.prices.values), axis=0)
+    >>> bool(log_return[regimes[1:] == 0].std() < log_return[regimes[1:] == 1].std())
+    True
+    """
+    covs = np.asarray(covs, dtype=float)
+    n_regimes, n_assets = covs.shape[:2]
+    factors = np.linalg.cholesky(covs)
+    diag = np.diagonal(covs, axis1=1, axis2=2)
+    means = np.broadcast_to(drifts, (n_regimes, n_assets)) - 0.5 * diag
+
+    if transition is None:
+        transition = np.full((n_regimes, n_regimes), 0.01 / max(n_regimes - 1, 1))
+        np.fill_diagonal(transition, 0.99 if n_regimes > 1 else 1.0)
+    transition = np.asarray(transition, dtype=float)
+
+    seed_regime, seed_price = np.random.SeedSequence(seed).spawn(2)
+    regimes = _get_regimes(
+        np.random.default_rng(seed_regime), transition, n_bars, initial_regime
+    )
+
+    def log_return(rng, begin, end):
+        draw = rng.standard_normal(size=(end - begin, n_assets))
+        regime = regimes[begin:end]
+        result = np.empty_like(draw)
+        for k in range(n_regimes):
+            is_k = regime == k
+            result[is_k] = draw[is_k] @ factors[k].T + means[k]
+        return result
+
+    prices = _make_prices(
+        log_return,
+        n_bars,
+        n_assets,
+        seed=seed_price,
+        dtype=dtype,
+        chunk_size=chunk_size,
+    )
+
+    bars = list(range(n_bars)) if bars is None else bars
+    assets = [str(i) for i in range(n_assets)] if assets is None else assets
+
+    universe = Universe(pd.DataFrame(prices, index=bars, columns=assets), name=name)
+
+    if return_regimes:
+        return universe, regimes
+    return universe
+
+
+def _get_regimes(rng, transition, n_bars, initial_regime=0):
+    """
+    Return regime of each bar of a Markov chain.
+
+    Returns
+    -------
+    regimes : numpy.array, shape (n_bars, )
+    """
+    n_regimes = transition.shape[0]
+    regimes = np.empty(n_bars, dtype=int)
+    regime = initial_regime
+    begin = 0
+    while begin < n_bars:
+        p_stay = transition[regime, regime]
+        duration = n_bars if p_stay >= 1.0 else rng.geometric(1.0 - p_stay)
+        regimes[begin : begin + duration] = regime
+        begin += duration
+
+        p_switch = transition[regime].copy()
+        p_switch[regime] = 0.0
+        if p_switch.sum() > 0:
+            regime = rng.choice(n_regimes, p=p_switch / p_switch.sum())
+
+    return regimes
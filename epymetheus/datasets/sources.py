@@ -0,0 +1,164 @@
+from abc import ABCMeta
+from abc import abstractmethod
+from pathlib import Path
+from urllib.parse import quote
+
+import numpy as np
+import pandas as pd
+
+
+class PriceSource(metaclass=ABCMeta):
+    """
+    Base class of sources of prices.
+
+    Abstractmethod
+    --------------
+    - fetch
+        Return prices of a ticker.
+    """
+
+    @abstractmethod
+    def fetch(self, ticker, begin_date, end_date):
+        """
+        Return prices of a ticker between dates.
+
+        Parameters
+        ----------
+        - ticker : str
+        - begin_date : pandas.Timestamp
+        - end_date : pandas.Timestamp
+            Both ends are included.
+
+        Returns
+        -------
+        prices : pandas.DataFrame
+            Index is dates and columns are fields such as "Adj Close".
+        """
+
+
+class YahooSource(PriceSource):
+    """
+    Prices from Yahoo Finance through `pandas_datareader`.
+    """
+
+    def fetch(self, ticker, begin_date, end_date):
+        from pandas_datareader import DataReader
+
+        return DataReader(
+            name=ticker, data_source="yahoo", start=begin_date, end=end_date
+        )
+
+
+class CSVSource(PriceSource):
+    """
+    Prices from local CSV files.
+
+    Parameters
+    ----------
+    - directory : str or path
+        Directory of files `<ticker>.csv` whose first column is dates.
+    """
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+
+    def fetch(self, ticker, begin_date, end_date):
+        prices = pd.read_csv(
+            self.directory / f"{ticker}.csv", index_col=0, parse_dates=True
+        )
+        return prices.sort_index().loc[begin_date:end_date]
+
+
+class CachedSource(PriceSource):
+    """
+    Source with a local cache of another source.
+
+    Prices of each ticker are stored as a `.npz` file with an array per column,
+    together with the range of dates which has been fetched.
+    Only ranges which are not covered yet are fetched from the source.
+    Dates from today on are never regarded as covered,
+    since their prices may not be available or final yet.
+
+    Parameters
+    ----------
+    - source : PriceSource
+        Source to fetch prices not in the cache.
+    - directory : str or path
+        Directory to store cache.
+    """
+
+    def __init__(self, source, directory):
+        self.source = source
+        self.directory = Path(directory)
+
+    def fetch(self, ticker, begin_date, end_date):
+        begin_date = pd.Timestamp(begin_date)
+        end_date = pd.Timestamp(end_date)
+        last_final_date = self._today() - pd.Timedelta(days=1)
+
+        cached, covered = self._load(ticker)
+
+        if covered is None:
+            prices = self.source.fetch(ticker, begin_date, end_date)
+            covered = (begin_date, min(end_date, last_final_date))
+        else:
+            # Top up ranges before and after the covered range.
+            frames = [cached]
+            if begin_date < covered[0]:
+                before = covered[0] - pd.Timedelta(days=1)
+                frames.append(self.source.fetch(ticker, begin_date, before))
+            if end_date > covered[1]:
+                after = covered[1] + pd.Timedelta(days=1)
+                frames.append(self.source.fetch(ticker, after, end_date))
+            if len(frames) == 1:
+                return cached.loc[begin_date:end_date]
+            prices = pd.concat(frames).sort_index()
+            prices = prices[~prices.index.duplicated(keep="first")]
+            covered = (
+                min(begin_date, covered[0]),
+                max(min(end_date, last_final_date), covered[1]),
+            )
+
+        if covered[0] <= covered[1]:
+            # Only prices in the covered range are stored.
+            self._save(ticker, prices.loc[covered[0] : covered[1]], covered)
+        return prices.loc[begin_date:end_date]
+
+    @staticmethod
+    def _today():
+        return pd.Timestamp.today().normalize()
+
+    def _get_path(self, ticker):
+        return self.directory / f"{quote(ticker, safe='')}.npz"
+
+    def _load(self, ticker):
+        """
+        Return cached prices and covered range of dates.
+        (None, None) if not cached.
+        """
+        path = self._get_path(ticker)
+        if not path.exists():
+            return None, None
+        with np.load(path, allow_pickle=False) as npz:
+            columns = list(npz["columns"])
+            prices = pd.DataFrame(
+                {column: npz[f"column_{i}"] for i, column in enumerate(columns)},
+                index=pd.DatetimeIndex(npz["index"], name=str(npz["name"]) or None),
+                columns=columns,
+            )
+            covered = tuple(pd.Timestamp(d) for d in npz["covered"])
+        return prices, covered
+
+    def _save(self, ticker, prices, covered):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._get_path(ticker)
+        tmp = path.with_suffix(".tmp.npz")
+        np.savez(
+            tmp,
+            index=prices.index.values.astype("datetime64[ns]"),
+            name=np.array(prices.index.name or "", dtype=str),
+            columns=np.array(prices.columns, dtype=str),
+            covered=np.array(covered, dtype="datetime64[ns]"),
+            **{f"column_{i}": prices[c].values for i, c in enumerate(prices.columns)},
+        )
+        tmp.replace(path)
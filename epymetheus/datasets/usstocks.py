@@ -1,12 +1,13 @@
+from concurrent.futures import ThreadPoolExecutor
 from os.path import dirname
 from pathlib import Path
 
 import pandas as pd
-from pandas_datareader import DataReader
 
 from epymetheus import Universe
 
-from ._utils import fill_and_cut
+from ._utils import fill_and_cut_frame
+from .sources import YahooSource
 
 module_path = Path(dirname(__file__))
 
@@ -17,6 +18,8 @@ def fetch_usstocks(
     n_assets=10,
     column="Adj Close",
     verbose=True,
+    source=None,
+    n_jobs=8,
 ):
     """
     Return Universe of US stocks.
@@ -26,6 +29,12 @@ def fetch_usstocks(
     - begin_date : str
     - end_date : str
     - n_assets : int
+    - column : str, default "Adj Close"
+    - source : PriceSource, optional
+        Source of prices. If None, `YahooSource()`.
+        Wrap it with `CachedSource` to avoid fetching the same prices again.
+    - n_jobs : int, default 8
+        Number of threads to fetch prices concurrently.
 
     Returns
     -------
@@ -40,19 +49,16 @@ def fetch_usstocks(
     if n_assets > len(tickers):
         raise ValueError("n_assets should be <=", len(tickers))
 
-    prices = pd.DataFrame(
-        {
-            ticker: fill_and_cut(
-                DataReader(
-                    name=ticker,
-                    data_source="yahoo",
-                    start=begin_date - pd.Timedelta(days=10),
-                    end=end_date,
-                )[column],
-                begin_date=begin_date,
-            )
-            for ticker in tickers[:n_assets]
-        }
-    )
+    source = source or YahooSource()
+
+    def fetch(ticker):
+        prices = source.fetch(ticker, begin_date - pd.Timedelta(days=10), end_date)
+        return prices[column]
+
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        series = list(executor.map(fetch, tickers[:n_assets]))
+
+    prices = pd.concat(dict(zip(tickers[:n_assets], series)), axis=1)
+    prices = fill_and_cut_frame(prices, begin_date=begin_date)
 
     return Universe(prices)
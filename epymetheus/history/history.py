@@ -60,6 +60,125 @@ class History(TradeResult):
             pnl=cls._get_pnl(strategy),
         )
 
+    def query(self, asset=None, open_between=None, close_between=None):
+        """
+        Return orders that satisfy all of the given conditions.
+
+        Orders are looked up by binary search on sorted-permutation
+        indexes, which are built on the first query and reused until
+        self changes.
+
+        Parameters
+        ----------
+        - asset : str or array-like, optional
+            Asset(s) to select.
+        - open_between : tuple (begin, end), optional
+            Select orders with `begin <= open_bar <= end`.
+            `None` for either end means unbounded.
+        - close_between : tuple (begin, end), optional
+            Select orders with `begin <= close_bar <= end`.
+            `None` for either end means unbounded.
+
+        Returns
+        -------
+        history : History
+            Subset of self in the order of `order_id`.
+
+        Examples
+        --------
+        >>> history = History(
+        ...     order_id=np.array([0, 1, 2, 3]),
+        ...     asset=np.array(["A0", "A1", "A0", "A1"]),
+        ...     open_bar=np.array([3, 1, 4, 1]),
+        ...     close_bar=np.array([5, 9, 6, 5]),
+        ... )
+        >>> history.query(asset="A0").order_id
+        array([0, 2])
+        >>> history.query(open_between=(1, 3)).order_id
+        array([0, 1, 3])
+        >>> history.query(asset="A1", close_between=(None, 5)).order_id
+        array([3])
+        """
+        # Each condition is (index lookup, column, test of column values)
+        conditions = []
+        if asset is not None:
+            values = np.unique(asset)
+            conditions.append(
+                (self._lookup("asset", values), "asset", lambda v: np.isin(v, values))
+            )
+        for key, between in (("open_bar", open_between), ("close_bar", close_between)):
+            if between is not None:
+                conditions.append(
+                    (
+                        self._lookup_range(key, between),
+                        key,
+                        lambda v, between=between: self._is_between(v, between),
+                    )
+                )
+
+        if not conditions:
+            index = np.arange(len(self["order_id"]))
+        else:
+            # Start from the smallest lookup and check the others on its hits only
+            conditions.sort(key=lambda condition: len(condition[0]))
+            index = np.sort(conditions[0][0])
+            for _, key, test in conditions[1:]:
+                index = index[test(self[key][index])]
+
+        return self.__class__(**{key: value[index] for key, value in self.items()})
+
+    def _get_index(self, key):
+        """
+        Return sorted-permutation index of a column.
+
+        Returns
+        -------
+        argsort : numpy.array, shape (n_orders, )
+            Permutation that sorts the column.
+        sorted_values : numpy.array, shape (n_orders, )
+            Sorted column.
+        """
+
+        def build():
+            argsort = np.argsort(self[key], kind="stable")
+            return argsort, self[key][argsort]
+
+        return self._cached(("index", key), build)
+
+    def _lookup(self, key, values):
+        """
+        Return indices of orders whose `key` is in `values`.
+        """
+        argsort, sorted_values = self._get_index(key)
+        begin = np.searchsorted(sorted_values, values, side="left")
+        end = np.searchsorted(sorted_values, values, side="right")
+        return np.concatenate(
+            [argsort[b:e] for b, e in zip(begin, end)] + [np.array([], dtype=int)]
+        )
+
+    def _lookup_range(self, key, between):
+        """
+        Return indices of orders whose `key` is within `between`.
+        """
+        begin, end = between
+        argsort, sorted_values = self._get_index(key)
+        lo = 0 if begin is None else np.searchsorted(sorted_values, begin, "left")
+        hi = None if end is None else np.searchsorted(sorted_values, end, "right")
+        return argsort[lo:hi]
+
+    @staticmethod
+    def _is_between(values, between):
+        """
+        Return mask of `values` within `between`.
+        """
+        begin, end = between
+        mask = np.ones(len(values), dtype=bool)
+        if begin is not None:
+            mask &= values >= begin
+        if end is not None:
+            mask &= values <= end
+        return mask
+
     def to_dataframe(self, copy=False):
         """
         Represent self as `pandas.DataFrame`.
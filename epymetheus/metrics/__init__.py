@@ -1,12 +1,28 @@
 # flake8: noqa
 
+from .metrics import Alpha
 from .metrics import AverageReturn
+from .metrics import Beta
+from .metrics import Correlation
 from .metrics import Drawdown
+from .metrics import EvaluationContext
 from .metrics import Exposure
 from .metrics import FinalWealth
+from .metrics import InformationRatio
 from .metrics import MaxDrawdown
+from .metrics import MaxUnderwater
 from .metrics import Return
+from .metrics import RollingAverageReturn
+from .metrics import RollingMaxDrawdown
+from .metrics import RollingSharpeRatio
+from .metrics import RollingVolatility
 from .metrics import SharpeRatio
+from .metrics import TrackingError
 from .metrics import TradewiseSharpeRatio
 from .metrics import Volatility
 from .metrics import _metric_from_name
+from .online import OnlineDrawdown
+from .online import OnlineFinalWealth
+from .online import OnlineMaxDrawdown
+from .online import OnlineSharpeRatio
+from .online import OnlineVolatility
@@ -1,17 +1,19 @@
 from abc import ABCMeta
 from abc import abstractmethod
-from functools import reduce
+from copy import copy
+from weakref import WeakKeyDictionary
 
 import numpy as np
+import pandas as pd
 
+from epymetheus.exceptions import NotRunError
 from epymetheus.utils.constants import EPSILON
+from epymetheus.wealth.wealth import _get_orders
+from epymetheus.wealth.wealth import _get_position
 
 # TODO
 # - sortino
-# - max_underwater
 # - Factor coefficients
-# - alpha
-# - beta
 
 
 def _metric_from_name(name, **kwargs):
@@ -33,10 +35,20 @@ def _metric_from_name(name, **kwargs):
         "final_wealth": FinalWealth,
         "drawdown": Drawdown,
         "max_drawdown": MaxDrawdown,
+        "max_underwater": MaxUnderwater,
         "volatility": Volatility,
         "sharpe_ratio": SharpeRatio,
         "tradewise_sharpe_ratio": TradewiseSharpeRatio,
         "exposure": Exposure,
+        "rolling_average_return": RollingAverageReturn,
+        "rolling_volatility": RollingVolatility,
+        "rolling_sharpe_ratio": RollingSharpeRatio,
+        "rolling_max_drawdown": RollingMaxDrawdown,
+        "beta": Beta,
+        "alpha": Alpha,
+        "tracking_error": TrackingError,
+        "information_ratio": InformationRatio,
+        "correlation": Correlation,
     }
 
     if name not in dict_metric.keys():
@@ -45,9 +57,246 @@ def _metric_from_name(name, **kwargs):
     return dict_metric[name](**kwargs)
 
 
+class EvaluationContext:
+    """
+    Intermediates shared by metrics evaluated for a strategy.
+
+    Each intermediate is computed on the first access and reused,
+    so that metrics evaluated with the same context do not rebuild wealth.
+
+    Parameters
+    ----------
+    - strategy : Strategy, optional
+        Strategy which has been run.
+    - wealth : numpy.array, shape (n_bars, ) or (n_strategies, n_bars), optional
+        Time-series of wealth including budget.
+        If 2-D, each row is wealth of a strategy and
+        intermediates are computed along the last axis.
+        If None, evaluated from strategy.
+
+    Examples
+    --------
+    >>> context = EvaluationContext(wealth=np.array([3.0, 1.0, 4.0, 1.0, 5.0]))
+    >>> context.returns()
+    array([ 0., -2.,  3., -3.,  4.])
+    >>> context.cummax()
+    array([3., 3., 4., 4., 5.])
+    >>> context.returns() is context.returns()
+    True
+    """
+
+    def __init__(self, strategy=None, wealth=None):
+        if strategy is None and wealth is None:
+            raise ValueError("Either strategy or wealth should be given.")
+        if strategy is not None and not strategy.is_run:
+            raise NotRunError("Strategy has not been run")
+
+        self.strategy = strategy
+        self.__cache = {}
+        if wealth is not None:
+            self.__cache["wealth"] = wealth
+
+    def _cached(self, key, func):
+        if key not in self.__cache:
+            self.__cache[key] = func()
+        return self.__cache[key]
+
+    def __require_strategy(self):
+        if self.strategy is None:
+            raise ValueError("Context is not initialized from a strategy.")
+        return self.strategy
+
+    @property
+    def wealth(self):
+        """
+        Return time-series of wealth including budget.
+
+        Returns
+        -------
+        wealth : numpy.array, shape (..., n_bars)
+        """
+        return self._cached(
+            "wealth",
+            lambda: self.strategy.budget + self.strategy.wealth.wealth,
+        )
+
+    def returns(self, rate=False):
+        """
+        Return time-series of return.
+
+        Parameters
+        ----------
+        - rate : bool, default False
+            If True, return rate of return.
+
+        Returns
+        -------
+        returns : numpy.array, shape (..., n_bars)
+        """
+
+        def compute():
+            series_wealth = self.wealth
+            result = np.diff(series_wealth, axis=-1, prepend=series_wealth[..., :1])
+
+            if rate:
+                # TODO raise ValueError if initial budget = 0
+                result /= np.roll(series_wealth, 1, axis=-1)  # array_wealth[0] = 0.0
+
+            return result
+
+        return self._cached(("returns", rate), compute)
+
+    def cummax(self):
+        """
+        Return cumulative maximum of wealth.
+
+        Returns
+        -------
+        cummax : numpy.array, shape (..., n_bars)
+        """
+        return self._cached(
+            "cummax", lambda: np.maximum.accumulate(self.wealth, axis=-1)
+        )
+
+    def position(self, absolute=False):
+        """
+        Return lot of each asset held at each bar.
+
+        Orders are aggregated into assets by a single scatter pass.
+        Each order is held from its open bar to its close bar, inclusive.
+
+        Parameters
+        ----------
+        - absolute : bool, default False
+            If True, aggregate absolute values of lots.
+
+        Returns
+        -------
+        position : numpy.array, shape (n_bars, n_assets)
+        """
+
+        def compute():
+            universe = self.__require_strategy().universe
+            asset_index, lot, open_index, close_index = _get_orders(
+                universe, self.strategy.trades
+            )
+            if absolute:
+                lot = np.abs(lot)
+            return _get_position(
+                (universe.n_bars, universe.n_assets),
+                asset_index,
+                lot,
+                open_index,
+                close_index + 1,
+            )
+
+        return self._cached(("position", absolute), compute)
+
+    def exposure(self, net=True, level="order"):
+        """
+        Return time-series of exposure of strategy.
+
+        Parameters
+        ----------
+        - net : bool, default True
+            If True, return net exposure.
+            If False, return absolute exposure.
+        - level : {"order", "asset"}, default "order"
+            Level at which absolute values are taken if `net` is False.
+            If "order", absolute exposure of every order is summed up.
+            If "asset", positions are netted within each asset first.
+
+        Returns
+        -------
+        exposure : numpy.array, shape (n_bars, )
+        """
+
+        def compute():
+            prices = self.__require_strategy().universe.prices.values
+            if net:
+                return np.einsum("ij,ij->i", self.position(), prices)
+            if level == "asset":
+                return np.abs(self.position() * prices).sum(axis=1)
+            return np.einsum("ij,ij->i", self.position(absolute=True), np.abs(prices))
+
+        if level not in ("order", "asset"):
+            raise ValueError(f"Invalid value of level: {level}")
+
+        return self._cached(("exposure", net, net or level), compute)
+
+    def moments(self, benchmark_wealth, rate=False):
+        """
+        Return first and second moments of returns of wealth and benchmark.
+
+        They are evaluated in a single pass over centered returns
+        and shared among benchmark-relative metrics.
+
+        Parameters
+        ----------
+        - benchmark_wealth : numpy.array, shape (n_bars, )
+        - rate : bool, default False
+
+        Returns
+        -------
+        moments : dict
+            Means (`mean`, `mean_benchmark`), variances (`var`,
+            `var_benchmark`) and covariance (`cov`) of returns per bar.
+        """
+
+        def compute():
+            series_return = self.returns(rate=rate)[..., 1:]
+            benchmark_return = np.diff(benchmark_wealth)
+            if rate:
+                benchmark_return /= benchmark_wealth[:-1]
+
+            mean = series_return.mean(axis=-1)
+            mean_benchmark = benchmark_return.mean()
+            d = series_return - mean[..., np.newaxis]
+            d_benchmark = benchmark_return - mean_benchmark
+            return {
+                "mean": mean,
+                "mean_benchmark": mean_benchmark,
+                "var": (d * d).mean(axis=-1),
+                "var_benchmark": (d_benchmark * d_benchmark).mean(),
+                "cov": (d * d_benchmark).mean(axis=-1),
+            }
+
+        return self._cached(("moments", id(benchmark_wealth), rate), compute)
+
+    @property
+    def history(self):
+        """
+        Return history of strategy.
+
+        Returns
+        -------
+        history : History
+        """
+        return self._cached("history", lambda: self.__require_strategy().history)
+
+
 class Metric(metaclass=ABCMeta):
     """
     Base class of Metric.
+
+    Abstractmethod
+    --------------
+    - name
+        Name of the metric.
+
+    Subclasses override either `result` to evaluate metric of a strategy,
+    or `_result_from_context` to share intermediates with other metrics
+    and to be evaluated from wealth.
+
+    Examples
+    --------
+    >>> class NTrades(Metric):
+    ...     @property
+    ...     def name(self):
+    ...         return "n_trades"
+    ...
+    ...     def result(self, strategy):
+    ...         return strategy.n_trades
     """
 
     @property
@@ -57,7 +306,25 @@ class Metric(metaclass=ABCMeta):
         Return name of self.
         """
 
-    @abstractmethod
+    def _result_from_context(self, context):
+        """
+        Evaluate metric from intermediates in context.
+
+        By default, `result` is evaluated for the strategy of context.
+
+        Parameters
+        ----------
+        - context : EvaluationContext
+        """
+        if type(self).result is Metric.result:
+            raise NotImplementedError(
+                f"{type(self).__name__} should implement result "
+                "or _result_from_context."
+            )
+        if context.strategy is None:
+            raise ValueError(f"{type(self).__name__} requires a strategy.")
+        return self.result(context.strategy)
+
     def result(self, strategy):
         """
         Evaluate metric of strategy.
@@ -66,11 +333,172 @@ class Metric(metaclass=ABCMeta):
         ----------
         - strategy : Strategy
         """
+        return self._result_from_context(EvaluationContext(strategy))
+
+    def result_from_wealth(self, wealth):
+        """
+        Evaluate metric of time-series of wealth.
+
+        Metrics which only depend on wealth accept a matrix of wealth
+        of many strategies and evaluate them in a single vectorized call.
+
+        Parameters
+        ----------
+        - wealth : array-like, shape (n_bars, ) or (n_strategies, n_bars)
+            Time-series of wealth including budget.
+
+        Returns
+        -------
+        result : object
+            If wealth is 2-D, results of strategies are stacked
+            along the first axis.
+
+        Examples
+        --------
+        >>> wealth = np.array([
+        ...     [3.0, 1.0, 4.0, 1.0, 5.0],
+        ...     [1.0, 2.0, 3.0, 2.0, 1.0],
+        ... ])
+        >>> MaxDrawdown().result_from_wealth(wealth)
+        array([-3., -2.])
+        >>> FinalWealth().result_from_wealth(wealth)
+        array([5., 1.])
+        """
+        wealth = np.asarray(wealth, dtype=float)
+        if wealth.ndim not in (1, 2):
+            raise ValueError("wealth should be 1-D or 2-D.")
+        return self._result_from_wealth(wealth)
+
+    def _result_from_wealth(self, series_wealth):
+        """
+        Evaluate metric of time-series of wealth.
+
+        Parameters
+        ----------
+        - series_wealth : numpy.array, shape (..., n_bars)
+        """
+        return self._result_from_context(EvaluationContext(wealth=series_wealth))
+
+    def bootstrap(
+        self,
+        strategy,
+        n_samples=1000,
+        block_size=1,
+        method="stationary",
+        rate=False,
+        seed=None,
+        chunk_size=None,
+    ):
+        """
+        Evaluate metric for wealth rebuilt from bootstrapped returns.
+
+        Returns of the strategy are resampled in blocks so that
+        autocorrelation within blocks is preserved.
+        Samples are evaluated in chunks of a matrix of wealth
+        with shape (chunk_size, n_bars) by a vectorized call.
+
+        Parameters
+        ----------
+        - strategy : Strategy
+            Strategy which has been run.
+        - n_samples : int, default 1000
+            Number of bootstrap samples.
+        - block_size : int, default 1
+            Size of blocks. For the stationary bootstrap,
+            average size of blocks with geometric distribution.
+        - method : {"stationary", "block"}, default "stationary"
+            If "stationary", stationary bootstrap of Politis and Romano.
+            If "block", circular block bootstrap with fixed block size.
+        - rate : bool, default False
+            If True, rates of return are resampled and wealth is compounded.
+            If False, returns are resampled and wealth is summed up.
+        - seed : int, optional
+            Seed of randomness.
+        - chunk_size : int, optional
+            Number of samples evaluated at once.
+            If None, chosen so that a chunk has about 2 ** 22 elements.
+
+        Returns
+        -------
+        results : numpy.array, shape (n_samples, ...)
+            Values of the metric for bootstrap samples.
+
+        Examples
+        --------
+        >>> from epymetheus.benchmarks import RandomTrader
+        >>> from epymetheus.datasets import make_randomwalk
+        >>> strategy = RandomTrader(seed=42).run(make_randomwalk(), verbose=False)
+        >>> results = SharpeRatio().bootstrap(strategy, n_samples=100, seed=42)
+        >>> results.shape
+        (100,)
+        >>> lower, upper = np.percentile(results, [2.5, 97.5])
+        """
+        if method not in ("stationary", "block"):
+            raise ValueError(f"Invalid value of method: {method}")
+        if block_size < 1:
+            raise ValueError("block_size should be positive.")
+
+        context = EvaluationContext(strategy)
+        initial_wealth = context.wealth[0]
+        series_return = context.returns(rate=rate)[1:]
+        n_bars = series_return.size + 1
+
+        if chunk_size is None:
+            chunk_size = max(1, 2 ** 22 // n_bars)
+
+        rng = np.random.default_rng(seed)
+        results = []
+        for begin in range(0, n_samples, chunk_size):
+            size = min(chunk_size, n_samples - begin)
+            index = _bootstrap_index(rng, size, n_bars - 1, block_size, method)
+            sample = series_return[index]
+            wealth = np.empty((size, n_bars))
+            wealth[:, 0] = initial_wealth
+            if rate:
+                np.cumprod(1.0 + sample, axis=-1, out=wealth[:, 1:])
+                wealth[:, 1:] *= initial_wealth
+            else:
+                np.cumsum(sample, axis=-1, out=wealth[:, 1:])
+                wealth[:, 1:] += initial_wealth
+            results.append(self._result_from_wealth(wealth))
+
+        return np.concatenate(results)
 
     def __call__(self, strategy, *args, **kwargs):
         return self.result(strategy, *args, **kwargs)
 
 
+def _bootstrap_index(rng, n_samples, n, block_size, method):
+    """
+    Return indices of bootstrap samples of a series of length n.
+
+    Returns
+    -------
+    index : numpy.array, shape (n_samples, n)
+
+    Examples
+    --------
+    >>> rng = np.random.default_rng(42)
+    >>> index = _bootstrap_index(rng, 2, 6, 3, "block")
+    >>> np.diff(index[:, :3]) % 6
+    array([[1, 1],
+           [1, 1]])
+    """
+    if method == "block":
+        n_blocks = -(-n // block_size)
+        start = rng.integers(0, n, size=(n_samples, n_blocks, 1))
+        index = (start + np.arange(block_size)).reshape(n_samples, -1)[:, :n]
+    else:
+        # A new block starts at each bar with probability 1 / block_size.
+        t = np.arange(n)
+        is_start = rng.random((n_samples, n)) < 1.0 / block_size
+        is_start[:, 0] = True
+        start = rng.integers(0, n, size=(n_samples, n))
+        last_start = np.maximum.accumulate(np.where(is_start, t, 0), axis=-1)
+        index = np.take_along_axis(start, last_start, axis=-1) + t - last_start
+    return index % n
+
+
 class Return(Metric):
     """
     Evaluate time-series of return.
@@ -84,18 +512,8 @@ class Return(Metric):
     def name(self):
         return "return"
 
-    def _result_from_wealth(self, series_wealth):
-        result = np.diff(series_wealth, prepend=series_wealth[0])
-
-        if self.rate:
-            # TODO raise ValueError if initial budget = 0
-            result /= np.roll(series_wealth, 1)  # array_wealth[0] = 0.0
-
-        return result
-
-    def result(self, strategy):
-        series_wealth = strategy.budget + strategy.wealth.wealth
-        return self._result_from_wealth(series_wealth)
+    def _result_from_context(self, context):
+        return context.returns(rate=self.rate)
 
 
 class AverageReturn(Metric):
@@ -117,22 +535,19 @@ class AverageReturn(Metric):
     def name(self):
         return "average_return"
 
-    def _result_from_wealth(self, series_wealth):
-        n_bars = series_wealth.size
+    def _result_from_context(self, context):
+        series_wealth = context.wealth
+        n_bars = series_wealth.shape[-1]
 
         if self.rate:
-            total_return = series_wealth[-1] / series_wealth[0] - 1
+            total_return = series_wealth[..., -1] / series_wealth[..., 0] - 1
             result = np.exp((self.n / (n_bars - 1)) * np.log(1 + total_return)) - 1.0
         else:
-            total_return = series_wealth[-1] - series_wealth[0]
+            total_return = series_wealth[..., -1] - series_wealth[..., 0]
             result = (self.n / (n_bars - 1)) * total_return
 
         return result
 
-    def result(self, strategy):
-        series_wealth = strategy.wealth.wealth + strategy.budget
-        return self._result_from_wealth(series_wealth)
-
 
 class FinalWealth(Metric):
     """
@@ -153,12 +568,8 @@ class FinalWealth(Metric):
     def name(self):
         return "final_wealth"
 
-    def _result_from_wealth(self, series_wealth):
-        return series_wealth[-1]
-
-    def result(self, strategy):
-        series_wealth = strategy.budget + strategy.wealth.wealth
-        return self._result_from_wealth(series_wealth)
+    def _result_from_context(self, context):
+        return context.wealth[..., -1]
 
 
 class Drawdown(Metric):
@@ -194,18 +605,122 @@ class Drawdown(Metric):
     def name(self):
         return "drawdown"
 
-    def _result_from_wealth(self, series_wealth):
-        cummax = np.maximum.accumulate(series_wealth)
-        result = series_wealth - cummax
+    def _result_from_context(self, context):
+        cummax = context.cummax()
+        result = context.wealth - cummax
 
         if self.rate:
             result /= cummax + EPSILON
 
         return result
 
-    def result(self, strategy):
-        series_wealth = strategy.budget + strategy.wealth.wealth
-        return self._result_from_wealth(series_wealth)
+    def episodes(self, strategy, top=None):
+        """
+        Return drawdown episodes of strategy.
+
+        An episode is a run of bars where wealth is below its running
+        maximum. Runs are detected in a single vectorized pass.
+
+        Parameters
+        ----------
+        - strategy : Strategy
+        - top : int, optional
+            If given, return the `top` deepest episodes
+            sorted in order of depth.
+
+        Returns
+        -------
+        episodes : pandas.DataFrame
+            Episodes in chronological order with columns:
+            - start : index of the peak bar before the episode.
+            - trough : index of the bar with the deepest drawdown.
+            - recovery : index of the bar where wealth recovers the peak.
+              -1 if not recovered yet.
+            - depth : drawdown at the trough. always negative.
+            - duration : number of bars below the peak.
+        """
+        context = EvaluationContext(strategy)
+        episodes = pd.DataFrame(_drawdown_episodes(context.wealth, rate=self.rate))
+        if top is not None:
+            episodes = episodes.sort_values("depth", kind="stable").head(top)
+        return episodes
+
+
+def _drawdown_episodes(series_wealth, rate=False):
+    """
+    Return drawdown episodes of time-series of wealth.
+
+    Returns
+    -------
+    episodes : dict of numpy.array, shape (n_episodes, )
+        See `Drawdown.episodes`.
+
+    Examples
+    --------
+    >>> episodes = _drawdown_episodes(np.array([3, 1, 4, 1, 5, 9, 2, 6]))
+    >>> episodes["start"], episodes["trough"], episodes["recovery"]
+    (array([0, 2, 5]), array([1, 3, 6]), array([ 2,  4, -1]))
+    >>> episodes["depth"], episodes["duration"]
+    (array([-2, -3, -7]), array([1, 1, 2]))
+    """
+    n_bars = series_wealth.shape[0]
+    cummax = np.maximum.accumulate(series_wealth)
+    drawdown = _drawdown(cummax, series_wealth, rate)
+    underwater = series_wealth < cummax
+
+    edge = np.diff(underwater.astype(int), prepend=0, append=0)
+    begin = np.flatnonzero(edge == 1)
+    end = np.flatnonzero(edge == -1)
+
+    if begin.size == 0:
+        depth = np.array([], dtype=drawdown.dtype)
+        trough = np.array([], dtype=int)
+    else:
+        # Bars between episodes have zero drawdown and do not affect minima.
+        depth = np.minimum.reduceat(drawdown, begin)
+        episode = np.cumsum(edge[:-1] == 1) - 1
+        is_trough = np.flatnonzero(underwater & (drawdown == depth[episode]))
+        is_first = np.diff(episode[is_trough], prepend=-1) != 0
+        trough = is_trough[is_first]
+
+    return {
+        "start": begin - 1,
+        "trough": trough,
+        "recovery": np.where(end < n_bars, end, -1),
+        "depth": depth,
+        "duration": end - begin,
+    }
+
+
+class MaxUnderwater(Metric):
+    """
+    Evaluate maximum number of consecutive bars where wealth is
+    below its running maximum.
+
+    Returns
+    -------
+    max_underwater : int
+
+    Examples
+    --------
+    >>> MaxUnderwater().result_from_wealth([3, 1, 4, 1, 2, 3, 5, 9, 2])
+    3
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+    @property
+    def name(self):
+        return "max_underwater"
+
+    def _result_from_context(self, context):
+        series_wealth = context.wealth
+        underwater = series_wealth < context.cummax()
+        t = np.arange(series_wealth.shape[-1])
+        # Length of the run of underwater bars ending at each bar.
+        last_above = np.maximum.accumulate(np.where(underwater, 0, t), axis=-1)
+        return np.max(t - last_above, axis=-1)
 
 
 class MaxDrawdown(Metric):
@@ -233,8 +748,8 @@ class MaxDrawdown(Metric):
     def name(self):
         return "max_drawdown"
 
-    def result(self, strategy):
-        return np.min(Drawdown(rate=self.rate).result(strategy))
+    def _result_from_context(self, context):
+        return np.min(Drawdown(rate=self.rate)._result_from_context(context), axis=-1)
 
 
 class Volatility(Metric):
@@ -264,16 +779,14 @@ class Volatility(Metric):
     def name(self):
         return "volatility"
 
-    def _result_from_wealth(self, series_wealth):
-        series_return = Return(rate=self.rate)._result_from_wealth(series_wealth)
-        result = np.sqrt(self.n) * np.std(series_return[1:], ddof=self.ddof)
+    def _result_from_context(self, context):
+        series_return = context.returns(rate=self.rate)
+        result = np.sqrt(self.n) * np.std(
+            series_return[..., 1:], axis=-1, ddof=self.ddof
+        )
 
         return result
 
-    def result(self, strategy):
-        series_wealth = strategy.wealth.wealth + strategy.budget
-        return self._result_from_wealth(series_wealth)
-
 
 class SharpeRatio(Metric):
     """
@@ -302,10 +815,11 @@ class SharpeRatio(Metric):
     def name(self):
         return "sharpe_ratio"
 
-    def result(self, strategy):
-        average_return = AverageReturn(rate=self.rate, n=self.n).result(strategy)
-        volatility = Volatility(rate=self.rate, n=self.n).result(strategy)
-        volatility = max(volatility, EPSILON)
+    def _result_from_context(self, context):
+        average_return = AverageReturn(rate=self.rate, n=self.n)
+        average_return = average_return._result_from_context(context)
+        volatility = Volatility(rate=self.rate, n=self.n)._result_from_context(context)
+        volatility = np.maximum(volatility, EPSILON)
         result = (average_return - self.risk_free_return) / volatility
         return result
 
@@ -326,8 +840,8 @@ class TradewiseSharpeRatio(Metric):
     def name(self):
         return "tradewise_sharpe_ratio"
 
-    def result(self, strategy):
-        array_pnl = strategy.history.to_dataframe().groupby("trade_id").agg(sum)["pnl"]
+    def _result_from_context(self, context):
+        array_pnl = context.history.to_dataframe().groupby("trade_id").agg(sum)["pnl"]
         avg_pnl = np.mean(array_pnl)
         std_pnl = np.std(array_pnl)  # TODO parameter ddof
         result = avg_pnl / max(std_pnl, EPSILON)
@@ -339,60 +853,515 @@ class Exposure(Metric):
     """
     Evaluate net exposure.
 
+    Exposure is evaluated from positions aggregated into assets,
+    not from exposure of each trade.
+
     Parameters
     ----------
-    - net : bool, default False
+    - net : bool, default True
         If True, evaluate net exposure.
         If False, evaluate absolute exposure.
+    - level : {"order", "asset"}, default "order"
+        Level at which absolute values are taken if `net` is False.
+        If "order", absolute exposure of every order of every trade
+        is summed up. If "asset", long and short positions in the same
+        asset offset each other.
 
     Returns
     -------
     exposure : numpy.array, shape (n_bars, )
     """
 
-    def __init__(self, net=True, **kwargs):
+    def __init__(self, net=True, level="order", **kwargs):
         super().__init__(**kwargs)
+        if level not in ("order", "asset"):
+            raise ValueError(f"Invalid value of level: {level}")
         self.net = net
+        self.level = level
 
     @property
     def name(self):
         return "exposure"
 
-    def result(self, strategy):
-        exposures = (
-            trade.series_exposure(strategy.universe, net=self.net)
-            for trade in strategy.trades
-        )
-        return reduce(np.add, exposures)
+    def _result_from_context(self, context):
+        return context.exposure(net=self.net, level=self.level)
 
 
-# class Beta(Metric):
-#     """
-#     Evaluate beta.
+def _rolling_sum(array, window):
+    """
+    Return sum of `array[..., i - window + 1 : i + 1]` for each i.
+
+    Values are summed up within blocks of `window` elements, and the sum
+    over each window is a suffix sum of a block plus a prefix sum of the next.
+    Unlike differences of a cumulative sum over the whole array, each result
+    carries rounding errors of only the elements in its window.
+
+    Examples
+    --------
+    >>> _rolling_sum(np.array([3.0, 1.0, 4.0, 1.0, 5.0]), 3)
+    array([nan, nan,  8.,  6., 10.])
+    """
+    n = array.shape[-1]
+    result = np.full(array.shape, np.nan)
+    if n < window:
+        return result
+
+    n_blocks = -(-n // window)
+    padding = [(0, 0)] * (array.ndim - 1) + [(0, n_blocks * window - n)]
+    blocks = np.pad(array, padding).reshape(array.shape[:-1] + (n_blocks, window))
+
+    prefix = np.cumsum(blocks, axis=-1).reshape(blocks.shape[:-2] + (-1,))[..., :n]
+    suffix = np.flip(np.cumsum(np.flip(blocks, -1), axis=-1), -1)
+    suffix = suffix.reshape(prefix.shape[:-1] + (-1,))[..., :n]
+
+    begin = np.arange(n - window + 1)
+    # A window from the beginning of a block is the block itself.
+    result[..., window - 1 :] = np.where(
+        begin % window == 0,
+        prefix[..., window - 1 :],
+        suffix[..., : n - window + 1] + prefix[..., window - 1 :],
+    )
+    return result
+
+
+def _drawdown(peak, value, rate):
+    """
+    Return drawdown of value from peak.
+    It is decreasing in peak and increasing in value.
+    """
+    drawdown = value - peak
+    if rate:
+        drawdown /= peak + EPSILON
+    return drawdown
+
+
+def _rolling_max_drawdown(series_wealth, window, rate=False):
+    """
+    Return maximum drawdown of `series_wealth[..., i - window + 1 : i + 1]`.
+
+    Windows are split into the suffix of a block and the prefix of the
+    next block, where blocks have the size of window (van Herk/Gil-Werman).
+    Maximum, minimum and maximum drawdown are accumulated forward within
+    blocks for prefixes and backward for suffixes, and combined,
+    so that the cost is O(n_bars) for any window.
+
+    Examples
+    --------
+    >>> series_wealth = np.array([3.0, 1.0, 4.0, 1.0, 5.0, 9.0, 2.0])
+    >>> _rolling_max_drawdown(series_wealth, 3)
+    array([nan, nan, -2., -3., -3.,  0., -7.])
+    """
+    n_bars = series_wealth.shape[-1]
+    result = np.full(series_wealth.shape, np.nan)
+    if window > n_bars:
+        return result
+
+    n_blocks = -(-n_bars // window)
+    pad = [(0, 0)] * (series_wealth.ndim - 1) + [(0, n_blocks * window - n_bars)]
+    blocks = np.pad(series_wealth, pad, mode="edge")
+    blocks = blocks.reshape(*series_wealth.shape[:-1], n_blocks, window)
 
-#     Parameters
-#     ----------
-#     - benchmark : strategy
-#     - rate : bool
-#     """
+    prefix_max = np.maximum.accumulate(blocks, axis=-1)
+    prefix_min = np.minimum.accumulate(blocks, axis=-1)
+    prefix_mdd = np.minimum.accumulate(_drawdown(prefix_max, blocks, rate), axis=-1)
 
-#     def __init__(self, benchmark, rate=False, **kwargs):
-#         super().__init__(**kwargs)
-#         self.rate = rate
-#         self.benchmark = benchmark
+    reverse = blocks[..., ::-1]
+    suffix_max = np.maximum.accumulate(reverse, axis=-1)[..., ::-1]
+    suffix_min = np.minimum.accumulate(reverse, axis=-1)[..., ::-1]
+    suffix_mdd = _drawdown(blocks, suffix_min, rate)[..., ::-1]
+    suffix_mdd = np.minimum.accumulate(suffix_mdd, axis=-1)[..., ::-1]
 
-#     @property
-#     def name(self):
-#         return "beta"
+    def flat(array):
+        return array.reshape(*series_wealth.shape[:-1], -1)[..., :n_bars]
 
-#     def result(self, strategy):
-#         if not self.benchmark.is_run:
-#             self.benchmark.run(strategy)
+    # Window [begin, end] for end = window - 1, ..., n_bars - 1
+    begin = np.arange(n_bars - window + 1)
+    end = begin + window - 1
+    combined = np.minimum(
+        np.minimum(flat(suffix_mdd)[..., begin], flat(prefix_mdd)[..., end]),
+        _drawdown(flat(suffix_max)[..., begin], flat(prefix_min)[..., end], rate),
+    )
+    # If window is a block itself, prefix and suffix are the same block.
+    result[..., window - 1 :] = np.where(
+        begin % window == 0, flat(suffix_mdd)[..., begin], combined
+    )
 
-#         array_return_s = Return(rate=self.rate).result(strategy)
-#         array_return_b = Return(rate=self.rate).result(benchmark)
-#         cov = np.cov(array_return_s, array_return_b)[0, 1]
-#         var = np.var(array_return_b)
-#         result = cov / var
+    return result
+
+
+class RollingAverageReturn(Metric):
+    """
+    Evaluate average return over a rolling window of bars.
+
+    Parameters
+    ----------
+    - window : int
+        Number of bars in each window.
+    - rate : bool, default False
+    - n : int, default 1
+
+    Returns
+    -------
+    rolling_average_return : numpy.array, shape (n_bars, )
+        Value at bar i is `AverageReturn` for bars from i - window + 1 to i.
+        The first `window - 1` values are nan.
+    """
+
+    def __init__(self, window, rate=False, n=1, **kwargs):
+        super().__init__(**kwargs)
+        if window < 2:
+            raise ValueError("window should be >= 2.")
+        self.window = window
+        self.rate = rate
+        self.n = n
+
+    @property
+    def name(self):
+        return "rolling_average_return"
+
+    def _result_from_context(self, context):
+        series_wealth = context.wealth
+        result = np.full(series_wealth.shape, np.nan)
+        last = series_wealth[..., self.window - 1 :]
+        first = series_wealth[..., : series_wealth.shape[-1] - self.window + 1]
+
+        if self.rate:
+            result[..., self.window - 1 :] = (
+                np.exp((self.n / (self.window - 1)) * np.log(last / first)) - 1.0
+            )
+        else:
+            result[..., self.window - 1 :] = (self.n / (self.window - 1)) * (
+                last - first
+            )
+
+        return result
+
+
+class RollingVolatility(Metric):
+    """
+    Evaluate volatility over a rolling window of bars.
+
+    Parameters
+    ----------
+    - window : int
+        Number of bars in each window.
+    - rate : bool, default False
+    - n : int, default 1
+    - ddof : int, default 0
+
+    Returns
+    -------
+    rolling_volatility : numpy.array, shape (n_bars, )
+        Value at bar i is `Volatility` for bars from i - window + 1 to i.
+        The first `window - 1` values are nan.
+    """
+
+    def __init__(self, window, rate=False, n=1, ddof=0, **kwargs):
+        super().__init__(**kwargs)
+        if window < 2:
+            raise ValueError("window should be >= 2.")
+        self.window = window
+        self.rate = rate
+        self.n = n
+        self.ddof = ddof
+
+    @property
+    def name(self):
+        return "rolling_volatility"
+
+    def _result_from_context(self, context):
+        series_return = context.returns(rate=self.rate).copy()
+        # The first return is not in any window.  Shift by the mean so that
+        # the sums of squares do not lose precision.
+        series_return[..., 0] = 0.0
+        series_return[..., 1:] -= series_return[..., 1:].mean(axis=-1, keepdims=True)
+
+        n_returns = self.window - 1
+        sum_return = _rolling_sum(series_return, n_returns)
+        sum_square = _rolling_sum(series_return ** 2, n_returns)
+        sum_return[..., :n_returns] = np.nan
+
+        sum_deviation = sum_square - sum_return ** 2 / n_returns
+        # Rolling sums are exact only up to this bound in each window.
+        tolerance = 4 * np.finfo(float).eps * n_returns * sum_square
+        sum_deviation[sum_deviation <= tolerance] = 0.0
+
+        variance = sum_deviation / (n_returns - self.ddof)
+        result = np.sqrt(self.n) * np.sqrt(variance)
+
+        return result
+
+
+class RollingSharpeRatio(Metric):
+    """
+    Evaluate Sharpe ratio over a rolling window of bars.
+
+    Parameters
+    ----------
+    - window : int
+        Number of bars in each window.
+    - rate : bool, default False
+    - n : int, default 1
+    - risk_free_return : float, default 0.0
+
+    Returns
+    -------
+    rolling_sharpe_ratio : numpy.array, shape (n_bars, )
+        Value at bar i is `SharpeRatio` for bars from i - window + 1 to i.
+        The first `window - 1` values are nan.
+    """
+
+    def __init__(self, window, rate=False, n=1, risk_free_return=0.0, **kwargs):
+        super().__init__(**kwargs)
+        if window < 2:
+            raise ValueError("window should be >= 2.")
+        self.window = window
+        self.rate = rate
+        self.n = n
+        self.risk_free_return = risk_free_return
+
+    @property
+    def name(self):
+        return "rolling_sharpe_ratio"
+
+    def _result_from_context(self, context):
+        params = dict(window=self.window, rate=self.rate, n=self.n)
+        average_return = RollingAverageReturn(**params)._result_from_context(context)
+        volatility = RollingVolatility(**params)._result_from_context(context)
+        volatility = np.maximum(volatility, EPSILON)
+        result = (average_return - self.risk_free_return) / volatility
+        return result
+
+
+class RollingMaxDrawdown(Metric):
+    """
+    Evaluate maximum drawdown over a rolling window of bars.
+
+    Parameters
+    ----------
+    - window : int
+        Number of bars in each window.
+    - rate : bool, default False
+
+    Returns
+    -------
+    rolling_max_drawdown : numpy.array, shape (n_bars, )
+        Value at bar i is `MaxDrawdown` for bars from i - window + 1 to i.
+        The first `window - 1` values are nan.
+    """
+
+    def __init__(self, window, rate=False, **kwargs):
+        super().__init__(**kwargs)
+        if window < 2:
+            raise ValueError("window should be >= 2.")
+        self.window = window
+        self.rate = rate
+
+    @property
+    def name(self):
+        return "rolling_max_drawdown"
+
+    def _result_from_context(self, context):
+        return _rolling_max_drawdown(context.wealth, self.window, rate=self.rate)
+
+
+# Wealth of benchmark strategies for each universe, benchmark and budget.
+# Only arrays of wealth are stored, so that entries are discarded
+# together with universes or benchmarks.
+_benchmark_wealth = WeakKeyDictionary()
+
+
+class _BenchmarkMetric(Metric):
+    """
+    Base class of metrics relative to a benchmark.
+
+    Parameters
+    ----------
+    - benchmark : array-like or Strategy
+        If array-like, time-series of wealth of the benchmark,
+        including budget, with shape (n_bars, ).
+        If Strategy, e.g. `epymetheus.benchmarks.BuyAndHold`,
+        it is run with the universe and the budget of the evaluated strategy
+        once per universe and budget, and its wealth is reused afterwards.
+    - rate : bool, default False
+        If True, use rates of return.
+    - n : int, default 1
+        E.g. n = 365 (calendar days) for annual values.
+    """
+
+    def __init__(self, benchmark, rate=False, n=1, **kwargs):
+        super().__init__(**kwargs)
+        if not hasattr(benchmark, "run"):
+            benchmark = np.asarray(benchmark, dtype=float)
+        self.benchmark = benchmark
+        self.rate = rate
+        self.n = n
+
+    def _get_benchmark_wealth(self, context):
+        if isinstance(self.benchmark, np.ndarray):
+            wealth = self.benchmark
+        else:
+            if context.strategy is None:
+                raise ValueError("Context is not initialized from a strategy.")
+            universe = context.strategy.universe
+            budget = context.strategy.budget
+            cache = _benchmark_wealth.setdefault(universe, WeakKeyDictionary())
+            cache = cache.setdefault(self.benchmark, {})
+            if budget not in cache:
+                # Run a copy so that self.benchmark does not keep the universe alive.
+                benchmark = copy(self.benchmark).run(
+                    universe, budget=budget, verbose=False
+                )
+                cache[budget] = budget + benchmark.wealth.wealth
+            wealth = cache[budget]
+
+        if wealth.shape != context.wealth.shape[-1:]:
+            raise ValueError("Benchmark wealth should have the same n_bars.")
+        return wealth
+
+    def _moments(self, context):
+        return context.moments(self._get_benchmark_wealth(context), rate=self.rate)
+
+
+class Beta(_BenchmarkMetric):
+    """
+    Evaluate beta to benchmark.
+
+    Parameters
+    ----------
+    - benchmark : array-like or Strategy
+    - rate : bool, default False
+
+    Returns
+    -------
+    beta : float
+
+    Examples
+    --------
+    >>> benchmark = np.array([3.0, 1.0, 4.0, 1.0, 5.0])
+    >>> Beta(benchmark).result_from_wealth(2 * benchmark)
+    2.0
+    """
+
+    @property
+    def name(self):
+        return "beta"
+
+    def _result_from_context(self, context):
+        moments = self._moments(context)
+        return moments["cov"] / np.maximum(moments["var_benchmark"], EPSILON)
+
+
+class Alpha(_BenchmarkMetric):
+    """
+    Evaluate average return in excess of beta times benchmark return.
+
+    Parameters
+    ----------
+    - benchmark : array-like or Strategy
+    - rate : bool, default False
+    - n : int, default 1
+
+    Returns
+    -------
+    alpha : float
+
+    Examples
+    --------
+    >>> benchmark = np.array([3.0, 1.0, 4.0, 1.0, 5.0])
+    >>> Alpha(benchmark).result_from_wealth(benchmark + np.arange(5))
+    1.0
+    """
+
+    @property
+    def name(self):
+        return "alpha"
+
+    def _result_from_context(self, context):
+        moments = self._moments(context)
+        beta = moments["cov"] / np.maximum(moments["var_benchmark"], EPSILON)
+        return self.n * (moments["mean"] - beta * moments["mean_benchmark"])
+
+
+class TrackingError(_BenchmarkMetric):
+    """
+    Evaluate standard deviation of returns in excess of benchmark.
+
+    Parameters
+    ----------
+    - benchmark : array-like or Strategy
+    - rate : bool, default False
+    - n : int, default 1
+
+    Returns
+    -------
+    tracking_error : float
+    """
+
+    @property
+    def name(self):
+        return "tracking_error"
+
+    def _result_from_context(self, context):
+        moments = self._moments(context)
+        var = moments["var"] + moments["var_benchmark"] - 2 * moments["cov"]
+        return np.sqrt(self.n * np.maximum(var, 0.0))
+
+
+class InformationRatio(_BenchmarkMetric):
+    """
+    Evaluate average return in excess of benchmark
+    divided by tracking error.
+
+    Parameters
+    ----------
+    - benchmark : array-like or Strategy
+    - rate : bool, default False
+    - n : int, default 1
+
+    Returns
+    -------
+    information_ratio : float
+    """
+
+    @property
+    def name(self):
+        return "information_ratio"
+
+    def _result_from_context(self, context):
+        moments = self._moments(context)
+        tracking_error = TrackingError(
+            self.benchmark, rate=self.rate, n=self.n
+        )._result_from_context(context)
+        excess_return = self.n * (moments["mean"] - moments["mean_benchmark"])
+        return excess_return / np.maximum(tracking_error, EPSILON)
+
+
+class Correlation(_BenchmarkMetric):
+    """
+    Evaluate correlation of returns with benchmark.
+
+    Parameters
+    ----------
+    - benchmark : array-like or Strategy
+    - rate : bool, default False
+
+    Returns
+    -------
+    correlation : float
+
+    Examples
+    --------
+    >>> benchmark = np.array([3.0, 1.0, 4.0, 1.0, 5.0])
+    >>> Correlation(benchmark).result_from_wealth(-benchmark)
+    -1.0
+    """
+
+    @property
+    def name(self):
+        return "correlation"
 
-#         return result
+    def _result_from_context(self, context):
+        moments = self._moments(context)
+        std = np.sqrt(moments["var"] * moments["var_benchmark"])
+        return moments["cov"] / np.maximum(std, EPSILON)
@@ -0,0 +1,348 @@
+from abc import ABCMeta
+from abc import abstractmethod
+from copy import deepcopy
+
+import numpy as np
+
+from epymetheus.utils.constants import EPSILON
+
+from .metrics import _drawdown
+
+
+class OnlineMetric(metaclass=ABCMeta):
+    """
+    Base class of metric which keeps O(1) state of wealth seen so far.
+
+    State is updated by bars of wealth in chronological order, and
+    states of consecutive shards can be merged.
+
+    Abstractmethod
+    --------------
+    - name
+        Name of the metric.
+    - _update
+        Update state by following bars.
+    - _merge
+        Merge state of a following shard.
+    - result
+        Evaluate metric from state.
+
+    Attributes
+    ----------
+    - n_bars : int
+        Number of bars seen so far.
+    - first : float or None
+        Wealth at the first bar.
+    - last : float or None
+        Wealth at the last bar.
+    """
+
+    def __init__(self):
+        self.n_bars = 0
+        self.first = None
+        self.last = None
+
+    @property
+    @abstractmethod
+    def name(self):
+        """
+        Return name of self.
+        """
+
+    @abstractmethod
+    def _update(self, series_wealth):
+        """
+        Update state by bars which follow bars seen so far.
+        It is called before `n_bars`, `first` and `last` are updated.
+
+        Parameters
+        ----------
+        - series_wealth : numpy.array, shape (n, )
+        """
+
+    @abstractmethod
+    def _merge(self, other):
+        """
+        Merge state of other whose bars follow bars of self.
+        It is called before `n_bars`, `first` and `last` are updated.
+
+        Parameters
+        ----------
+        - other : OnlineMetric
+        """
+
+    @abstractmethod
+    def result(self):
+        """
+        Evaluate metric of bars seen so far.
+        """
+
+    def update(self, wealth):
+        """
+        Update state by wealth at following bar(s).
+
+        Parameters
+        ----------
+        - wealth : float or array-like, shape (n, )
+            Wealth including budget in chronological order.
+
+        Returns
+        -------
+        self
+        """
+        series_wealth = np.asarray(wealth, dtype=float).reshape(-1)
+        if series_wealth.size == 0:
+            return self
+
+        self._update(series_wealth)
+
+        if self.n_bars == 0:
+            self.first = series_wealth[0]
+        self.last = series_wealth[-1]
+        self.n_bars += series_wealth.size
+
+        return self
+
+    def merge(self, other):
+        """
+        Merge state of other whose bars follow bars of self.
+
+        Parameters
+        ----------
+        - other : OnlineMetric
+            Metric of the same class and parameters.
+
+        Returns
+        -------
+        self
+        """
+        if other.__class__ is not self.__class__:
+            raise ValueError("Cannot merge metrics of different classes.")
+        if other.n_bars == 0:
+            return self
+        if self.n_bars == 0:
+            self.__dict__.update(deepcopy(other.__dict__))
+            return self
+
+        self._merge(other)
+
+        self.last = other.last
+        self.n_bars += other.n_bars
+
+        return self
+
+
+class OnlineFinalWealth(OnlineMetric):
+    """
+    Evaluate final wealth online.
+
+    Examples
+    --------
+    >>> m = OnlineFinalWealth()
+    >>> m.update(1.0).update([2.0, 3.0]).result()
+    3.0
+    """
+
+    @property
+    def name(self):
+        return "online_final_wealth"
+
+    def _update(self, series_wealth):
+        pass
+
+    def _merge(self, other):
+        pass
+
+    def result(self):
+        return self.last
+
+
+class OnlineVolatility(OnlineMetric):
+    """
+    Evaluate volatility online with Welford's algorithm.
+
+    Parameters
+    ----------
+    - rate : bool, default False
+    - n : int, default 1
+    - ddof : int, default 0
+
+    Examples
+    --------
+    >>> m = OnlineVolatility()
+    >>> for wealth in [3, 1, 4, 1, 4, 9, 2]:
+    ...     _ = m.update(wealth)
+    >>> np.isclose(m.result(), np.std([-2, 3, -3, 3, 5, -7]))
+    True
+    """
+
+    def __init__(self, rate=False, n=1, ddof=0):
+        super().__init__()
+        self.rate = rate
+        self.n = n
+        self.ddof = ddof
+        # Number, mean and sum of squared deviations of returns
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    @property
+    def name(self):
+        return "online_volatility"
+
+    def _return(self, wealth_from, wealth_to):
+        result = wealth_to - wealth_from
+        if self.rate:
+            result /= wealth_from
+        return result
+
+    def _add_returns(self, count, mean, m2):
+        """
+        Merge statistics of returns by Chan's parallel algorithm.
+        """
+        total = self.count + count
+        if total == 0:
+            return
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta ** 2 * self.count * count / total
+        self.count = total
+
+    def _update(self, series_wealth):
+        if self.last is not None:
+            series_wealth = np.concatenate([[self.last], series_wealth])
+        series_return = self._return(series_wealth[:-1], series_wealth[1:])
+        if series_return.size > 0:
+            mean = series_return.mean()
+            m2 = ((series_return - mean) ** 2).sum()
+            self._add_returns(series_return.size, mean, m2)
+
+    def _merge(self, other):
+        self._add_returns(1, self._return(self.last, other.first), 0.0)
+        self._add_returns(other.count, other.mean, other.m2)
+
+    def result(self):
+        return np.sqrt(self.n) * np.sqrt(self.m2 / (self.count - self.ddof))
+
+
+class OnlineSharpeRatio(OnlineVolatility):
+    """
+    Evaluate Sharpe ratio online.
+
+    Parameters
+    ----------
+    - rate : bool, default False
+    - n : int, default 1
+    - risk_free_return : float, default 0.0
+
+    Examples
+    --------
+    >>> from epymetheus.metrics import SharpeRatio
+    >>> series_wealth = np.array([3, 1, 4, 1, 5, 9, 2], dtype=float)
+    >>> m0 = OnlineSharpeRatio().update(series_wealth[:3])
+    >>> m1 = OnlineSharpeRatio().update(series_wealth[3:])
+    >>> result = m0.merge(m1).result()
+    >>> np.isclose(result, SharpeRatio()._result_from_wealth(series_wealth))
+    True
+    """
+
+    def __init__(self, rate=False, n=1, risk_free_return=0.0):
+        super().__init__(rate=rate, n=n)
+        self.risk_free_return = risk_free_return
+
+    @property
+    def name(self):
+        return "online_sharpe_ratio"
+
+    def result(self):
+        if self.rate:
+            total_return = self.last / self.first - 1
+            average_return = (
+                np.exp((self.n / (self.n_bars - 1)) * np.log(1 + total_return)) - 1.0
+            )
+        else:
+            total_return = self.last - self.first
+            average_return = (self.n / (self.n_bars - 1)) * total_return
+
+        volatility = max(super().result(), EPSILON)
+        return (average_return - self.risk_free_return) / volatility
+
+
+class OnlineDrawdown(OnlineMetric):
+    """
+    Evaluate drawdown at the last bar online.
+
+    Parameters
+    ----------
+    - rate : bool, default False
+
+    Attributes
+    ----------
+    - peak : float
+        Maximum wealth.
+    - trough : float
+        Minimum wealth.
+    - max_drawdown : float
+        Maximum drawdown.
+
+    Examples
+    --------
+    >>> m = OnlineDrawdown().update([3, 1, 4, 1, 5, 9, 2])
+    >>> m.result()
+    -7.0
+    >>> m.max_drawdown
+    -7.0
+    """
+
+    def __init__(self, rate=False):
+        super().__init__()
+        self.rate = rate
+        self.peak = -np.inf
+        self.trough = np.inf
+        self.max_drawdown = 0.0
+
+    @property
+    def name(self):
+        return "online_drawdown"
+
+    def _update(self, series_wealth):
+        cummax = np.maximum(np.maximum.accumulate(series_wealth), self.peak)
+        drawdown = _drawdown(cummax, series_wealth, self.rate)
+        self.max_drawdown = min(self.max_drawdown, drawdown.min())
+        self.peak = cummax[-1]
+        self.trough = min(self.trough, series_wealth.min())
+
+    def _merge(self, other):
+        self.max_drawdown = min(
+            self.max_drawdown,
+            other.max_drawdown,
+            _drawdown(self.peak, other.trough, self.rate),
+        )
+        self.peak = max(self.peak, other.peak)
+        self.trough = min(self.trough, other.trough)
+
+    def result(self):
+        return _drawdown(self.peak, self.last, self.rate)
+
+
+class OnlineMaxDrawdown(OnlineDrawdown):
+    """
+    Evaluate maximum drawdown online.
+
+    Parameters
+    ----------
+    - rate : bool, default False
+
+    Examples
+    --------
+    >>> m = OnlineMaxDrawdown().update([3, 1, 4, 1, 5, 9, 2]).update(12.0)
+    >>> m.result()
+    -7.0
+    """
+
+    @property
+    def name(self):
+        return "online_max_drawdown"
+
+    def result(self):
+        return self.max_drawdown
@@ -3,9 +3,13 @@ from abc import abstractmethod
 from inspect import cleandoc
 from time import time
 
+import numpy as np
+
 from epymetheus.exceptions import NoTradeError
 from epymetheus.exceptions import NotRunError
 from epymetheus.history import History
+from epymetheus.metrics import EvaluationContext
+from epymetheus.metrics import _metric_from_name
 from epymetheus.wealth import Wealth
 
 
@@ -32,6 +36,8 @@ class Strategy(metaclass=ABCMeta):
     - history : History
     - transaction : Transaction
     - wealth : Wealth
+    - metric_results : list
+        Values of `metrics` given to `run`, in the same order.
 
     Examples
     --------
@@ -146,7 +152,12 @@ class Strategy(metaclass=ABCMeta):
 
     @property
     def wealth(self):
-        return Wealth(strategy=self)
+        # Computed once per run and shared with metrics.
+        if getattr(self, "_wealth", None) is None:
+            wealth = Wealth(strategy=self)
+            wealth.wealth.setflags(write=False)
+            self._wealth = wealth
+        return self._wealth
 
     def run(self, universe, metrics=[], budget=0.0, verbose=True):
         """
@@ -156,8 +167,11 @@ class Strategy(metaclass=ABCMeta):
         ----------
         - universe : Universe
             Universe with which self is run.
-        - metrics : List[metrics]
+        - metrics : List[Metric or str]
             List of metrics to be evaluated for the strategy during running.
+            Wealth is computed once after trades are executed, kept as
+            `self.wealth` and shared among the metrics.
+            Results are set to `self.metric_results`.
             See epymetheus.metrics.
         - budget : float, default 0.0
             Initial budget.
@@ -175,11 +189,16 @@ class Strategy(metaclass=ABCMeta):
             print("Running ... ")
 
         self.universe = universe
+        self._n_runs = getattr(self, "_n_runs", 0) + 1
+        self._metric_cache = {}
+        self._wealth = None
         self.__generate_trades(universe=universe, verbose=verbose)
         self.__execute_trades(universe=universe, verbose=verbose)
 
         self._is_run = True
 
+        self.__evaluate_metrics(verbose=verbose)
+
         if verbose:
             print(f"Done. (Runtime : {time() - begin_time:.2f} sec)")
 
@@ -228,6 +247,10 @@ class Strategy(metaclass=ABCMeta):
         """
         Execute trades.
 
+        Parameters
+        ----------
+        - verbose : bool
+
         Returns
         -------
         self : Strategy
@@ -244,15 +267,99 @@ class Strategy(metaclass=ABCMeta):
 
         return self
 
+    def __evaluate_metrics(self, verbose=True):
+        """
+        Evaluate `self.metrics` and set `self.metric_results`.
+
+        Parameters
+        ----------
+        - verbose : bool
+
+        Returns
+        -------
+        self : Strategy
+        """
+        if not self.metrics:
+            self.metric_results = []
+            return self
+
+        if verbose:
+            begin_time = time()
+            print("Evaluating metrics ... ", end="")
+
+        context = EvaluationContext(self)
+        self.metric_results = [
+            self.__evaluate_cached(metric, context) for metric in self.metrics
+        ]
+
+        if verbose:
+            print(f"Done. (Runtime : {time() - begin_time:.2f} sec)")
+
+        return self
+
     def evaluate(self, metric):
         """
         Returns the value of a metric of self.
 
+        Results are cached for the run, keyed by the class and
+        parameters of the metric, and discarded when self is run again.
+
         Parameters
         ----------
-        - metric : Metric or str
-            Metric to evaluate.
+        - metric : Metric or str, or list of them
+            Metric(s) to evaluate.
+            Intermediates such as wealth are computed once
+            and shared among the metrics in a list.
+
+        Returns
+        -------
+        result : object or list
+            Value of the metric.
+            List of values if a list of metrics is given.
         """
         if not self.is_run:
             raise NotRunError("Strategy has not been run")
-        return metric.result(self)
+
+        context = EvaluationContext(self)
+
+        if isinstance(metric, (list, tuple)):
+            return [self.__evaluate_cached(m, context) for m in metric]
+        return self.__evaluate_cached(metric, context)
+
+    def __evaluate_cached(self, metric, context):
+        if isinstance(metric, str):
+            metric = _metric_from_name(metric)
+
+        key = self.__metric_key(metric)
+        if key is None:
+            return self.__evaluate(metric, context)
+
+        cache = self.__dict__.setdefault("_metric_cache", {})
+        if key not in cache:
+            cache[key] = self.__evaluate(metric, context)
+        result = cache[key]
+        # Return a copy so that changing the result does not corrupt the cache.
+        return result.copy() if isinstance(result, np.ndarray) else result
+
+    def __metric_key(self, metric):
+        """
+        Return key of metric result for the current run.
+        None if parameters of the metric are not hashable.
+        """
+        key = (
+            getattr(self, "_n_runs", 0),
+            self.budget,
+            metric.__class__,
+            tuple(sorted(vars(metric).items())),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    @staticmethod
+    def __evaluate(metric, context):
+        if isinstance(metric, str):
+            metric = _metric_from_name(metric)
+        return metric._result_from_context(context)
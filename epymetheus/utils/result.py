@@ -19,6 +19,36 @@ class TradeResult(Bunch):
         else:
             super().__init__(**kwargs)
 
+    def __setitem__(self, key, value):
+        self._clear_cache()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._clear_cache()
+        super().__delitem__(key)
+
+    def _cached(self, key, func):
+        """
+        Return `func()` computed once and reused until self changes.
+
+        The cache lives in the instance `__dict__` so that it does not
+        appear as an item of self.
+
+        Parameters
+        ----------
+        - key : hashable
+            Key of the cached value.
+        - func : callable
+            Callable with no argument to compute the value.
+        """
+        cache = self.__dict__.setdefault("_cache", {})
+        if key not in cache:
+            cache[key] = func()
+        return cache[key]
+
+    def _clear_cache(self):
+        self.__dict__.pop("_cache", None)
+
     @classmethod
     @abstractmethod
     def from_strategy(cls, strategy, verbose):
@@ -1,3 +1,4 @@
 # flake8: noqa
 
 from .wealth import Wealth
+from .wealth import WealthAccumulator
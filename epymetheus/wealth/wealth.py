@@ -1,11 +1,239 @@
-from functools import reduce
-
 import numpy as np
 import pandas as pd
 
+from epymetheus.trade import Trade
 from epymetheus.utils import TradeResult
 
 
+def _get_orders(universe, trades):
+    """
+    Return executed orders of trades as arrays.
+
+    Bars that are not in the universe are regarded as the last bar,
+    consistently with `Trade.array_pnl`.
+
+    Parameters
+    ----------
+    - universe : Universe
+    - trades : iterable of Trade
+
+    Returns
+    -------
+    asset_index : numpy.array, shape (n_orders, )
+    lot : numpy.array, shape (n_orders, )
+    open_index : numpy.array, shape (n_orders, )
+    close_index : numpy.array, shape (n_orders, )
+    """
+    trades = list(trades)
+    if len(trades) == 0:
+        empty = np.array([], dtype=int)
+        return empty, empty.astype(float), empty, empty
+
+    n_orders = [trade.n_orders for trade in trades]
+
+    asset_index = universe.get_asset_indexer(
+        np.concatenate([trade.array_asset for trade in trades])
+    )
+    lot = np.concatenate([trade.array_lot for trade in trades])
+    open_index = universe.get_bar_indexer(
+        np.array([trade.open_bar for trade in trades], dtype=object)
+    )
+    close_index = universe.get_bar_indexer(
+        np.array([trade.close_bar for trade in trades], dtype=object)
+    )
+    open_index %= universe.n_bars
+    close_index = np.maximum(close_index % universe.n_bars, open_index)
+
+    return (
+        asset_index,
+        lot.astype(float),
+        np.repeat(open_index, n_orders),
+        np.repeat(close_index, n_orders),
+    )
+
+
+def _get_position(shape, column, lot, begin_index, end_index):
+    """
+    Return lot held in each bar and column.
+
+    Parameters
+    ----------
+    - shape : tuple (n_bars, n_columns)
+    - column : numpy.array, shape (n_orders, )
+        Column of each order.
+    - lot : numpy.array, shape (n_orders, )
+    - begin_index, end_index : numpy.array, shape (n_orders, )
+        Each order is held in bars `begin_index <= i < end_index`.
+        `end_index` may be n_bars.
+
+    Returns
+    -------
+    position : numpy.array, shape (n_bars, n_columns)
+
+    Examples
+    --------
+    >>> _get_position(
+    ...     (4, 2),
+    ...     column=np.array([0, 1, 0]),
+    ...     lot=np.array([1.0, 2.0, -3.0]),
+    ...     begin_index=np.array([0, 1, 2]),
+    ...     end_index=np.array([2, 4, 3]),
+    ... )
+    array([[ 1.,  0.],
+           [ 1.,  2.],
+           [-3.,  2.],
+           [ 0.,  2.]])
+    """
+    n_bars, n_columns = shape
+    position = np.zeros((n_bars + 1, n_columns), dtype=float)
+    np.add.at(position, (begin_index, column), lot)
+    np.add.at(position, (end_index, column), -lot)
+    return np.cumsum(position[:-1], axis=0)
+
+
+def _get_increment(universe, orders, assets=None):
+    """
+    Return profit-loss from the previous bar for each asset.
+
+    Lots of all orders are scattered onto a (n_bars, n_assets) array
+    and accumulated into positions, so that the cost is
+    O(n_orders + n_bars * n_assets) rather than O(n_trades * n_bars).
+
+    Parameters
+    ----------
+    - universe : Universe
+    - orders : tuple of numpy.array
+        Output of `_get_orders`.
+    - assets : array-like, optional
+        Assets to evaluate. If None, all assets in the universe.
+
+    Returns
+    -------
+    increment : numpy.array, shape (n_bars, n_assets)
+    """
+    asset_index, lot, open_index, close_index = orders
+
+    if assets is None:
+        column = asset_index
+        prices = universe.prices.values
+    else:
+        selected = universe.get_asset_indexer(assets)
+        column_of_asset = np.full(universe.n_assets, -1)
+        column_of_asset[selected] = np.arange(selected.size)
+        column = column_of_asset[asset_index]
+        is_selected = column != -1
+        column = column[is_selected]
+        lot = lot[is_selected]
+        open_index = open_index[is_selected]
+        close_index = close_index[is_selected]
+        prices = universe.prices.iloc[:, selected].values
+
+    # position[i, j] : lot of asset j held from bar i to bar i + 1
+    position = _get_position(prices.shape, column, lot, open_index, close_index)
+
+    increment = np.zeros(prices.shape, dtype=float)
+    increment[1:] = position[:-1] * np.diff(prices, axis=0)
+
+    return increment
+
+
+def _get_windows(open_index, close_index):
+    """
+    Enumerate bars in the window `(open_index, close_index]` of each order.
+
+    Returns
+    -------
+    order : numpy.array, shape (n_pairs, )
+        Index of order.
+    bar_index : numpy.array, shape (n_pairs, )
+        Index of bar.
+
+    Examples
+    --------
+    >>> _get_windows(np.array([0, 2]), np.array([2, 5]))
+    (array([0, 0, 1, 1, 1]), array([1, 2, 3, 4, 5]))
+    """
+    length = close_index - open_index
+    order = np.repeat(np.arange(length.size), length)
+    offset = np.arange(order.size) - np.repeat(np.cumsum(length) - length, length)
+    return order, open_index[order] + 1 + offset
+
+
+def _get_total_increment(universe, orders):
+    """
+    Return profit-loss of all orders from the previous bar.
+
+    Only assets which are traded are evaluated.
+    Bars in the windows of orders are enumerated if they are fewer than
+    the (n_bars, n_traded_assets) array to scatter lots onto,
+    so that a few short trades cost O(total window length)
+    and many trades cost O(n_orders + n_bars * n_traded_assets).
+
+    Parameters
+    ----------
+    - universe : Universe
+    - orders : tuple of numpy.array
+        Output of `_get_orders`.
+
+    Returns
+    -------
+    increment : numpy.array, shape (n_bars, )
+    """
+    asset_index, lot, open_index, close_index = orders
+    traded, column = np.unique(asset_index, return_inverse=True)
+
+    if np.sum(close_index - open_index) < universe.n_bars * traded.size:
+        prices = universe.prices.values
+        order, bar_index = _get_windows(open_index, close_index)
+        asset = asset_index[order]
+        data = lot[order] * (prices[bar_index, asset] - prices[bar_index - 1, asset])
+        return np.bincount(bar_index, weights=data, minlength=universe.n_bars)
+
+    prices = universe.prices.iloc[:, traded].values
+    position = _get_position(prices.shape, column, lot, open_index, close_index)
+    increment = np.zeros(universe.n_bars, dtype=float)
+    increment[1:] = np.einsum("ij,ij->i", position[:-1], np.diff(prices, axis=0))
+    return increment
+
+
+def _get_bucket_begin(bars, rule):
+    """
+    Return indices of the first bar of each bucket of bars.
+
+    Parameters
+    ----------
+    - bars : array-like, shape (n_bars, )
+    - rule : int or str
+        If int, number of bars in each bucket.
+        If str, frequency alias of pandas such as "M" or "15min".
+        Then bars should be datetimes, and buckets are the non-empty
+        bins of `pandas.Series.resample`.
+
+    Returns
+    -------
+    bucket_begin : numpy.array, shape (n_buckets, )
+
+    Examples
+    --------
+    >>> _get_bucket_begin(np.arange(7), 3)
+    array([0, 3, 6])
+    >>> bars = pd.date_range("2000-01-30", periods=4)
+    >>> _get_bucket_begin(bars, "M")
+    array([0, 2])
+    >>> bars = pd.date_range("2000-01-01", periods=12, freq="min")
+    >>> _get_bucket_begin(bars, "5min")
+    array([ 0,  5, 10])
+    """
+    if isinstance(rule, (int, np.integer)):
+        return np.arange(0, len(bars), rule)
+    if not isinstance(bars, pd.DatetimeIndex):
+        raise ValueError("Bars should be datetimes to resample by frequency.")
+    # Bins of resample respect multiples of frequencies such as "2W",
+    # which are dropped by `to_period`.
+    position = pd.Series(np.arange(len(bars)), index=bars).resample(rule).first()
+    return position.dropna().to_numpy().astype(int)
+
+
 class Wealth(TradeResult):
     """
     Represent time-series of wealth.
@@ -18,6 +246,11 @@ class Wealth(TradeResult):
         Time-series of wealth.
     """
 
+    def __init__(self, strategy=None, **kwargs):
+        super().__init__(strategy=strategy, **kwargs)
+        # Kept out of the items of self; used to decompose wealth.
+        self.__dict__["_strategy"] = strategy
+
     @classmethod
     def from_strategy(cls, strategy):
         """
@@ -39,10 +272,272 @@ class Wealth(TradeResult):
 
     @staticmethod
     def _get_wealth(strategy):
-        return reduce(
-            np.add, (trade.series_pnl(strategy.universe) for trade in strategy.trades)
+        return WealthAccumulator(strategy.universe).add(strategy.trades).wealth
+
+    @staticmethod
+    def _get_pnl_by_asset(strategy, assets=None):
+        """
+        Return time-series of profit-loss for each asset.
+
+        Parameters
+        ----------
+        - strategy : Strategy
+        - assets : array-like, optional
+            Assets to evaluate. If None, all assets in the universe.
+
+        Returns
+        -------
+        pnl : numpy.array, shape (n_bars, n_assets)
+        """
+        orders = _get_orders(strategy.universe, strategy.trades)
+        increment = _get_increment(strategy.universe, orders, assets=assets)
+        return np.cumsum(increment, axis=0)
+
+    def by_asset(self, assets=None):
+        """
+        Return time-series of profit-loss decomposed into assets.
+
+        It is evaluated by scattering the same orders that make up `self.wealth`,
+        so that `self.by_asset().sum(axis=1)` equals `self.wealth`.
+        Unlike `self.wealth`, it builds a dense (n_bars, n_assets) array.
+
+        Parameters
+        ----------
+        - assets : array-like, optional
+            Assets to evaluate. If None, all assets in the universe.
+            Give a subset to bound memory for a large universe.
+
+        Returns
+        -------
+        pnl : numpy.array, shape (n_bars, n_assets)
+            Columns are in the order of `assets`.
+
+        Examples
+        --------
+        >>> import pandas as pd
+        >>> from epymetheus import Trade, Universe
+        >>> from epymetheus.benchmarks import DeterminedTrader
+        >>> universe = Universe(pd.DataFrame({
+        ...     "A0": [1, 2, 3, 4, 5],
+        ...     "A1": [2, 3, 4, 5, 6],
+        ...     "A2": [3, 4, 5, 6, 7],
+        ... }, dtype=float))
+        >>> trades = [
+        ...     Trade(asset=["A0", "A2"], lot=[2, -3], open_bar=1, shut_bar=3),
+        ...     Trade(asset="A0", lot=1, open_bar=2, shut_bar=4),
+        ... ]
+        >>> strategy = DeterminedTrader(trades).run(universe, verbose=False)
+        >>> wealth = strategy.wealth
+        >>> wealth.by_asset()
+        array([[ 0.,  0.,  0.],
+               [ 0.,  0.,  0.],
+               [ 2.,  0., -3.],
+               [ 5.,  0., -6.],
+               [ 6.,  0., -6.]])
+        >>> wealth.by_asset(["A2"])
+        array([[ 0.],
+               [ 0.],
+               [-3.],
+               [-6.],
+               [-6.]])
+        """
+        if self._strategy is None:
+            raise ValueError("Wealth is not initialized from a strategy.")
+        return self._get_pnl_by_asset(self._strategy, assets=assets)
+
+    @staticmethod
+    def _get_contributions(strategy):
+        """
+        Return incremental profit-loss of each trade as a sparse matrix.
+
+        Returns
+        -------
+        contributions : scipy.sparse.csr_matrix, shape (n_trades, n_bars)
+        """
+        try:
+            from scipy.sparse import csr_matrix
+        except ImportError as e:
+            raise ImportError(
+                "Wealth.contributions requires scipy. "
+                "Install it by `pip install epymetheus[sparse]`."
+            ) from e
+
+        universe = strategy.universe
+        orders = _get_orders(universe, strategy.trades)
+        asset_index, lot, open_index, close_index = orders
+        trade_id = np.repeat(
+            np.arange(strategy.n_trades), [trade.n_orders for trade in strategy.trades]
+        )
+
+        order, bar_index = _get_windows(open_index, close_index)
+
+        prices = universe.prices.values
+        column = asset_index[order]
+        data = lot[order] * (prices[bar_index, column] - prices[bar_index - 1, column])
+
+        # Duplicate entries from orders in the same trade are summed up.
+        return csr_matrix(
+            (data, (trade_id[order], bar_index)),
+            shape=(strategy.n_trades, universe.n_bars),
+        )
+
+    def contributions(self):
+        """
+        Return incremental profit-loss of each trade within its active window.
+
+        The matrix is built once from the executed trades and cached.
+        Aggregations are then sparse matrix-vector products; for instance,
+        `np.cumsum(weight @ wealth.contributions())` is the wealth of the
+        portfolio which holds each trade with the given weight.
+        Requires scipy, which is installed by `pip install epymetheus[sparse]`.
+
+        Returns
+        -------
+        contributions : scipy.sparse.csr_matrix, shape (n_trades, n_bars)
+            Element (i, j) is the profit-loss of the i-th trade
+            from bar j - 1 to bar j.
+
+        Examples
+        --------
+        >>> import pandas as pd
+        >>> from epymetheus import Trade, Universe
+        >>> from epymetheus.benchmarks import DeterminedTrader
+        >>> universe = Universe(pd.DataFrame({
+        ...     "A0": [1, 2, 3, 4, 5],
+        ...     "A1": [2, 3, 4, 5, 6],
+        ...     "A2": [3, 4, 5, 6, 7],
+        ... }, dtype=float))
+        >>> trades = [
+        ...     Trade(asset=["A0", "A2"], lot=[2, -3], open_bar=1, shut_bar=3),
+        ...     Trade(asset="A0", lot=1, open_bar=2, shut_bar=4),
+        ... ]
+        >>> strategy = DeterminedTrader(trades).run(universe, verbose=False)
+        >>> wealth = strategy.wealth
+        >>> wealth.contributions().toarray()
+        array([[ 0.,  0., -1., -1.,  0.],
+               [ 0.,  0.,  0.,  1.,  1.]])
+        >>> np.cumsum(np.ones(2) @ wealth.contributions())
+        array([ 0.,  0., -1., -1.,  0.])
+        >>> np.cumsum(np.array([0.0, 2.0]) @ wealth.contributions())
+        array([0., 0., 0., 2., 4.])
+        """
+        if self._strategy is None:
+            raise ValueError("Wealth is not initialized from a strategy.")
+        return self._cached(
+            "contributions", lambda: self._get_contributions(self._strategy)
         )
 
+    def resample(self, rule, how="last"):
+        """
+        Return wealth aggregated into buckets of bars.
+
+        Buckets are determined as boundaries of bar indices and values are
+        aggregated by `numpy.ufunc.reduceat`, without building a
+        `pandas.Series`. The result is cached for each `rule` and `how`.
+
+        Parameters
+        ----------
+        - rule : int or str
+            If int, number of bars in each bucket.
+            If str, frequency alias of pandas such as "D", "W" or "M";
+            bars are required to be datetimes.
+        - how : {"last", "first", "max", "min"}, default "last"
+            How to aggregate wealth in each bucket.
+
+        Returns
+        -------
+        wealth : Wealth
+            Each bar is the last bar in each bucket.
+
+        Examples
+        --------
+        >>> wealth = Wealth(bars=np.arange(7), wealth=np.array([3, 1, 4, 1, 5, 9, 2]))
+        >>> wealth.resample(3).wealth
+        array([4, 9, 2])
+        >>> wealth.resample(3).bars
+        array([2, 5, 6])
+        >>> wealth.resample(3, how="min").wealth
+        array([1, 1, 2])
+
+        >>> bars = pd.date_range("2000-01-01", periods=7, freq="12H")
+        >>> wealth = Wealth(bars=bars, wealth=np.array([3, 1, 4, 1, 5, 9, 2]))
+        >>> wealth.resample("D", how="max").to_series()
+        2000-01-01 12:00:00    3
+        2000-01-02 12:00:00    4
+        2000-01-03 12:00:00    9
+        2000-01-04 00:00:00    2
+        Name: wealth, dtype: int64
+        """
+        ufuncs = {"max": np.maximum, "min": np.minimum}
+        if how not in ("last", "first", *ufuncs.keys()):
+            raise ValueError(f"Invalid value of how: {how}")
+
+        def compute():
+            begin = self._get_bucket_begin(rule)
+            end = np.append(begin[1:], len(self.wealth)) - 1
+            if how == "last":
+                wealth = self.wealth[end]
+            elif how == "first":
+                wealth = self.wealth[begin]
+            else:
+                wealth = ufuncs[how].reduceat(self.wealth, begin)
+            return self.__class__(bars=self.bars[end], wealth=wealth)
+
+        return self._cached(("resample", rule, how), compute)
+
+    def _get_bucket_begin(self, rule):
+        """
+        Return indices of the first bar of each bucket.
+        """
+        return _get_bucket_begin(self.bars, rule)
+
+    def decimate(self, n_points=2000):
+        """
+        Return wealth thinned out for plotting, preserving its shape.
+
+        Bars are split into `n_points // 2` buckets with equal numbers of bars,
+        and the minimum and the maximum in each bucket are kept together
+        with the first and last bars.
+        The result is cached for each `n_points`.
+
+        Parameters
+        ----------
+        - n_points : int, default 2000
+            Approximate number of points to keep.
+
+        Returns
+        -------
+        wealth : Wealth
+
+        Examples
+        --------
+        >>> wealth = Wealth(
+        ...     bars=np.arange(10),
+        ...     wealth=np.array([3, 1, 4, 1, 5, 9, 2, 6, 5, 3]),
+        ... )
+        >>> decimated = wealth.decimate(4)
+        >>> decimated.bars
+        array([0, 1, 4, 5, 6, 9])
+        >>> decimated.wealth
+        array([3, 1, 5, 9, 2, 3])
+        """
+
+        def compute():
+            n_bars = len(self.wealth)
+            n_buckets = max(n_points // 2, 1)
+            if n_bars <= n_points:
+                return self.__class__(bars=self.bars, wealth=self.wealth)
+
+            begin = np.linspace(0, n_bars, n_buckets + 1).astype(int)
+            bucket = np.repeat(np.arange(n_buckets), np.diff(begin))
+            order = np.lexsort((self.wealth, bucket))
+            index_min = order[begin[:-1]]
+            index_max = order[begin[1:] - 1]
+            index = np.unique(np.concatenate([[0, n_bars - 1], index_min, index_max]))
+            return self.__class__(bars=self.bars[index], wealth=self.wealth[index])
+
+        return self._cached(("decimate", n_points), compute)
+
     def to_series(self, name="wealth", copy=False):
         """
         Represent self as `pandas.Series`.
@@ -74,3 +569,120 @@ class Wealth(TradeResult):
         df_wealth : pandas.DataFrame
         """
         return pd.DataFrame(self, copy=copy).set_index("bars")
+
+
+class WealthAccumulator:
+    """
+    Accumulate profit-loss of executed trades into wealth.
+
+    Trades can be added and removed one by one or in batches.
+    A single trade updates the running state in O(window length),
+    where the window is from its open bar to its close bar,
+    and a batch is absorbed by a single pass over traded assets.
+
+    Parameters
+    ----------
+    - universe : Universe
+        Universe in which trades have been executed.
+
+    Attributes
+    ----------
+    - n_trades : int
+        Number of trades absorbed so far.
+    - wealth : numpy.array, shape (n_bars, )
+        Time-series of wealth.
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> from epymetheus import Universe
+    >>> universe = Universe(pd.DataFrame({
+    ...     "A0": [1, 2, 3, 4, 5],
+    ...     "A1": [2, 3, 4, 5, 6],
+    ...     "A2": [3, 4, 5, 6, 7],
+    ... }, dtype=float))
+    >>> trade0 = Trade(["A0", "A2"], lot=[2, -3], open_bar=1, shut_bar=3)
+    >>> trade1 = Trade("A0", lot=1, open_bar=2, shut_bar=4)
+    >>> trade0, trade1 = trade0.execute(universe), trade1.execute(universe)
+    >>> accumulator = WealthAccumulator(universe).add([trade0, trade1])
+    >>> accumulator.wealth
+    array([ 0.,  0., -1., -1.,  0.])
+    >>> accumulator.remove(trade0).wealth
+    array([0., 0., 0., 1., 2.])
+    """
+
+    def __init__(self, universe):
+        self.universe = universe
+        self.n_trades = 0
+        self.__increment = np.zeros(universe.n_bars, dtype=float)
+        self.__wealth = None
+
+    @property
+    def wealth(self):
+        if self.__wealth is None:
+            self.__wealth = np.cumsum(self.__increment)
+        return self.__wealth
+
+    def add(self, trades):
+        """
+        Absorb executed trade(s).
+
+        Parameters
+        ----------
+        - trades : Trade or iterable of Trade
+
+        Returns
+        -------
+        self : WealthAccumulator
+        """
+        return self.__update(trades, sign=1)
+
+    def remove(self, trades):
+        """
+        Remove trade(s) which have been absorbed.
+
+        Parameters
+        ----------
+        - trades : Trade or iterable of Trade
+
+        Returns
+        -------
+        self : WealthAccumulator
+        """
+        return self.__update(trades, sign=-1)
+
+    def to_wealth(self):
+        """
+        Return snapshot of the current wealth.
+
+        Returns
+        -------
+        wealth : Wealth
+        """
+        return Wealth(bars=self.universe.bars, wealth=self.wealth.copy())
+
+    def __update(self, trades, sign):
+        if isinstance(trades, Trade):
+            trades = [trades]
+        trades = list(trades)
+
+        for trade in trades:
+            if not trade.is_executed:
+                raise ValueError("Trade has not been executed.")
+
+        if len(trades) == 1:
+            self.__update_window(trades[0], sign)
+        elif len(trades) > 1:
+            orders = _get_orders(self.universe, trades)
+            self.__increment += sign * _get_total_increment(self.universe, orders)
+
+        self.n_trades += sign * len(trades)
+        self.__wealth = None
+
+        return self
+
+    def __update_window(self, trade, sign):
+        asset_index, lot, open_index, close_index = _get_orders(self.universe, [trade])
+        begin, end = open_index[0], close_index[0] + 1
+        prices = self.universe.prices.values[begin:end, asset_index]
+        self.__increment[begin + 1 : end] += sign * (np.diff(prices, axis=0) @ lot)
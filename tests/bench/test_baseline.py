@@ -0,0 +1,122 @@
+import json
+
+import pytest
+
+from epymetheus.bench import compare
+from epymetheus.bench import load_baseline
+from epymetheus.bench import save_baseline
+from epymetheus.bench.baseline import format_comparison
+from epymetheus.bench.__main__ import main
+
+
+def result(median, peak_memory, benchmark="run"):
+    return {
+        "case": "case",
+        "benchmark": benchmark,
+        "times": [median],
+        "median": median,
+        "peak_memory": peak_memory,
+    }
+
+
+class TestCompare:
+    baseline = [result(1.0, 1000)]
+
+    @pytest.mark.parametrize(
+        "median, peak_memory, expected",
+        [
+            (1.0, 1000, False),
+            (1.1, 1000, False),
+            (0.5, 500, False),
+            (1.5, 1000, True),
+            (1.0, 1500, True),
+        ],
+    )
+    def test_regression(self, median, peak_memory, expected):
+        comparison = compare([result(median, peak_memory)], self.baseline)
+        assert comparison[0]["regression"] == expected
+        assert comparison[0]["time_ratio"] == pytest.approx(median)
+        assert comparison[0]["memory_ratio"] == pytest.approx(peak_memory / 1000)
+
+    def test_rtol(self):
+        assert not compare([result(1.5, 1000)], self.baseline, rtol=0.6)[0][
+            "regression"
+        ]
+
+    def test_min_time(self):
+        baseline = [result(1e-5, 1000)]
+        assert not compare([result(1e-4, 1000)], baseline)[0]["regression"]
+        assert compare([result(1e-4, 1000)], baseline, min_time=0)[0]["regression"]
+
+    def test_unmatched(self):
+        comparison = compare([result(1.0, 1000, benchmark="new")], self.baseline)
+        assert len(comparison) == 1
+        assert comparison[0]["benchmark"] == "run"
+        assert comparison[0]["missing"]
+        assert not comparison[0]["regression"]
+        assert "MISSING" in format_comparison(comparison)
+
+    def test_format(self):
+        table = format_comparison(compare([result(2.0, 1000)], self.baseline))
+        assert "2.00x" in table
+        assert "REGRESSION" in table
+
+
+class TestBaseline:
+    args = ["--n-bars", "100", "--n-trades", "10", "--metrics", "final_wealth"]
+
+    def test_save_load(self, tmp_path):
+        path = tmp_path / "baseline.json"
+        save_baseline(path, [result(1.0, 1000)], [{"n_bars": 100}], ["final_wealth"])
+        baseline = load_baseline(path)
+        assert baseline["results"] == [result(1.0, 1000)]
+        assert baseline["cases"] == [{"n_bars": 100}]
+        assert baseline["metrics"] == ["final_wealth"]
+
+    def test_main(self, tmp_path, capsys):
+        path = str(tmp_path / "baseline.json")
+        args = self.args + ["--repeat", "1", "--baseline", path]
+
+        assert main(["save"] + args) == 0
+        baseline = load_baseline(path)
+        assert len(baseline["results"]) == 4
+
+        # Generous tolerance so that noise never fails the test
+        assert main(["compare", "--rtol", "100", "--memory-rtol", "100"] + args) == 0
+        assert "metrics.final_wealth" in capsys.readouterr().out
+
+    def test_main_regression(self, tmp_path, capsys):
+        path = tmp_path / "baseline.json"
+        assert main(["save", "--repeat", "1", "--baseline", str(path)] + self.args) == 0
+
+        # Pretend the baseline was much faster
+        baseline = load_baseline(path)
+        for r in baseline["results"]:
+            r["median"] = 0.0
+            r["peak_memory"] = 0
+        path.write_text(json.dumps(baseline))
+
+        # Cases and metrics are taken from the baseline
+        argv = ["compare", "--repeat", "1", "--min-time", "0", "--baseline", str(path)]
+        assert main(argv) == 1
+        assert "REGRESSION" in capsys.readouterr().out
+
+    def test_main_options_before_command(self, tmp_path):
+        path = tmp_path / "baseline.json"
+        argv = self.args + ["--repeat", "1", "--baseline", str(path), "save"]
+        assert main(argv) == 0
+        results = load_baseline(path)["results"]
+        assert len(results) == 4
+        assert all(len(r["times"]) == 1 for r in results)
+
+    def test_main_no_match(self, tmp_path, capsys):
+        path = str(tmp_path / "baseline.json")
+        args = ["--repeat", "1", "--baseline", path, "--metrics", "final_wealth"]
+        assert main(["save", "--n-bars", "100", "--n-trades", "10"] + args) == 0
+        argv = ["compare", "--n-bars", "200", "--n-trades", "10"] + args
+        assert main(argv) == 2
+        assert "MISSING" in capsys.readouterr().out
+
+    def test_main_no_baseline(self, tmp_path):
+        path = str(tmp_path / "none.json")
+        assert main(["compare", "--baseline", path]) == 2
@@ -0,0 +1,39 @@
+import pytest
+
+import numpy as np
+
+from epymetheus.bench import make_cases
+from epymetheus.bench import run_suite
+from epymetheus.bench.suite import format_results
+from epymetheus.bench.suite import make_strategy
+from epymetheus.bench.__main__ import main
+
+
+class TestSuite:
+    cases = make_cases(n_bars=[100], n_trades=[10], take_stop=[0.0, 1.0])
+
+    def test_run_suite(self):
+        results = run_suite(self.cases, metrics=["final_wealth"], repeat=2)
+        benchmarks = ["run", "history", "wealth", "metrics.final_wealth"]
+        assert len(results) == len(self.cases) * len(benchmarks)
+        assert [r["benchmark"] for r in results[:4]] == benchmarks
+        for result in results:
+            assert len(result["times"]) == 2
+            assert result["median"] == np.median(result["times"])
+            assert result["peak_memory"] > 0
+        assert "metrics.final_wealth" in format_results(results)
+
+    @pytest.mark.parametrize("take_stop", [0.0, 1.0])
+    def test_take_stop(self, take_stop):
+        case = make_cases(n_bars=[100], n_trades=[10], take_stop=[take_stop])[0]
+        strategy, universe = make_strategy(case)
+        strategy.run(universe, verbose=False)
+        assert strategy.n_trades == 10
+        assert all(
+            (trade.take is not None) == bool(take_stop) for trade in strategy.trades
+        )
+
+    def test_main(self, capsys):
+        argv = ["--repeat", "1", "--n-bars", "100", "--n-trades", "10"]
+        assert main(argv + ["--metrics", "final_wealth"]) == 0
+        assert "metrics.final_wealth" in capsys.readouterr().out
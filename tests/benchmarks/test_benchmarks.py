@@ -1,9 +1,42 @@
 import pytest
 
+import numpy as np
 import pandas as pd
 
 from epymetheus import Universe, Trade
 from epymetheus.benchmarks import BuyAndHold
+from epymetheus.benchmarks import RandomTrader
+from epymetheus.benchmarks import null_distribution
+from epymetheus.datasets import make_randomwalk
+from epymetheus.metrics import SharpeRatio
+
+
+class TestRandomTrader:
+    @pytest.mark.parametrize("n_assets", [3, 10, 100])
+    @pytest.mark.parametrize("max_n_orders", [1, 5])
+    def test_trades(self, n_assets, max_n_orders):
+        universe = make_randomwalk(n_bars=100, n_assets=n_assets)
+        strategy = RandomTrader(
+            n_trades=200, max_n_orders=max_n_orders, min_lot=-1, max_lot=2, seed=42
+        ).run(universe, verbose=False)
+
+        assert strategy.n_trades == 200
+        for trade in strategy.trades:
+            assert 1 <= trade.n_orders <= min(max_n_orders, n_assets)
+            assert len(set(trade.asset)) == trade.n_orders
+            assert set(trade.asset) <= set(universe.assets)
+            assert ((-1 <= trade.lot) & (trade.lot <= 2)).all()
+            assert trade.open_bar < trade.shut_bar
+
+    def test_seed(self):
+        universe = make_randomwalk(n_bars=100)
+        trades0 = RandomTrader(seed=42).run(universe, verbose=False).trades
+        trades1 = RandomTrader(seed=42).run(universe, verbose=False).trades
+        for trade0, trade1 in zip(trades0, trades1):
+            assert np.array_equal(trade0.asset, trade1.asset)
+            assert np.array_equal(trade0.lot, trade1.lot)
+            assert trade0.open_bar == trade1.open_bar
+            assert trade0.shut_bar == trade1.shut_bar
 
 
 class TestBuyAndHold:
@@ -18,3 +51,118 @@ class TestBuyAndHold:
         assert (strategy.trades[0].lot == [0.5 / 1, 0.5 / 2]).all()
         assert strategy.trades[0].open_bar == 0
         assert strategy.trades[0].close_bar == 2
+
+    @pytest.mark.parametrize("rebalance", [1, 7, 100])
+    def test_rebalance(self, rebalance):
+        universe = make_randomwalk(n_bars=100, n_assets=5)
+        weight = {"1": 1.0, "3": -2.0}
+        strategy = BuyAndHold(weight, rebalance=rebalance).run(universe)
+
+        assert strategy.n_trades == -(-100 // rebalance)
+
+        # Capital 3.0 = |1.0| + |-2.0| is reinvested at each rebalance.
+        prices = universe.prices.loc[:, ["1", "3"]].values
+        value, expected = 3.0, [0.0]
+        for i in range(1, 100):
+            if (i - 1) % rebalance == 0:
+                lot = value / 3.0 * np.array([1.0, -2.0]) / prices[i - 1]
+            value += lot @ (prices[i] - prices[i - 1])
+            expected.append(value - 3.0)
+        assert np.allclose(strategy.wealth.wealth, expected)
+
+    def test_rebalance_frequency(self):
+        bars = list(pd.date_range("2000-01-01", periods=100))
+        universe = make_randomwalk(n_bars=100, n_assets=5, bars=bars)
+        strategy = BuyAndHold({"1": 1.0}, rebalance="M").run(universe)
+
+        assert strategy.n_trades == 4
+        assert [trade.open_bar.day for trade in strategy.trades] == [1, 1, 1, 1]
+        assert strategy.get_lots(universe).shape == (4, 1)
+
+    @pytest.mark.parametrize("rule", ["2W", "2M"])
+    def test_rebalance_multiple(self, rule):
+        """
+        Multiples of frequencies are respected, consistently with pandas.
+        """
+        bars = list(pd.date_range("2000-01-01", periods=100))
+        universe = make_randomwalk(n_bars=100, n_assets=5, bars=bars)
+        strategy = BuyAndHold({"1": 1.0}, rebalance=rule).run(universe)
+
+        size = pd.Series(1, index=universe.bars).resample(rule).size().values
+        begin = np.cumsum(size) - size
+        assert strategy.n_trades == len(size)
+        assert [t.open_bar for t in strategy.trades] == list(universe.bars[begin])
+
+    def test_unknown_asset(self):
+        universe = make_randomwalk(n_bars=100, n_assets=3)
+        with pytest.raises(KeyError, match="XYZ"):
+            BuyAndHold({"XYZ": 1.0}).run(universe)
+
+    def test_rebalance_valueerror(self):
+        universe = make_randomwalk(n_bars=100, n_assets=5)
+        with pytest.raises(ValueError):
+            BuyAndHold({"1": 1.0}, rebalance="M").run(universe)
+
+
+class TestNullDistribution:
+    metrics = ["final_wealth", "sharpe_ratio"]
+
+    def test_null(self):
+        universe = make_randomwalk(n_bars=100, seed=42)
+        result = null_distribution(
+            universe, n_runs=10, trader_kwargs={"n_trades": 5}, metrics=self.metrics
+        )
+        assert list(result.null.columns) == self.metrics
+        assert result.null.shape == (10, 2)
+        assert result.percentile is None
+
+    def test_n_jobs(self):
+        universe = make_randomwalk(n_bars=100, seed=42)
+        kwargs = dict(
+            n_runs=10, trader_kwargs={"n_trades": 5}, metrics=self.metrics, seed=42
+        )
+        result0 = null_distribution(universe, n_jobs=1, **kwargs)
+        result1 = null_distribution(universe, n_jobs=2, **kwargs)
+        assert np.array_equal(result0.null.values, result1.null.values)
+
+    def test_seed(self):
+        universe = make_randomwalk(n_bars=100, seed=42)
+        result = null_distribution(universe, n_runs=10, seed=42)
+        for i, seed in enumerate(np.random.SeedSequence(42).spawn(10)):
+            strategy = RandomTrader(seed=seed).run(universe, verbose=False)
+            expected = strategy.evaluate("sharpe_ratio")
+            assert np.isclose(result.null.sharpe_ratio[i], expected)
+
+    def test_percentile(self):
+        universe = make_randomwalk(n_bars=100, seed=42)
+        strategy = RandomTrader(seed=0).run(universe, verbose=False)
+        result = null_distribution(
+            universe, n_runs=20, metrics=self.metrics, strategy=strategy, seed=42
+        )
+        for name in self.metrics:
+            value = strategy.evaluate(name)
+            expected = 100 * np.mean(result.null[name] <= value)
+            assert result.value[name] == value
+            assert result.percentile[name] == expected
+
+    def test_budget(self):
+        """
+        Runs are evaluated with the budget of strategy.
+        """
+        universe = make_randomwalk(n_bars=100, seed=42)
+        metrics = ["final_wealth", SharpeRatio(rate=True)]
+        kwargs = dict(n_runs=20, seed=42, metrics=metrics)
+
+        strategy = RandomTrader(seed=0).run(universe, budget=10000.0, verbose=False)
+        result = null_distribution(universe, strategy=strategy, **kwargs)
+        assert not result.null.isna().any().any()
+        for i, seed in enumerate(np.random.SeedSequence(42).spawn(20)):
+            run = RandomTrader(seed=seed).run(universe, budget=10000.0, verbose=False)
+            assert np.isclose(result.null.final_wealth[i], run.evaluate("final_wealth"))
+
+        strategy0 = RandomTrader(seed=0).run(universe, verbose=False)
+        result0 = null_distribution(universe, strategy=strategy0, **kwargs)
+        assert result.percentile.final_wealth == result0.percentile.final_wealth
+
+        result1 = null_distribution(universe, budget=1.0, **kwargs)
+        assert np.allclose(result1.null.final_wealth, result0.null.final_wealth + 1.0)
@@ -0,0 +1,67 @@
+import pytest
+
+import numpy as np
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from epymetheus.datasets import load_csv_directory
+
+
+def _write_directory(directory, n_assets=5):
+    np.random.seed(42)
+    dates = pd.date_range("2000-01-01", "2000-12-31")
+    dict_series = {}
+    for i in range(n_assets):
+        index = np.sort(np.random.choice(dates, size=100, replace=False))
+        series = pd.Series(np.random.rand(100), index=pd.DatetimeIndex(index))
+        frame = pd.DataFrame({"Close": series, "Adj Close": series * 2})
+        frame = frame.rename_axis("Date")
+        frame.sample(frac=1.0).to_csv(directory / f"A{i}.csv")
+        dict_series[f"A{i}"] = series * 2
+    return pd.DataFrame(dict_series)
+
+
+class TestLoadCSVDirectory:
+    @pytest.mark.parametrize("n_jobs", [1, 4])
+    def test_union(self, tmp_path, n_jobs):
+        expected = _write_directory(tmp_path).ffill().bfill()
+        universe = load_csv_directory(tmp_path, n_jobs=n_jobs, backfill=True)
+        assert_frame_equal(universe.prices, expected, check_freq=False)
+
+    def test_calendar(self, tmp_path):
+        calendar = pd.bdate_range("2000-02-01", "2000-11-30")
+        frame = _write_directory(tmp_path)
+        expected = frame.ffill().bfill().reindex(calendar, method="ffill")
+        universe = load_csv_directory(tmp_path, calendar=calendar, backfill=True)
+        assert_frame_equal(universe.prices, expected, check_freq=False)
+
+    def test_no_backfill(self, tmp_path):
+        frame = _write_directory(tmp_path)
+        with pytest.raises(ValueError):
+            load_csv_directory(tmp_path)
+
+        # Calendar which begins after the first dates of all files
+        calendar = pd.bdate_range(
+            frame.apply(pd.Series.first_valid_index).max(), "2000-12-31"
+        )
+        expected = frame.ffill().reindex(calendar, method="ffill")
+        universe = load_csv_directory(tmp_path, calendar=calendar)
+        assert_frame_equal(universe.prices, expected, check_freq=False)
+
+    def test_column(self, tmp_path):
+        expected = _write_directory(tmp_path).ffill().bfill() / 2
+        universe = load_csv_directory(tmp_path, column="Close", backfill=True)
+        assert_frame_equal(universe.prices, expected, check_freq=False)
+
+    def test_filename(self, tmp_path):
+        directory = tmp_path / "csv"
+        directory.mkdir()
+        _write_directory(directory)
+        filename = tmp_path / "prices.npy"
+        universe = load_csv_directory(
+            directory, filename=filename, dtype=np.float32, backfill=True
+        )
+        expected = load_csv_directory(directory, backfill=True).prices.values
+        expected = expected.astype(np.float32)
+        assert np.array_equal(universe.prices.values, expected)
+        assert np.array_equal(np.load(filename, mmap_mode="r"), expected)
@@ -0,0 +1,36 @@
+import pytest
+
+import numpy as np
+
+from epymetheus.datasets import make_gbm
+
+
+class TestGBM:
+    cov = np.array([[4.0, 1.0, 0.0], [1.0, 1.0, -0.5], [0.0, -0.5, 1.0]]) * 1e-4
+
+    def test_cov(self):
+        universe = make_gbm(self.cov, n_bars=100000, seed=42)
+        log_return = np.diff(np.log(universe.prices.values), axis=0)
+        assert np.allclose(np.cov(log_return.T), self.cov, atol=1e-5)
+
+    def test_drift(self):
+        drift = np.array([0.001, 0.0, -0.001])
+        universe = make_gbm(self.cov, drift=drift, n_bars=100000, seed=42)
+        ratio = universe.prices.values[1:] / universe.prices.values[:-1]
+        assert np.allclose(ratio.mean(axis=0) - 1, drift, atol=1e-4)
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+    def test_chunk_size(self, chunk_size):
+        universe0 = make_gbm(self.cov, n_bars=100, seed=42)
+        universe1 = make_gbm(self.cov, n_bars=100, seed=42, chunk_size=chunk_size)
+        assert np.allclose(universe0.prices, universe1.prices)
+
+    def test_seed(self):
+        universe0 = make_gbm(self.cov, seed=42)
+        universe1 = make_gbm(self.cov, seed=42)
+        assert (universe0.prices == universe1.prices).all(axis=None)
+        assert (universe0.prices.iloc[0] == 1.0).all()
+
+    def test_dtype(self):
+        universe = make_gbm(self.cov, dtype=np.float32)
+        assert (universe.prices.dtypes == np.float32).all()
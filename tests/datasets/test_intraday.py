@@ -0,0 +1,43 @@
+import pytest
+
+import numpy as np
+import pandas as pd
+
+from epymetheus.datasets import make_intraday
+
+
+class TestIntraday:
+    def test_bars(self):
+        universe = make_intraday(n_days=5, freq="30min", seed=42)
+        bars = universe.bars
+        assert isinstance(bars, pd.DatetimeIndex)
+        assert len(bars) == 5 * 13
+        assert (bars.dayofweek < 5).all()
+        assert bars.time.min() == pd.Timestamp("09:30").time()
+        assert bars.time.max() == pd.Timestamp("15:30").time()
+
+    def test_overnight(self):
+        universe = make_intraday(
+            n_days=1000,
+            n_assets=2,
+            freq="30min",
+            volatility=0.001,
+            overnight_volatility=0.01,
+            seed=42,
+        )
+        log_return = np.diff(np.log(universe.prices.values), axis=0)
+        is_open = np.diff(universe.bars.normalize().asi8) != 0
+        assert np.allclose(log_return[is_open].std(axis=0), 0.01, rtol=0.1)
+        assert np.allclose(log_return[~is_open].std(axis=0), 0.001, rtol=0.1)
+
+    def test_corr(self):
+        corr = np.array([[1.0, 0.8], [0.8, 1.0]])
+        universe = make_intraday(n_days=100, n_assets=2, corr=corr, seed=42)
+        log_return = np.diff(np.log(universe.prices.values), axis=0)
+        assert np.isclose(np.corrcoef(log_return.T)[0, 1], 0.8, atol=0.05)
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+    def test_chunk_size(self, chunk_size):
+        universe0 = make_intraday(n_days=2, seed=42)
+        universe1 = make_intraday(n_days=2, seed=42, chunk_size=chunk_size)
+        assert np.allclose(universe0.prices, universe1.prices)
@@ -0,0 +1,51 @@
+import pytest
+
+import numpy as np
+import pandas as pd
+
+from epymetheus.datasets import make_randomwalk
+
+
+class TestRandomWalk:
+    def test_shape(self):
+        universe = make_randomwalk(n_bars=100, n_assets=5)
+        assert universe.prices.shape == (100, 5)
+        assert (universe.prices.iloc[0] == 1.0).all()
+
+    def test_seed(self):
+        universe0 = make_randomwalk(seed=42)
+        universe1 = make_randomwalk(seed=42)
+        universe2 = make_randomwalk(seed=43)
+        assert (universe0.prices == universe1.prices).all(axis=None)
+        assert not (universe0.prices == universe2.prices).all(axis=None)
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 100])
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64])
+    def test_chunk_size(self, chunk_size, dtype):
+        universe0 = make_randomwalk(n_assets=10, seed=42, dtype=dtype)
+        universe1 = make_randomwalk(
+            n_assets=10, seed=42, dtype=dtype, chunk_size=chunk_size
+        )
+        assert (universe0.prices == universe1.prices).all(axis=None)
+
+    def test_dtype(self):
+        universe = make_randomwalk(dtype=np.float32)
+        assert (universe.prices.dtypes == np.float32).all()
+
+    def test_volatility(self):
+        universe = make_randomwalk(n_bars=10000, n_assets=10, volatility=0.1, seed=42)
+        log_return = np.diff(np.log(universe.prices.values), axis=0)
+        assert np.allclose(log_return.std(axis=0), 0.1, rtol=0.05)
+
+    def test_filename(self, tmp_path):
+        filename = tmp_path / "prices.npy"
+        universe = make_randomwalk(seed=42, filename=filename)
+        expected = make_randomwalk(seed=42).prices.values
+        assert np.array_equal(universe.prices.values, expected)
+        assert np.array_equal(np.load(filename, mmap_mode="r"), expected)
+
+    def test_bars(self):
+        bars = pd.date_range("2000-01-01", periods=100)
+        universe = make_randomwalk(n_bars=100, bars=bars, assets=list("ABCDEFGHIJ"))
+        assert (universe.bars == bars).all()
+        assert list(universe.assets) == list("ABCDEFGHIJ")
@@ -0,0 +1,46 @@
+import pytest
+
+import numpy as np
+
+from epymetheus.datasets import make_regime_switching
+
+
+class TestRegimeSwitching:
+    covs = np.stack([np.eye(2) * 1e-4, np.eye(2) * 1e-2])
+
+    def test_regimes(self):
+        transition = [[0.9, 0.1], [0.2, 0.8]]
+        _, regimes = make_regime_switching(
+            self.covs,
+            transition=transition,
+            n_bars=100000,
+            seed=42,
+            return_regimes=True,
+        )
+        # Stationary distribution is (2 / 3, 1 / 3).
+        assert np.isclose((regimes == 0).mean(), 2 / 3, atol=0.02)
+        stay = (regimes[1:] == regimes[:-1])[regimes[:-1] == 0].mean()
+        assert np.isclose(stay, 0.9, atol=0.01)
+
+    def test_volatility(self):
+        universe, regimes = make_regime_switching(
+            self.covs, n_bars=100000, seed=42, return_regimes=True
+        )
+        log_return = np.diff(np.log(universe.prices.values), axis=0)
+        for k in range(2):
+            std = log_return[regimes[1:] == k].std(axis=0)
+            assert np.allclose(std, np.sqrt(self.covs[k, 0, 0]), rtol=0.05)
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+    def test_chunk_size(self, chunk_size):
+        universe0 = make_regime_switching(self.covs, n_bars=100, seed=42)
+        universe1 = make_regime_switching(
+            self.covs, n_bars=100, seed=42, chunk_size=chunk_size
+        )
+        assert np.allclose(universe0.prices, universe1.prices)
+
+    def test_single_regime(self):
+        universe, regimes = make_regime_switching(
+            self.covs[:1], n_bars=100, seed=42, return_regimes=True
+        )
+        assert (regimes == 0).all()
@@ -0,0 +1,138 @@
+import pytest
+
+import numpy as np
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from epymetheus.datasets import CachedSource
+from epymetheus.datasets import CSVSource
+from epymetheus.datasets import PriceSource
+from epymetheus.datasets import fetch_usstocks
+from epymetheus.datasets.usstocks import module_path
+
+
+def _write_csv(directory, ticker, seed):
+    index = pd.bdate_range("1999-12-01", "2000-03-31", name="Date")
+    np.random.seed(seed)
+    prices = pd.DataFrame(
+        {
+            "Close": np.random.rand(len(index)),
+            "Adj Close": np.random.rand(len(index)),
+        },
+        index=index,
+    )
+    prices.to_csv(directory / f"{ticker}.csv")
+    return prices
+
+
+class CountingSource(PriceSource):
+    def __init__(self, source):
+        self.source = source
+        self.calls = []
+
+    def fetch(self, ticker, begin_date, end_date):
+        self.calls.append((ticker, begin_date, end_date))
+        return self.source.fetch(ticker, begin_date, end_date)
+
+
+class TestCSVSource:
+    def test_fetch(self, tmp_path):
+        expected = _write_csv(tmp_path, "A", 42)
+        result = CSVSource(tmp_path).fetch("A", "2000-01-01", "2000-01-31")
+        assert_frame_equal(
+            result, expected.loc["2000-01-01":"2000-01-31"], check_freq=False
+        )
+
+
+class TestCachedSource:
+    def test_cache(self, tmp_path):
+        expected = _write_csv(tmp_path, "A", 42)
+        counting = CountingSource(CSVSource(tmp_path))
+        source = CachedSource(counting, tmp_path / "cache")
+
+        result0 = source.fetch("A", "2000-01-01", "2000-01-31")
+        result1 = source.fetch("A", "2000-01-10", "2000-01-20")
+        assert len(counting.calls) == 1
+        assert_frame_equal(
+            result0, expected.loc["2000-01-01":"2000-01-31"], check_freq=False
+        )
+        assert_frame_equal(
+            result1, expected.loc["2000-01-10":"2000-01-20"], check_freq=False
+        )
+
+    def test_top_up(self, tmp_path):
+        expected = _write_csv(tmp_path, "A", 42)
+        counting = CountingSource(CSVSource(tmp_path))
+        source = CachedSource(counting, tmp_path / "cache")
+
+        source.fetch("A", "2000-01-01", "2000-01-31")
+        result = source.fetch("A", "1999-12-15", "2000-02-15")
+        assert counting.calls[1:] == [
+            ("A", pd.Timestamp("1999-12-15"), pd.Timestamp("1999-12-31")),
+            ("A", pd.Timestamp("2000-02-01"), pd.Timestamp("2000-02-15")),
+        ]
+        assert_frame_equal(
+            result, expected.loc["1999-12-15":"2000-02-15"], check_freq=False
+        )
+
+        # Cache persists across instances.
+        counting = CountingSource(CSVSource(tmp_path))
+        source = CachedSource(counting, tmp_path / "cache")
+        source.fetch("A", "1999-12-20", "2000-02-10")
+        assert counting.calls == []
+
+    def test_today(self, tmp_path, monkeypatch):
+        """
+        Dates from today on are fetched again.
+        """
+        expected = _write_csv(tmp_path, "A", 42)
+        counting = CountingSource(CSVSource(tmp_path))
+        source = CachedSource(counting, tmp_path / "cache")
+        monkeypatch.setattr(
+            CachedSource, "_today", staticmethod(lambda: pd.Timestamp("2000-01-20"))
+        )
+
+        source.fetch("A", "2000-01-01", "2000-01-31")
+        source.fetch("A", "2000-01-01", "2000-01-31")
+        assert counting.calls[1] == (
+            "A",
+            pd.Timestamp("2000-01-20"),
+            pd.Timestamp("2000-01-31"),
+        )
+
+        # Future dates are not cached at all.
+        source.fetch("A", "2000-02-01", "2000-02-10")
+        source.fetch("A", "2000-02-01", "2000-02-10")
+        assert len(counting.calls) == 4
+
+        monkeypatch.setattr(
+            CachedSource, "_today", staticmethod(lambda: pd.Timestamp("2000-03-01"))
+        )
+        result = source.fetch("A", "2000-01-01", "2000-01-31")
+        assert counting.calls[4][1] == pd.Timestamp("2000-01-20")
+        assert_frame_equal(
+            result, expected.loc["2000-01-01":"2000-01-31"], check_freq=False
+        )
+        source.fetch("A", "2000-01-01", "2000-01-31")
+        assert len(counting.calls) == 5
+
+
+class TestFetchUSStocks:
+    def test_source(self, tmp_path):
+        with open(module_path / "usstocks.txt") as f:
+            tickers = [ticker.strip() for ticker in f.readlines()][:3]
+        for seed, ticker in enumerate(tickers):
+            _write_csv(tmp_path, ticker, seed)
+
+        source = CachedSource(CSVSource(tmp_path), tmp_path / "cache")
+        universe = fetch_usstocks(
+            begin_date="2000-01-01",
+            end_date="2000-03-31",
+            n_assets=3,
+            source=source,
+            n_jobs=2,
+        )
+        assert list(universe.assets) == tickers
+        assert universe.bars[0] == pd.Timestamp("2000-01-01")
+        assert universe.bars[-1] == pd.Timestamp("2000-03-31")
+        assert not np.isnan(universe.prices.values).any()
@@ -1,8 +1,10 @@
 import pytest  # noqa: F401
 
+import numpy as np
 import pandas as pd
 
 from epymetheus.datasets._utils import fill_and_cut
+from epymetheus.datasets._utils import fill_and_cut_frame
 
 
 def test_fill_and_cut():
@@ -21,3 +23,23 @@ def test_fill_and_cut():
     )
 
     assert_series_equal(fill_and_cut(series, "2000-01-01"), series_expected)
+
+
+def test_fill_and_cut_frame():
+    from pandas.testing import assert_frame_equal
+
+    np.random.seed(42)
+    dates = pd.date_range("1999-12-01", "2000-03-31")
+    dict_series = {}
+    for i in range(5):
+        index = np.sort(np.random.choice(dates, size=50, replace=False))
+        dict_series[str(i)] = pd.Series(np.random.rand(50), index=index)
+
+    result = fill_and_cut_frame(pd.DataFrame(dict_series), begin_date="2000-01-01")
+    expected = pd.DataFrame(
+        {
+            key: fill_and_cut(series, begin_date="2000-01-01")
+            for key, series in dict_series.items()
+        }
+    )
+    assert_frame_equal(result, expected, check_freq=False)
@@ -15,12 +15,14 @@ class TestToDataFrame:
     Test for `History.to_dataframe()`.
     """
 
+    universe = make_randomwalk(42)
+
     def _get_history(self):
-        strategy = RandomTrader(seed=42).run(make_randomwalk(42))
+        strategy = RandomTrader(seed=42).run(self.universe)
         return History(strategy)
 
     def _get_df_history(self):
-        strategy = RandomTrader(seed=42).run(make_randomwalk(42))
+        strategy = RandomTrader(seed=42).run(self.universe)
         return History(strategy).to_dataframe()
 
     def test_pandas_init(self):
@@ -76,3 +78,86 @@ class TestToDataFrame:
         df_history = self._get_df_history()
         for c in df_history.columns:
             assert array_equal(df_history[c], history[c])
+
+
+class TestQuery:
+    """
+    Test for `History.query()`.
+    """
+
+    def _get_history(self):
+        strategy = RandomTrader(seed=42).run(make_randomwalk(seed=42))
+        return History(strategy)
+
+    def _assert_query(self, history, expected_mask, **kwargs):
+        result = history.query(**kwargs)
+        for key, value in history.items():
+            assert array_equal(result[key], value[expected_mask])
+
+    @pytest.mark.parametrize("asset", ["0", "3", ["1", "2"], "nonexistent"])
+    def test_asset(self, asset):
+        history = self._get_history()
+        expected_mask = np.isin(history.asset, asset)
+        self._assert_query(history, expected_mask, asset=asset)
+
+    @pytest.mark.parametrize("between", [(100, 500), (None, 300), (700, None)])
+    def test_open_between(self, between):
+        history = self._get_history()
+        begin, end = between
+        expected_mask = (history.open_bar >= (begin or 0)) & (
+            history.open_bar <= (end or np.inf)
+        )
+        self._assert_query(history, expected_mask, open_between=between)
+
+    def test_combined(self):
+        history = self._get_history()
+        expected_mask = (
+            (history.asset == "0")
+            & (history.open_bar >= 100)
+            & (history.close_bar <= 800)
+        )
+        self._assert_query(
+            history,
+            expected_mask,
+            asset="0",
+            open_between=(100, None),
+            close_between=(None, 800),
+        )
+
+    @pytest.mark.parametrize(
+        "open_between, close_between",
+        [((0, 10), (None, 800)), ((0, None), (None, 10)), (None, (500, 510))],
+    )
+    def test_combined_smallest_first(self, open_between, close_between):
+        history = self._get_history()
+        expected_mask = np.isin(history.asset, ["0", "1"])
+        if open_between is not None:
+            begin, end = open_between
+            expected_mask &= (history.open_bar >= begin) & (
+                history.open_bar <= (end or np.inf)
+            )
+        begin, end = close_between
+        expected_mask &= (history.close_bar >= (begin or 0)) & (
+            history.close_bar <= end
+        )
+        self._assert_query(
+            history,
+            expected_mask,
+            asset=["0", "1"],
+            open_between=open_between,
+            close_between=close_between,
+        )
+
+    def test_index_reused(self):
+        history = self._get_history()
+        history.query(asset="0")
+        index = history._get_index("asset")
+        history.query(asset="1")
+        assert history._get_index("asset") is index
+
+    def test_index_invalidated(self):
+        history = self._get_history()
+        history.query(asset="0")
+        history["asset"] = np.full_like(history.asset, "0")
+        result = history.query(asset="0")
+        assert array_equal(result.order_id, history.order_id)
@@ -1,3 +1,6 @@
+import gc
+import weakref
+
 import pytest
 
 import numpy as np
@@ -12,11 +15,38 @@ from epymetheus.metrics import AverageReturn
 from epymetheus.metrics import FinalWealth
 from epymetheus.metrics import Drawdown
 from epymetheus.metrics import MaxDrawdown
+from epymetheus.metrics import MaxUnderwater
 from epymetheus.metrics import Volatility
 from epymetheus.metrics import SharpeRatio
 from epymetheus.metrics import TradewiseSharpeRatio
 from epymetheus.metrics import Exposure
+from epymetheus.metrics import EvaluationContext
+from epymetheus.metrics import RollingAverageReturn
+from epymetheus.metrics import RollingMaxDrawdown
+from epymetheus.metrics import RollingSharpeRatio
+from epymetheus.metrics import RollingVolatility
 from epymetheus.metrics import _metric_from_name
+from epymetheus.metrics import Alpha
+from epymetheus.metrics import Beta
+from epymetheus.metrics import Correlation
+from epymetheus.metrics import InformationRatio
+from epymetheus.metrics import TrackingError
+from epymetheus.benchmarks import BuyAndHold
+from epymetheus.benchmarks import null_distribution
+from epymetheus.metrics.metrics import Metric
+
+
+class NTrades(Metric):
+    """
+    Metric which only implements `result`.
+    """
+
+    @property
+    def name(self):
+        return "n_trades"
+
+    def result(self, strategy):
+        return strategy.n_trades
 
 
 class TestBase:
@@ -30,6 +60,7 @@ class TestBase:
         FinalWealth,
         Drawdown,
         MaxDrawdown,
+        MaxUnderwater,
         Volatility,
         SharpeRatio,
         TradewiseSharpeRatio,
@@ -60,11 +91,61 @@ class TestBase:
         result1 = np.array(m(strategy))  # from __call__
         assert np.equal(result0, result1).all()
 
+    @pytest.mark.parametrize("seed", range(1))
+    def test_strategy_evaluate_list(self, seed):
+        """
+        Test if `strategy.evaluate([m0, m1, ...]) == [m0.result(strategy), ...]`
+        """
+        metrics = [MetricClass() for MetricClass in self.params_metric]
+        strategy = RandomTrader(seed=seed).run(make_randomwalk(seed=seed))
+        results = strategy.evaluate(metrics)
+        assert len(results) == len(metrics)
+        for m, result in zip(metrics, results):
+            assert np.equal(np.array(m.result(strategy)), np.array(result)).all()
+
+    @pytest.mark.parametrize("MetricClass", params_metric)
+    def test_strategy_evaluate_name(self, MetricClass):
+        m = MetricClass()
+        strategy = RandomTrader(seed=42).run(make_randomwalk(seed=42))
+        result0 = np.array(strategy.evaluate(m.name))
+        result1 = np.array(m.result(strategy))
+        assert np.equal(result0, result1).all()
+
     @pytest.mark.parametrize("MetricClass", params_metric)
     def test_metric_from_name(self, MetricClass):
         m = MetricClass()
         assert _metric_from_name(m.name).__class__ == m.__class__
 
+    def test_custom_metric(self):
+        """
+        Metric which only implements `result` is evaluated by strategy.
+        """
+        universe = make_randomwalk(seed=42)
+        strategy = RandomTrader(n_trades=10, seed=42).run(
+            universe, metrics=[NTrades()], verbose=False
+        )
+        assert strategy.metric_results == [10]
+        assert strategy.evaluate(NTrades()) == 10
+        assert strategy.evaluate([NTrades(), FinalWealth()])[0] == 10
+
+        result = null_distribution(
+            universe, n_runs=3, trader_kwargs={"n_trades": 5}, metrics=[NTrades()]
+        )
+        assert (result.null.n_trades == 5).all()
+
+        with pytest.raises(ValueError):
+            NTrades().result_from_wealth(np.ones(10))
+
+    def test_no_result(self):
+        class NoResult(Metric):
+            @property
+            def name(self):
+                return "no_result"
+
+        strategy = RandomTrader(seed=42).run(make_randomwalk(seed=42), verbose=False)
+        with pytest.raises(NotImplementedError):
+            NoResult().result(strategy)
+
     def test_metric_from_name_nonexistent(self):
         """
         `_metric_from_name` is supposed to raise ValueError
@@ -84,6 +165,147 @@ class TestBase:
             RandomTrader(seed=42).evaluate(m)
 
 
+class TestBatch:
+    """
+    Test metrics evaluated for a matrix of wealth.
+    """
+
+    params_metric = [
+        Return,
+        AverageReturn,
+        Drawdown,
+        MaxDrawdown,
+        Volatility,
+        SharpeRatio,
+    ]
+
+    @pytest.mark.parametrize("MetricClass", params_metric)
+    @pytest.mark.parametrize("rate", [True, False])
+    def test_batch(self, MetricClass, rate):
+        """
+        Result for a matrix is the stack of results for each row.
+        """
+        np.random.seed(42)
+        wealth = 100.0 + np.random.randn(5, 100).cumsum(axis=1)
+        m = MetricClass(rate=rate)
+        result = m.result_from_wealth(wealth)
+        expected = np.stack([m.result_from_wealth(row) for row in wealth])
+        assert result.shape == expected.shape
+        assert np.allclose(result, expected)
+
+    def test_max_underwater(self):
+        np.random.seed(42)
+        wealth = 100.0 + np.random.randn(5, 100).cumsum(axis=1)
+        result = MaxUnderwater().result_from_wealth(wealth)
+        expected = [MaxUnderwater().result_from_wealth(row) for row in wealth]
+        assert np.array_equal(result, expected)
+
+    def test_final_wealth(self):
+        wealth = np.arange(12, dtype=float).reshape(3, 4)
+        result = FinalWealth().result_from_wealth(wealth)
+        assert np.array_equal(result, [3.0, 7.0, 11.0])
+
+    def test_ndim(self):
+        with pytest.raises(ValueError):
+            FinalWealth().result_from_wealth(np.zeros((2, 3, 4)))
+
+
+class TestEvaluationContext:
+    """
+    Test `EvaluationContext`.
+    """
+
+    def test_wealth_once(self, monkeypatch):
+        """
+        Wealth is built only once for all metrics evaluated together.
+        """
+        strategy = RandomTrader(seed=42).run(make_randomwalk(seed=42))
+        n_calls = []
+        wealth = strategy.wealth
+
+        def count_wealth(self):
+            n_calls.append(1)
+            return wealth
+
+        monkeypatch.setattr(type(strategy), "wealth", property(count_wealth))
+        metrics = [
+            AverageReturn(),
+            FinalWealth(),
+            MaxDrawdown(),
+            Volatility(),
+            SharpeRatio(),
+        ]
+        strategy.evaluate(metrics)
+        assert len(n_calls) == 1
+
+    def test_from_wealth(self):
+        series_wealth = np.array([3, 1, 4, 1, 5, 9, 2], dtype=float)
+        context = EvaluationContext(wealth=series_wealth)
+        assert context.wealth is series_wealth
+        assert np.array_equal(context.cummax(), [3, 3, 4, 4, 5, 9, 9])
+        with pytest.raises(ValueError):
+            context.exposure()
+
+    def test_notrunerror(self):
+        with pytest.raises(NotRunError):
+            EvaluationContext(RandomTrader(seed=42))
+
+    def test_valueerror(self):
+        with pytest.raises(ValueError):
+            EvaluationContext()
+
+
+class TestBootstrap:
+    """
+    Test `Metric.bootstrap`.
+    """
+
+    @pytest.mark.parametrize("method", ["stationary", "block"])
+    @pytest.mark.parametrize("rate", [True, False])
+    def test_shape(self, method, rate):
+        strategy = RandomTrader(seed=42).run(make_randomwalk(), verbose=False)
+        strategy.budget = 10000.0
+        m = SharpeRatio(rate=rate)
+        results = m.bootstrap(strategy, n_samples=10, method=method, rate=rate)
+        assert results.shape == (10,)
+        assert np.isfinite(results).all()
+
+    @pytest.mark.parametrize("method", ["stationary", "block"])
+    def test_seed(self, method):
+        strategy = RandomTrader(seed=42).run(make_randomwalk(), verbose=False)
+        m = MaxDrawdown()
+        results0 = m.bootstrap(strategy, n_samples=10, method=method, seed=42)
+        results1 = m.bootstrap(strategy, n_samples=10, method=method, seed=42)
+        assert np.equal(results0, results1).all()
+
+    @pytest.mark.parametrize("MetricClass", [FinalWealth, Volatility])
+    @pytest.mark.parametrize("chunk_size", [1, 3, None])
+    def test_rotation(self, MetricClass, chunk_size):
+        """
+        Blocks as long as the series are rotations of the series,
+        which keep final wealth and volatility.
+        """
+        universe = make_randomwalk()
+        strategy = RandomTrader(seed=42).run(universe, verbose=False)
+        m = MetricClass()
+        results = m.bootstrap(
+            strategy,
+            n_samples=10,
+            block_size=universe.n_bars,
+            method="block",
+            chunk_size=chunk_size,
+        )
+        assert results.shape == (10,)
+        assert np.allclose(results, m.result(strategy))
+
+    def test_valueerror(self):
+        strategy = RandomTrader(seed=42).run(make_randomwalk(), verbose=False)
+        with pytest.raises(ValueError):
+            SharpeRatio().bootstrap(strategy, method="nonexistent")
+        with pytest.raises(ValueError):
+            SharpeRatio().bootstrap(strategy, block_size=0)
+
+
 class TestReturn:
     """
     Test if `Return` works as expected.
@@ -301,6 +523,65 @@ class TestMaxDrawdown:
         assert result == expected
 
 
+def _drawdown_episodes_loop(series_wealth):
+    episodes = []
+    peak = 0
+    for i in range(1, len(series_wealth)):
+        if series_wealth[i] >= series_wealth[peak]:
+            if peak != i - 1:
+                episodes.append((peak, i))
+            peak = i
+    if peak != len(series_wealth) - 1:
+        episodes.append((peak, -1))
+
+    records = []
+    for start, recovery in episodes:
+        stop = None if recovery == -1 else recovery
+        window = series_wealth[start + 1 : stop]
+        trough = start + 1 + np.argmin(window)
+        depth = series_wealth[trough] - series_wealth[start]
+        records.append((start, trough, recovery, depth, len(window)))
+    return pd.DataFrame(
+        records, columns=["start", "trough", "recovery", "depth", "duration"]
+    )
+
+
+class TestDrawdownEpisodes:
+    """
+    Test `Drawdown.episodes` and `MaxUnderwater`.
+    """
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_loop(self, seed):
+        strategy = RandomTrader(seed=seed).run(make_randomwalk(seed=seed))
+        result = Drawdown().episodes(strategy)
+        expected = _drawdown_episodes_loop(strategy.wealth.wealth)
+        assert len(result) > 0
+        assert np.array_equal(result.values, expected.values)
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_top(self, seed):
+        strategy = RandomTrader(seed=seed).run(make_randomwalk(seed=seed))
+        episodes = Drawdown().episodes(strategy)
+        result = Drawdown().episodes(strategy, top=3)
+        assert len(result) == min(3, len(episodes))
+        assert (np.diff(result.depth) >= 0).all()
+        assert result.depth.iloc[0] == MaxDrawdown().result(strategy)
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_max_underwater(self, seed):
+        strategy = RandomTrader(seed=seed).run(make_randomwalk(seed=seed))
+        result = MaxUnderwater().result(strategy)
+        expected = Drawdown().episodes(strategy).duration.max()
+        assert result == expected
+
+    def test_monotonous(self):
+        universe = Universe(pd.DataFrame({"A0": np.linspace(1.0, 2.0, 100)}))
+        strategy = DeterminedTrader([Trade("A0")]).run(universe)
+        assert len(Drawdown().episodes(strategy)) == 0
+        assert MaxUnderwater().result(strategy) == 0
+
+
 class TestVolatility:
     MetricClass = Volatility
 
@@ -424,3 +705,233 @@ class TestExposure:
             expected = [0, 2, 11, 26, 13, 18, 0]
 
         assert np.allclose(result, expected)
+
+    @pytest.mark.parametrize("level", ["asset", "order"])
+    def test_hand_offset(self, level):
+        universe = self.universe_hand
+        trade0 = Trade("A0", lot=2.0, open_bar=1, shut_bar=5)
+        trade1 = Trade("A0", lot=-1.0, open_bar=2, shut_bar=4)
+        strategy = DeterminedTrader([trade0, trade1]).run(universe)
+        result = Exposure(net=False, level=level).result(strategy)
+        if level == "asset":
+            # 0 2  8  2 10 18 0
+            # 0 0 -4 -1 -5  0 0
+            expected = [0, 2, 4, 1, 5, 18, 0]
+        else:
+            expected = [0, 2, 12, 3, 15, 18, 0]
+
+        assert np.allclose(result, expected)
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_tradewise(self, seed):
+        """
+        Test if exposure is equal to the sum of exposure of trades.
+        """
+        universe = make_randomwalk(seed=seed)
+        strategy = RandomTrader(seed=seed).run(universe, verbose=False)
+        net = sum(
+            trade.series_exposure(universe, net=True) for trade in strategy.trades
+        )
+        gross = sum(
+            trade.series_exposure(universe, net=False) for trade in strategy.trades
+        )
+        assert np.allclose(Exposure(net=True).result(strategy), net)
+        assert np.allclose(Exposure(net=False).result(strategy), gross)
+        asset_gross = Exposure(net=False, level="asset").result(strategy)
+        assert (asset_gross <= gross + 1e-8).all()
+
+    def test_invalid_level(self):
+        with pytest.raises(ValueError):
+            Exposure(level="trade")
+
+
+class TestRolling:
+    """
+    Test rolling metrics.
+    """
+
+    params_metric = [
+        (RollingAverageReturn, AverageReturn),
+        (RollingVolatility, Volatility),
+        (RollingSharpeRatio, SharpeRatio),
+        (RollingMaxDrawdown, MaxDrawdown),
+    ]
+
+    @pytest.mark.parametrize("RollingClass, MetricClass", params_metric)
+    @pytest.mark.parametrize("window", [2, 3, 10, 50, 100])
+    @pytest.mark.parametrize("rate", [True, False])
+    def test_slice(self, RollingClass, MetricClass, window, rate):
+        """
+        Rolling metric is the metric evaluated for each window.
+        """
+        np.random.seed(42)
+        series_wealth = 100.0 + np.random.randn(100).cumsum()
+        result = RollingClass(window=window, rate=rate)._result_from_wealth(
+            series_wealth
+        )
+        expected = np.full(series_wealth.size, np.nan)
+        for i in range(window - 1, series_wealth.size):
+            expected[i] = MetricClass(rate=rate)._result_from_wealth(
+                series_wealth[i - window + 1 : i + 1]
+            )
+        assert np.allclose(result, expected, equal_nan=True)
+
+    @pytest.mark.parametrize("RollingClass, MetricClass", params_metric)
+    def test_batch(self, RollingClass, MetricClass):
+        np.random.seed(42)
+        wealth = 100.0 + np.random.randn(3, 50).cumsum(axis=1)
+        m = RollingClass(window=7)
+        result = m.result_from_wealth(wealth)
+        expected = np.stack([m.result_from_wealth(row) for row in wealth])
+        assert np.allclose(result, expected, equal_nan=True)
+
+    def test_regimes(self):
+        """
+        A long high-volatility regime does not wipe out
+        a following low-volatility regime.
+        """
+        np.random.seed(42)
+        returns = np.concatenate(
+            [np.random.randn(1_000_000), 1e-3 * np.random.randn(200)]
+        )
+        series_wealth = 1000.0 + returns.cumsum()
+        window = 50
+        expected = np.array(
+            [
+                Volatility()._result_from_wealth(series_wealth[i - window + 1 : i + 1])
+                for i in range(series_wealth.size - 100, series_wealth.size)
+            ]
+        )
+        result = RollingVolatility(window=window)._result_from_wealth(series_wealth)
+        assert np.allclose(result[-100:], expected, rtol=1e-6)
+        assert (result[-100:] > 0.0).all()
+
+        sharpe = RollingSharpeRatio(window=window)._result_from_wealth(series_wealth)
+        assert (np.abs(sharpe[-100:]) < 10).all()
+
+    @pytest.mark.parametrize("RollingClass, MetricClass", params_metric)
+    def test_window_too_large(self, RollingClass, MetricClass):
+        result = RollingClass(window=10).result_from_wealth(np.arange(5.0))
+        assert np.isnan(result).all()
+
+    @pytest.mark.parametrize("RollingClass, MetricClass", params_metric)
+    def test_window_too_small(self, RollingClass, MetricClass):
+        with pytest.raises(ValueError):
+            RollingClass(window=1)
+
+    @pytest.mark.parametrize("RollingClass, MetricClass", params_metric)
+    def test_metric_from_name(self, RollingClass, MetricClass):
+        m = RollingClass(window=5)
+        assert _metric_from_name(m.name, window=5).__class__ == RollingClass
+
+
+class TestBenchmarkMetrics:
+    """
+    Test metrics relative to a benchmark.
+    """
+
+    params_metric = [Alpha, Beta, Correlation, InformationRatio, TrackingError]
+
+    @staticmethod
+    def get_wealth(seed):
+        np.random.seed(seed)
+        benchmark = 100.0 + np.random.randn(100).cumsum()
+        wealth = 100.0 + 0.5 * (benchmark - 100.0) + np.random.randn(100).cumsum()
+        return wealth, benchmark
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_numpy(self, seed):
+        wealth, benchmark = self.get_wealth(seed)
+        r, r_b = np.diff(wealth), np.diff(benchmark)
+        cov = np.cov(r, r_b, ddof=0)
+        beta = cov[0, 1] / cov[1, 1]
+        tracking_error = np.std(r - r_b)
+
+        assert np.isclose(Beta(benchmark).result_from_wealth(wealth), beta)
+        assert np.isclose(
+            Alpha(benchmark).result_from_wealth(wealth),
+            np.mean(r) - beta * np.mean(r_b),
+        )
+        assert np.isclose(
+            Correlation(benchmark).result_from_wealth(wealth),
+            np.corrcoef(r, r_b)[0, 1],
+        )
+        assert np.isclose(
+            TrackingError(benchmark).result_from_wealth(wealth), tracking_error
+        )
+        assert np.isclose(
+            InformationRatio(benchmark).result_from_wealth(wealth),
+            np.mean(r - r_b) / tracking_error,
+        )
+
+    @pytest.mark.parametrize("MetricClass", params_metric)
+    @pytest.mark.parametrize("rate", [True, False])
+    def test_batch(self, MetricClass, rate):
+        wealth, benchmark = self.get_wealth(42)
+        wealth = np.stack([wealth, 2 * wealth, wealth[::-1]])
+        m = MetricClass(benchmark, rate=rate)
+        result = m.result_from_wealth(wealth)
+        expected = np.stack([m.result_from_wealth(row) for row in wealth])
+        assert np.allclose(result, expected)
+
+    def test_run_once(self, monkeypatch):
+        n_runs = []
+        run = BuyAndHold.run
+
+        def counted(self, *args, **kwargs):
+            n_runs.append(self)
+            return run(self, *args, **kwargs)
+
+        monkeypatch.setattr(BuyAndHold, "run", counted)
+
+        universe = make_randomwalk(seed=42)
+        benchmark = BuyAndHold({"0": 1.0, "1": 1.0})
+        metrics = [MetricClass(benchmark) for MetricClass in self.params_metric]
+        for seed in range(3):
+            strategy = RandomTrader(seed=seed).run(universe, verbose=False)
+            strategy.evaluate(metrics)
+        assert len(n_runs) == 1
+
+        strategy = RandomTrader(seed=42).run(Universe(2 * universe.prices))
+        strategy.evaluate(metrics)
+        assert len(n_runs) == 2
+
+    def test_strategy(self):
+        universe = make_randomwalk(seed=42)
+        benchmark = BuyAndHold({"0": 1.0, "1": 1.0})
+        strategy = RandomTrader(seed=42).run(universe, verbose=False)
+        result = Beta(benchmark).result(strategy)
+        wealth = BuyAndHold({"0": 1.0, "1": 1.0}).run(universe).wealth.wealth
+        expected = Beta(wealth).result(strategy)
+        assert np.isclose(result, expected)
+        assert not benchmark.is_run
+
+    @pytest.mark.parametrize("MetricClass", params_metric)
+    def test_budget(self, MetricClass):
+        """
+        Benchmark is run with the budget of the evaluated strategy.
+        """
+        universe = make_randomwalk(seed=42)
+        benchmark = BuyAndHold({"0": 1.0, "1": 1.0})
+        strategy = RandomTrader(seed=42).run(universe, budget=100.0)
+        result = MetricClass(benchmark, rate=True).result(strategy)
+        wealth = 100.0 + BuyAndHold({"0": 1.0, "1": 1.0}).run(universe).wealth.wealth
+        expected = MetricClass(wealth, rate=True).result(strategy)
+        assert np.isfinite(result)
+        assert np.isclose(result, expected)
+
+    def test_universe_freed(self):
+        universe = make_randomwalk(seed=42)
+        metric = Beta(BuyAndHold({"0": 1.0, "1": 1.0}))
+        metric.result(RandomTrader(seed=42).run(universe, verbose=False))
+        ref = weakref.ref(universe)
+        del universe
+        gc.collect()
+        assert ref() is None
+
+    def test_valueerror(self):
+        wealth, benchmark = self.get_wealth(42)
+        with pytest.raises(ValueError):
+            Beta(benchmark[:-1]).result_from_wealth(wealth)
+        with pytest.raises(ValueError):
+            Beta(BuyAndHold({"0": 1.0})).result_from_wealth(wealth)
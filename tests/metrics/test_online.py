@@ -0,0 +1,85 @@
+import pytest
+
+import numpy as np
+
+from epymetheus.metrics import Drawdown
+from epymetheus.metrics import FinalWealth
+from epymetheus.metrics import MaxDrawdown
+from epymetheus.metrics import SharpeRatio
+from epymetheus.metrics import Volatility
+from epymetheus.metrics import OnlineDrawdown
+from epymetheus.metrics import OnlineFinalWealth
+from epymetheus.metrics import OnlineMaxDrawdown
+from epymetheus.metrics import OnlineSharpeRatio
+from epymetheus.metrics import OnlineVolatility
+
+
+def _expected(OnlineClass, params, series_wealth):
+    metric = {
+        OnlineFinalWealth: FinalWealth,
+        OnlineVolatility: Volatility,
+        OnlineSharpeRatio: SharpeRatio,
+        OnlineMaxDrawdown: MaxDrawdown,
+    }
+    if OnlineClass is OnlineDrawdown:
+        return Drawdown(**params)._result_from_wealth(series_wealth)[-1]
+    return metric[OnlineClass](**params)._result_from_wealth(series_wealth)
+
+
+params_metric = [
+    (OnlineFinalWealth, {}),
+    (OnlineVolatility, {"rate": False}),
+    (OnlineVolatility, {"rate": True, "n": 250, "ddof": 1}),
+    (OnlineSharpeRatio, {"rate": False}),
+    (OnlineSharpeRatio, {"rate": True, "n": 250, "risk_free_return": 0.01}),
+    (OnlineDrawdown, {"rate": False}),
+    (OnlineDrawdown, {"rate": True}),
+    (OnlineMaxDrawdown, {"rate": False}),
+    (OnlineMaxDrawdown, {"rate": True}),
+]
+
+
+def _series_wealth(seed):
+    np.random.seed(seed)
+    return 100.0 + np.random.randn(200).cumsum()
+
+
+@pytest.mark.parametrize("OnlineClass, params", params_metric)
+@pytest.mark.parametrize("seed", range(3))
+def test_bar_by_bar(OnlineClass, params, seed):
+    series_wealth = _series_wealth(seed)
+    m = OnlineClass(**params)
+    for wealth in series_wealth:
+        m.update(wealth)
+    assert m.n_bars == series_wealth.size
+    assert np.isclose(m.result(), _expected(OnlineClass, params, series_wealth))
+
+
+@pytest.mark.parametrize("OnlineClass, params", params_metric)
+@pytest.mark.parametrize("seed", range(3))
+def test_chunks(OnlineClass, params, seed):
+    series_wealth = _series_wealth(seed)
+    m = OnlineClass(**params)
+    for chunk in np.array_split(series_wealth, 7):
+        m.update(chunk)
+    assert np.isclose(m.result(), _expected(OnlineClass, params, series_wealth))
+
+
+@pytest.mark.parametrize("OnlineClass, params", params_metric)
+@pytest.mark.parametrize("seed", range(3))
+def test_merge(OnlineClass, params, seed):
+    series_wealth = _series_wealth(seed)
+    shards = [
+        OnlineClass(**params).update(chunk)
+        for chunk in np.array_split(series_wealth, 5)
+    ]
+    m = OnlineClass(**params)
+    for shard in shards:
+        m.merge(shard)
+    assert m.n_bars == series_wealth.size
+    assert np.isclose(m.result(), _expected(OnlineClass, params, series_wealth))
+
+
+def test_merge_different_class():
+    with pytest.raises(ValueError):
+        OnlineVolatility().merge(OnlineMaxDrawdown())
@@ -1,11 +1,19 @@
 import pytest
 
+import numpy as np
 import pandas as pd
 
-from epymetheus import Trade, Universe, Strategy
+from epymetheus import Trade, Universe, Strategy, Wealth
 from epymetheus.benchmarks import DeterminedTrader
+from epymetheus.benchmarks import RandomTrader
 from epymetheus.datasets import make_randomwalk
 from epymetheus.exceptions import NoTradeError
+from epymetheus.metrics import Drawdown
+from epymetheus.metrics import Exposure
+from epymetheus.metrics import FinalWealth
+from epymetheus.metrics import MaxDrawdown
+from epymetheus.metrics import SharpeRatio
+from epymetheus.metrics import _metric_from_name
 
 
 class HardCodedStrategy(Strategy):
@@ -95,5 +103,134 @@ class TestCompile:
     pass  # TODO
 
 
+class TestRunMetrics:
+    """
+    Test metrics evaluated in `Strategy.run()`.
+    """
+
+    metrics = [
+        FinalWealth(),
+        MaxDrawdown(rate=True),
+        SharpeRatio(rate=True, n=250),
+        Exposure(),
+        "volatility",
+    ]
+
+    @pytest.mark.parametrize("verbose", [True, False])
+    @pytest.mark.parametrize("seed", range(3))
+    def test_metric_results(self, verbose, seed):
+        """
+        `metric_results` are the same with the values evaluated after running.
+        """
+        strategy = RandomTrader(seed=seed).run(
+            make_randomwalk(seed=seed),
+            metrics=self.metrics,
+            budget=10000.0,
+            verbose=verbose,
+        )
+        expected = [
+            _metric_from_name(m).result(strategy)
+            if isinstance(m, str)
+            else m.result(strategy)
+            for m in self.metrics
+        ]
+        assert len(strategy.metric_results) == len(self.metrics)
+        for result, value in zip(strategy.metric_results, expected):
+            assert np.allclose(result, value)
+
+    def test_no_metrics(self):
+        strategy = RandomTrader(seed=42).run(make_randomwalk(seed=42))
+        assert strategy.metric_results == []
+
+
 class TestEvaluate:
-    pass  # TODO
+    """
+    Test `Strategy.evaluate()`.
+    """
+
+    @staticmethod
+    def count_calls(monkeypatch, MetricClass):
+        calls = []
+        result_from_context = MetricClass._result_from_context
+
+        def counted(self, context):
+            calls.append(self)
+            return result_from_context(self, context)
+
+        monkeypatch.setattr(MetricClass, "_result_from_context", counted)
+        return calls
+
+    def test_cache(self, monkeypatch):
+        calls = self.count_calls(monkeypatch, SharpeRatio)
+        strategy = RandomTrader(seed=42).run(make_randomwalk(seed=42))
+        result0 = strategy.evaluate(SharpeRatio(n=250))
+        result1 = strategy.evaluate(SharpeRatio(n=250))
+        assert result0 == result1
+        assert len(calls) == 1
+
+    def test_cache_name(self, monkeypatch):
+        calls = self.count_calls(monkeypatch, SharpeRatio)
+        strategy = RandomTrader(seed=42).run(make_randomwalk(seed=42))
+        strategy.evaluate("sharpe_ratio")
+        strategy.evaluate(SharpeRatio())
+        assert len(calls) == 1
+
+    def test_cache_run_metrics(self, monkeypatch):
+        calls = self.count_calls(monkeypatch, SharpeRatio)
+        strategy = RandomTrader(seed=42).run(
+            make_randomwalk(seed=42), metrics=[SharpeRatio()]
+        )
+        strategy.evaluate(SharpeRatio())
+        assert len(calls) == 1
+
+    def test_wealth_shared(self, monkeypatch):
+        """
+        Wealth is computed once for a run and reused by later metrics.
+        """
+        calls = []
+        from_strategy = Wealth.from_strategy.__func__
+
+        def counted(cls, strategy):
+            calls.append(strategy)
+            return from_strategy(cls, strategy)
+
+        monkeypatch.setattr(Wealth, "from_strategy", classmethod(counted))
+        strategy = RandomTrader(seed=42).run(
+            make_randomwalk(seed=42), metrics=["final_wealth"]
+        )
+        strategy.evaluate(SharpeRatio())
+        assert strategy.wealth is strategy.wealth
+        assert strategy.metric_results[0] == strategy.wealth.wealth[-1]
+        assert len(calls) == 1
+
+    @pytest.mark.parametrize("metric", [Drawdown(), Exposure()])
+    def test_cache_copy(self, metric):
+        strategy = RandomTrader(seed=42).run(
+            make_randomwalk(seed=42), metrics=[metric], verbose=False
+        )
+        expected = strategy.evaluate(metric).copy()
+        strategy.metric_results[0][:] = 123.0
+        strategy.evaluate(metric)[:] = 123.0
+        assert np.array_equal(strategy.evaluate(metric), expected)
+
+    def test_cache_params(self, monkeypatch):
+        calls = self.count_calls(monkeypatch, SharpeRatio)
+        strategy = RandomTrader(seed=42).run(make_randomwalk(seed=42))
+        result0 = strategy.evaluate(SharpeRatio(n=1))
+        result1 = strategy.evaluate(SharpeRatio(n=250))
+        assert len(calls) == 2
+        assert np.isclose(result1, np.sqrt(250) * result0)
+
+    def test_cache_rerun(self):
+        universe = make_randomwalk(seed=42)
+        strategy = RandomTrader(seed=42)
+        result0 = strategy.run(universe).evaluate(FinalWealth())
+        result1 = strategy.run(Universe(2 * universe.prices)).evaluate(FinalWealth())
+        assert np.isclose(result1, 2 * result0)
+
+    def test_cache_budget(self):
+        strategy = RandomTrader(seed=42).run(make_randomwalk(seed=42))
+        result0 = strategy.evaluate(FinalWealth())
+        strategy.budget = 100.0
+        result1 = strategy.evaluate(FinalWealth())
+        assert result1 == result0 + 100.0
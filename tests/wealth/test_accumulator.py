@@ -0,0 +1,63 @@
+import pytest
+
+import numpy as np
+
+from epymetheus import Trade
+from epymetheus import Wealth
+from epymetheus.benchmarks import RandomTrader
+from epymetheus.datasets import make_randomwalk
+from epymetheus.wealth import WealthAccumulator
+
+
+def _get_strategy(seed):
+    universe = make_randomwalk(seed=seed)
+    return RandomTrader(seed=seed).run(universe, verbose=False)
+
+
+class TestWealthAccumulator:
+    @pytest.mark.parametrize("seed", range(3))
+    def test_one_by_one(self, seed):
+        """
+        Adding trades one by one is the same as adding them at once.
+        """
+        strategy = _get_strategy(seed)
+        accumulator = WealthAccumulator(strategy.universe)
+        for trade in strategy.trades:
+            accumulator.add(trade)
+        assert accumulator.n_trades == strategy.n_trades
+        assert np.allclose(accumulator.wealth, Wealth(strategy).wealth)
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_remove(self, seed):
+        """
+        Removing a trade is the same as not adding it.
+        """
+        strategy = _get_strategy(seed)
+        trades = strategy.trades
+        accumulator = WealthAccumulator(strategy.universe).add(trades)
+        accumulator.remove(trades[0]).remove(trades[1:3])
+        expected = WealthAccumulator(strategy.universe).add(trades[3:]).wealth
+        assert accumulator.n_trades == len(trades) - 3
+        assert np.allclose(accumulator.wealth, expected)
+
+    def test_empty(self):
+        strategy = _get_strategy(42)
+        accumulator = WealthAccumulator(strategy.universe).add([])
+        assert np.array_equal(accumulator.wealth, np.zeros(strategy.universe.n_bars))
+
+    def test_to_wealth(self):
+        strategy = _get_strategy(42)
+        accumulator = WealthAccumulator(strategy.universe).add(strategy.trades)
+        wealth = accumulator.to_wealth()
+        assert isinstance(wealth, Wealth)
+        assert np.array_equal(wealth.wealth, Wealth(strategy).wealth)
+        assert np.array_equal(wealth.bars, Wealth(strategy).bars)
+
+        accumulator.remove(strategy.trades[0])
+        assert np.array_equal(wealth.wealth, Wealth(strategy).wealth)
+
+    def test_not_executed(self):
+        universe = make_randomwalk(seed=42)
+        trade = Trade("0", open_bar=1, shut_bar=3)
+        with pytest.raises(ValueError):
+            WealthAccumulator(universe).add(trade)
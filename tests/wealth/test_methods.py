@@ -0,0 +1,143 @@
+import sys
+import tracemalloc
+
+import pytest
+
+import numpy as np
+import pandas as pd
+
+from epymetheus import Trade
+from epymetheus import Universe
+from epymetheus import Wealth
+from epymetheus.benchmarks import DeterminedTrader
+from epymetheus.benchmarks import RandomTrader
+from epymetheus.datasets import make_randomwalk
+from epymetheus.wealth.wealth import _get_increment
+from epymetheus.wealth.wealth import _get_orders
+from epymetheus.wealth.wealth import _get_total_increment
+
+
+def _make_strategy(seed):
+    universe = make_randomwalk(seed=seed)
+    trades = RandomTrader(seed=seed).run(universe, verbose=False).trades
+    trades = [
+        Trade(
+            asset=trade.asset,
+            lot=trade.lot,
+            open_bar=trade.open_bar,
+            shut_bar=trade.shut_bar,
+            take=take,
+            stop=stop,
+        )
+        for trade, take, stop in zip(trades, [None, 1.0, 5.0] * 100, [-1.0, None] * 100)
+    ]
+    return DeterminedTrader(trades).run(universe, verbose=False)
+
+
+class TestWealth:
+    @pytest.mark.parametrize("seed", range(3))
+    def test_sum_of_trades(self, seed):
+        """
+        Wealth is the sum of profit-loss of each trade.
+        """
+        strategy = _make_strategy(seed)
+        result = Wealth(strategy).wealth
+        expected = sum(trade.series_pnl(strategy.universe) for trade in strategy.trades)
+        assert np.allclose(result, expected)
+
+    @pytest.mark.parametrize("seed", range(3))
+    @pytest.mark.parametrize("n_trades", [2, 1000])
+    def test_total_increment(self, seed, n_trades):
+        """
+        Enumerating windows and scattering lots give the same increment.
+        """
+        strategy = _make_strategy(seed)
+        universe = strategy.universe
+        orders = _get_orders(universe, strategy.trades[:n_trades])
+        expected = _get_increment(universe, orders).sum(axis=1)
+        assert np.allclose(_get_total_increment(universe, orders), expected)
+
+    def test_wide_universe(self):
+        """
+        A few trades in a wide universe do not allocate (n_bars, n_assets) arrays.
+        """
+        n_bars, n_assets = 2000, 2000
+        universe = Universe(
+            pd.DataFrame(np.ones((n_bars, n_assets)), columns=map(str, range(n_assets)))
+        )
+        trades = [
+            Trade(str(i), lot=1.0, open_bar=10 * i, shut_bar=10 * i + 5)
+            for i in range(20)
+        ]
+        strategy = DeterminedTrader(trades).run(universe, verbose=False)
+
+        tracemalloc.start()
+        Wealth(strategy)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert peak < n_bars * n_assets * 8 / 10
+
+
+class TestByAsset:
+    @pytest.mark.parametrize("seed", range(3))
+    def test_sum(self, seed):
+        wealth = Wealth(_make_strategy(seed))
+        assert np.allclose(wealth.by_asset().sum(axis=1), wealth.wealth)
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_asset(self, seed):
+        """
+        Each column is the profit-loss of the orders of the asset.
+        """
+        strategy = _make_strategy(seed)
+        result = Wealth(strategy).by_asset()
+        for j, asset in enumerate(strategy.universe.assets):
+            expected = np.zeros(strategy.universe.n_bars)
+            for trade in strategy.trades:
+                is_asset = trade.array_asset == asset
+                expected += trade.array_pnl(strategy.universe)[:, is_asset].sum(axis=1)
+            assert np.allclose(result[:, j], expected)
+
+    @pytest.mark.parametrize("assets", [["3"], ["5", "1"]])
+    def test_subset(self, assets):
+        strategy = _make_strategy(42)
+        wealth = Wealth(strategy)
+        index = strategy.universe.get_asset_indexer(assets)
+        assert np.allclose(wealth.by_asset(assets), wealth.by_asset()[:, index])
+
+    def test_not_from_strategy(self):
+        wealth = Wealth(bars=np.arange(3), wealth=np.zeros(3))
+        with pytest.raises(ValueError):
+            wealth.by_asset()
+
+
+class TestContributions:
+    @pytest.mark.parametrize("seed", range(3))
+    def test_trade(self, seed):
+        """
+        Each row accumulates to the profit-loss of the trade.
+        """
+        pytest.importorskip("scipy")
+        strategy = _make_strategy(seed)
+        result = np.cumsum(Wealth(strategy).contributions().toarray(), axis=1)
+        for i, trade in enumerate(strategy.trades):
+            assert np.allclose(result[i], trade.series_pnl(strategy.universe))
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_total(self, seed):
+        pytest.importorskip("scipy")
+        wealth = Wealth(_make_strategy(seed))
+        contributions = wealth.contributions()
+        weight = np.ones(contributions.shape[0])
+        assert np.allclose(np.cumsum(weight @ contributions), wealth.wealth)
+
+    def test_cached(self):
+        pytest.importorskip("scipy")
+        wealth = Wealth(_make_strategy(42))
+        assert wealth.contributions() is wealth.contributions()
+
+    def test_no_scipy(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "scipy.sparse", None)
+        wealth = Wealth(_make_strategy(42))
+        with pytest.raises(ImportError, match="epymetheus\\[sparse\\]"):
+            wealth.contributions()
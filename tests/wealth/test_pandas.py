@@ -78,3 +78,58 @@ def test_dataframe_value():
     df_wealth = wealth.to_dataframe()
 
     assert array_equal(df_wealth["wealth"].values, wealth.wealth)
+
+
+@pytest.mark.parametrize("rule", ["D", "W", "M", "6H", "2D", "2W", "2M"])
+@pytest.mark.parametrize("how", ["last", "first", "max", "min"])
+def test_resample(rule, how):
+    """
+    Test if `Wealth.resample` is consistent with `pandas.Series.resample`.
+    """
+    universe = make_randomwalk(
+        n_bars=2000, bars=list(pd.date_range("2000-01-01", periods=2000, freq="H"))
+    )
+    strategy = RandomTrader(seed=42).run(universe)
+    wealth = Wealth(strategy)
+    result = wealth.resample(rule, how=how)
+    expected = getattr(wealth.to_series().resample(rule), how)()
+
+    assert np.array_equal(result.wealth, expected.values)
+    assert wealth.resample(rule, how=how) is result
+
+
+@pytest.mark.parametrize("rule", ["5min", "15min"])
+@pytest.mark.parametrize("how", ["last", "first", "max", "min"])
+def test_resample_minutes(rule, how):
+    bars = pd.date_range("2000-01-01 09:00", periods=60, freq="min")
+    wealth = Wealth(bars=bars, wealth=np.random.RandomState(42).randn(60).cumsum())
+    result = wealth.resample(rule, how=how)
+    expected = getattr(wealth.to_series().resample(rule), how)()
+
+    assert np.array_equal(result.wealth, expected.values)
+    assert len(result.wealth) == 60 // int(rule[:-3])
+
+
+def test_resample_int():
+    universe = make_randomwalk(n_bars=1000)
+    strategy = RandomTrader(seed=42).run(universe)
+    wealth = Wealth(strategy)
+    result = wealth.resample(7)
+
+    assert np.array_equal(result.wealth, wealth.wealth[np.r_[6:1000:7, 999]])
+    assert np.array_equal(result.bars, wealth.bars[np.r_[6:1000:7, 999]])
+
+
+@pytest.mark.parametrize("n_points", [10, 100, 2000])
+def test_decimate(n_points):
+    universe = make_randomwalk(n_bars=1000)
+    strategy = RandomTrader(seed=42).run(universe)
+    wealth = Wealth(strategy)
+    result = wealth.decimate(n_points)
+
+    assert len(result.wealth) <= n_points + 2
+    assert result.wealth.max() == wealth.wealth.max()
+    assert result.wealth.min() == wealth.wealth.min()
+    assert result.wealth[0] == wealth.wealth[0]
+    assert result.wealth[-1] == wealth.wealth[-1]
+    assert np.array_equal(result.wealth, wealth.to_series()[result.bars].values)